@@ -0,0 +1,42 @@
+"""Benchmark the batch range and split functions against the scalar ones."""
+
+import random
+import timeit
+
+from function_test_fixtures import batch, utils
+
+N = 100_000
+
+
+def main() -> None:
+    """Print the time to process N ranges with each approach."""
+    starts = [random.randrange(0, 50) for _ in range(N)]
+    stops = [s + random.randrange(0, 200) for s in starts]
+
+    cases = {
+        "test_range scalar": lambda: [
+            utils.test_range(a, b) for a, b in zip(starts, stops)
+        ],
+        "test_range batch (lists)": lambda: batch.test_range_batch(starts, stops),
+        "split_int scalar": lambda: [utils.split_int(n) for n in stops],
+        "split_int batch (lists)": lambda: batch.split_int_batch(stops),
+    }
+
+    np = batch._numpy()
+    if np is None:
+        print("numpy not installed, batch functions use the pure Python fallback")
+    else:
+        start_arr = np.asarray(starts)
+        stop_arr = np.asarray(stops)
+        cases["test_range batch (arrays)"] = lambda: batch.test_range_batch(
+            start_arr, stop_arr
+        )
+        cases["split_int batch (arrays)"] = lambda: batch.split_int_batch(stop_arr)
+
+    for name, f in cases.items():
+        t = min(timeit.repeat(f, number=1, repeat=5))
+        print(f"{name:<28} {t * 1e3:8.1f}ms for {N} calls")
+
+
+if __name__ == "__main__":
+    main()
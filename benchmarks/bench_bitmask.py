@@ -0,0 +1,37 @@
+"""Benchmark optional keyword only placement with bitmasks against sets."""
+
+import random
+import timeit
+
+from function_test_fixtures import utils
+
+
+def set_placement(n: int, k: int) -> list[bool]:
+    """The set based placement used before bitmasks."""
+    optional_idx = set(random.sample(range(n), k=k))
+    return [i in optional_idx for i in range(n)]
+
+
+def mask_placement(n: int, k: int) -> int:
+    """Bitmask based placement."""
+    return utils.random_bitmask(n, k)
+
+
+def main() -> None:
+    """Print the mean time per call for each placement strategy."""
+    number = 200
+    for n in (1_000, 10_000, 100_000):
+        for k in (n // 100, n // 10, n // 3, n // 2, n - n // 10):
+            if n == 100_000:
+                number = 10
+            set_t = timeit.timeit(lambda: set_placement(n, k), number=number)
+            mask_t = timeit.timeit(lambda: mask_placement(n, k), number=number)
+            print(
+                f"n={n:<7} k={k:<7} "
+                f"set={set_t / number * 1e6:10.1f}us "
+                f"mask={mask_t / number * 1e6:10.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
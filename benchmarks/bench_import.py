@@ -0,0 +1,98 @@
+"""
+Regression check for the import time of the package.
+
+Runs `python -X importtime` in fresh interpreters, reports the cumulative
+import time of the package and of each submodule, and exits with a non-zero
+status if importing the package pulls in a submodule or goes over budget.
+"""
+
+import os
+import subprocess
+import sys
+
+PACKAGE = "function_test_fixtures"
+SUBMODULES = (
+    "constants_and_types",
+    "utils",
+    "combinatorics",
+    "batch",
+    "arguments",
+    "parameter_stats",
+    "parameter_ranges",
+    "signature_gen",
+    "stubs",
+    "cases",
+    "registry",
+    "scanner",
+    "distributions",
+    "serialize",
+    "cli",
+    "stream",
+    "scheduling",
+    "replay",
+    "differential",
+    "monitoring",
+    "fuzzing",
+    "ordering",
+    "budget",
+    "checkpoint",
+)
+# budget for `import function_test_fixtures` alone, in microseconds
+PACKAGE_BUDGET_US = 5000
+RUNS = 5
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """Return cumulative import times in microseconds keyed by module name."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+def best_import_times(statement: str) -> dict[str, int]:
+    """Return the fastest cumulative time seen for each module over RUNS runs."""
+    best: dict[str, int] = {}
+    for _ in range(RUNS):
+        for name, t in import_times(statement).items():
+            best[name] = min(t, best.get(name, t))
+    return best
+
+
+def main() -> None:
+    """Report import times and fail on a regression."""
+    failed = False
+
+    times = best_import_times(f"import {PACKAGE}")
+    package_us = times[PACKAGE]
+    print(f"{PACKAGE:<45} {package_us:>8}us (budget {PACKAGE_BUDGET_US}us)")
+
+    eager = sorted(n for n in times if n.startswith(f"{PACKAGE}."))
+    if eager:
+        print(f"FAIL: importing {PACKAGE} imported {', '.join(eager)}")
+        failed = True
+    if package_us > PACKAGE_BUDGET_US:
+        print(f"FAIL: importing {PACKAGE} is over budget")
+        failed = True
+
+    for submodule in SUBMODULES:
+        name = f"{PACKAGE}.{submodule}"
+        t = best_import_times(f"import {name}")[name]
+        print(f"{name:<45} {t:>8}us")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark time to first failure with farthest first case ordering."""
+
+import statistics
+import time
+from typing import Callable, Iterable
+
+from function_test_fixtures.arguments import TestCaseContainer
+from function_test_fixtures.cases import CaseCoordinates, case_coordinates
+from function_test_fixtures.ordering import farthest_first
+from function_test_fixtures.stream import FixtureStream
+
+# seeded bugs: each makes a checker wrongly fail cases with these coordinates
+BUGS: dict[str, Callable[[CaseCoordinates], bool]] = {
+    "both extras": lambda c: c.pe > 0 and c.ke > 0,
+    "mixed positional/keyword split": lambda c: c.as_pos > 0 and c.as_kw > 1,
+    "keyword only with extra keyword": lambda c: c.ko > 1 and c.ke > 0,
+    "many positional only": lambda c: c.po > 3,
+}
+
+
+def first_failure(
+    cases: Iterable[TestCaseContainer],
+    bug: Callable[[CaseCoordinates], bool]
+) -> tuple[int, float] | None:
+    """Return the cases run and seconds taken until `bug` fires, if it does."""
+    start = time.perf_counter()
+    for n, case in enumerate(cases, 1):
+        if bug(case_coordinates(case)):
+            return n, time.perf_counter() - start
+    return None
+
+
+def main() -> None:
+    """Print the median cases and time to first failure for each ordering."""
+    stream = FixtureStream(0, positional_only=(3, 6), keyword_only=(3, 6))
+    orderings: dict[str, Callable[[Iterable[TestCaseContainer]], Iterable[TestCaseContainer]]] = {
+        "default": lambda cases: cases,
+        "farthest first, window 16": lambda cases: farthest_first(cases, window=16),
+        "farthest first, window 64": lambda cases: farthest_first(cases, window=64),
+        "farthest first, window 256": lambda cases: farthest_first(cases, window=256),
+    }
+
+    for name, bug in BUGS.items():
+        print(name)
+        for label, order in orderings.items():
+            results = [
+                result
+                for index, skeleton in enumerate(stream)
+                if (result := first_failure(
+                    order(stream.test_cases(index, skeleton)), bug
+                )) is not None
+            ]
+            cases = statistics.median(n for n, _ in results)
+            seconds = statistics.median(t for _, t in results)
+            print(f"  {label:28} {cases:8.1f} cases {seconds * 1e6:10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark stamping out stub functions from skeletons."""
+
+import timeit
+
+from function_test_fixtures.signature_gen import (
+    build_skeleton_signatures,
+    skeleton_shape
+)
+from function_test_fixtures.stubs import _stub_source, compile_stub
+
+
+def exec_stub(skeleton: tuple) -> object:
+    """Build a stub by running `exec` every time, without the code cache."""
+    namespace: dict = {}
+    exec(_stub_source(skeleton_shape(skeleton))[0], namespace)
+    return namespace['stub']
+
+
+def main() -> None:
+    """Print the time per stub with and without the code cache."""
+    skeletons = list(build_skeleton_signatures(
+        positional_only=(3, 20),
+        positional_or_keyword=(3, 20),
+        keyword_only=(3, 20)
+    ))
+    number = 20
+
+    exec_t = timeit.timeit(lambda: [exec_stub(s) for s in skeletons], number=number)
+    cached_t = timeit.timeit(
+        lambda: [compile_stub(s) for s in skeletons],
+        number=number
+    )
+    rle_skeletons = list(build_skeleton_signatures(
+        positional_only=(3, 20),
+        positional_or_keyword=(3, 20),
+        keyword_only=(3, 20),
+        rle=True
+    ))
+    rle_t = timeit.timeit(
+        lambda: [compile_stub(s) for s in rle_skeletons],
+        number=number
+    )
+
+    count = number * len(skeletons)
+    print(f"exec per stub         {exec_t / count * 1e6:8.1f}us")
+    print(f"cached code (tuples)  {cached_t / count * 1e6:8.1f}us")
+    print(f"cached code (rle)     {rle_t / count * 1e6:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Functions for generating fixtures for testing functions.
+
+The public API is loaded lazily (PEP 562): importing the package only runs
+this module and each submodule is imported the first time one of its names
+is accessed. Keep this module free of imports beyond `importlib`.
+"""
+
+import importlib
+
+
+# map each public name to the submodule that defines it
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    'ParameterKind': 'constants_and_types',
+    'POSITIONAL_ONLY': 'constants_and_types',
+    'POSITIONAL_OR_KEYWORD': 'constants_and_types',
+    'VAR_POSITIONAL': 'constants_and_types',
+    'KEYWORD_ONLY': 'constants_and_types',
+    'VAR_KEYWORD': 'constants_and_types',
+
+    'ParameterFlag': 'signature_gen',
+    'ALL_FLAGS': 'signature_gen',
+    'ProtoParameter': 'signature_gen',
+    'ProtoParameterWithDefault': 'signature_gen',
+    'ProtoParameterWithoutDefault': 'signature_gen',
+    'ParameterRun': 'signature_gen',
+    'MaskedParameterRun': 'signature_gen',
+    'RLESkeleton': 'signature_gen',
+    'SkeletonInterner': 'signature_gen',
+    'is_optional': 'signature_gen',
+    'make_proto_parameter': 'signature_gen',
+    'build_skeleton_signatures': 'signature_gen',
+    'skeleton_count': 'signature_gen',
+    'skeleton_from_shape': 'signature_gen',
+    'flag_permutations': 'signature_gen',
+
+    'skeleton_shape': 'signature_gen',
+    'make_signature': 'signature_gen',
+    'SignatureView': 'signature_gen',
+
+    'compile_stub': 'stubs',
+
+    'ParameterStats': 'parameter_stats',
+    'SplitMove': 'parameter_stats',
+    'SplitDelta': 'parameter_stats',
+
+    'ParameterRanges': 'parameter_ranges',
+
+    'generate_test_cases': 'cases',
+    'CaseCoordinates': 'cases',
+    'make_test_case': 'cases',
+    'case_coordinates': 'cases',
+
+    'farthest_first': 'ordering',
+
+    'Deadline': 'budget',
+    'budgeted_skeletons': 'budget',
+    'budgeted_test_cases': 'budget',
+
+    'Checkpoint': 'checkpoint',
+    'CheckpointedIterator': 'checkpoint',
+    'checkpointed_skeletons': 'checkpoint',
+    'checkpointed_test_cases': 'checkpoint',
+
+    'DecisionLog': 'replay',
+    'DecisionLogWriter': 'replay',
+
+    'compare_callables': 'differential',
+    'DifferentialReport': 'differential',
+
+    'CoverageCollector': 'monitoring',
+
+    'fuzz': 'fuzzing',
+    'CorpusDirectory': 'fuzzing',
+
+    'ShapeRegistry': 'registry',
+
+    'FixtureStream': 'stream',
+
+    'CostModel': 'scheduling',
+    'Schedule': 'scheduling',
+    'schedule': 'scheduling',
+    'list_schedule': 'scheduling',
+
+    'AliasSampler': 'distributions',
+    'CountDistribution': 'distributions',
+    'CorpusDistribution': 'distributions',
+
+    'JSONLEncoder': 'serialize',
+    'BinaryEncoder': 'serialize',
+    'read_jsonl': 'serialize',
+    'read_binary': 'serialize',
+
+    'ScannedFunction': 'scanner',
+    'scan_paths': 'scanner',
+
+    'TestCaseContainer': 'arguments',
+    'TestPositional': 'arguments',
+    'TestKeyword': 'arguments',
+    'TestPositionalOrKeyword': 'arguments',
+    'TestPositionalExtra': 'arguments',
+    'TestKeywordExtra': 'arguments',
+}
+
+_SUBMODULES: frozenset[str] = frozenset({
+    'arguments',
+    'batch',
+    'budget',
+    'cases',
+    'checkpoint',
+    'cli',
+    'combinatorics',
+    'constants_and_types',
+    'differential',
+    'distributions',
+    'fuzzing',
+    'monitoring',
+    'ordering',
+    'parameter_ranges',
+    'parameter_stats',
+    'registry',
+    'replay',
+    'scanner',
+    'scheduling',
+    'serialize',
+    'signature_gen',
+    'stream',
+    'stubs',
+    'utils',
+})
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> object:
+    """Import the submodule defining `name` and cache the attribute."""
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded names in `dir()`."""
+    return sorted(set(globals()) | _LAZY_ATTRIBUTES.keys() | _SUBMODULES)
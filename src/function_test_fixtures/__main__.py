@@ -0,0 +1,8 @@
+"""Run the command line interface, see `cli`."""
+
+import sys
+
+from .cli import main
+
+
+sys.exit(main())
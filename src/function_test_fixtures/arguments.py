@@ -1,7 +1,11 @@
 import abc
 import dataclasses
-import random
-from typing import Self, ClassVar, Iterator, Iterable
+import math
+from typing import Self, ClassVar, Iterator, Iterable, TYPE_CHECKING
+from . import combinatorics
+
+if TYPE_CHECKING:
+    from .parameter_stats import ParameterStats
 
 
 class ArgumentBase(abc.ABC):
@@ -145,20 +149,78 @@ class TestCaseContainer:
         )
 
     def shuffled_keyword_arguments(self: Self) -> list[ArgumentBase]:
-        n = len(self.keyword_arguments)
-        return random.sample(self.keyword_arguments, k=n)
+        permutation = combinatorics.random_permutation(len(self.keyword_arguments))
+        return [self.keyword_arguments[i] for i in permutation]
+
+    def keyword_ordering_count(self: Self) -> int:
+        """Return the number of distinct orderings of the keyword arguments."""
+        return math.factorial(len(self.keyword_arguments))
+
+    def ordered_keyword_arguments(self: Self, rank: int, /) -> tuple[ArgumentBase,...]:
+        """Return the keyword arguments in the ordering with the given rank."""
+        permutation = combinatorics.unrank_permutation(
+            rank,
+            len(self.keyword_arguments)
+        )
+        return tuple(self.keyword_arguments[i] for i in permutation)
+
+    def iter_keyword_orderings(
+        self: Self,
+        count: int | None = None
+    ) -> Iterator[tuple[ArgumentBase,...]]:
+        """
+        Yield distinct orderings of the keyword arguments.
+
+        If `count` is None every ordering is yielded in rank order, otherwise
+        `count` orderings are sampled without replacement.
+        """
+        ranks: Iterable[int]
+        if count is None:
+            ranks = range(self.keyword_ordering_count())
+        else:
+            ranks = combinatorics.sample_permutation_ranks(
+                len(self.keyword_arguments),
+                count
+            )
 
-    def  (self: Self) -> Iterator[ArgumentBase]:
+        for rank in ranks:
+            yield self.ordered_keyword_arguments(rank)
+
+    def __iter__(self: Self) -> Iterator[ArgumentBase]:
         def f() -> Iterator[ArgumentBase]:
             for x in self.positional_arguments:
                 yield x
 
-            n = len(self.keyword_arguments)
-            for x in random.sample(self.keyword_arguments, k=n):
+            for x in self.shuffled_keyword_arguments():
                 yield x
 
         return f()
 
+    def call_arguments(
+        self: Self,
+        stats: "ParameterStats",
+        /
+    ) -> tuple[tuple[ArgumentBase, ...], dict[str, ArgumentBase]]:
+        """
+        Return `(args, kwargs)` for calling a function described by `stats`.
+
+        Each placeholder is passed as its own value. Keyword placeholders are
+        named after the parameter they map to; extra keyword arguments get
+        names no parameter would use.
+        """
+        kwargs: dict[str, ArgumentBase] = {}
+        for x in self.keyword_arguments:
+            if isinstance(x, TestKeyword):
+                kwargs[stats.keyword_only_names[x.n - 1]] = x
+            elif isinstance(x, TestPositionalOrKeyword):
+                kwargs[stats.positional_or_keyword_names[x.n - 1]] = x
+            elif isinstance(x, UnmappedArgPlaceholder):
+                kwargs[f'__extra{x._n}'] = x
+            else:
+                raise TypeError("Unknown keyword argument placeholder")
+
+        return self.positional_arguments, kwargs
+
     def __len__(self: Self) -> int:
         """Return number of both positional and keyword arguments in signature."""
         return len(self.positional_arguments) + len(self.keyword_arguments)
@@ -0,0 +1,277 @@
+"""
+Batch versions of the range and split utility functions.
+
+Each function takes sequences of arguments and returns a `(values, lengths)`
+pair where `values[i][:lengths[i]]` equals the result of the scalar function
+for the ith arguments. Rows are padded by repeating their last value, so a
+row is also the right set of values without slicing.
+
+NumPy int64 arrays are returned when NumPy is installed and the arguments
+are small enough not to overflow them, otherwise nested lists of Python ints.
+NumPy's random numbers are seeded from `random` so `random.seed` still makes
+results reproducible.
+"""
+
+import functools
+import importlib
+import random
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Sequence, TypeAlias, TypeVar
+
+from . import utils
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing as npt
+
+    _IntArray: TypeAlias = npt.NDArray[numpy.int64]
+
+
+T = TypeVar('T')
+
+# bounds at most this large in magnitude keep every intermediate value of
+# the NumPy paths, such as `stop - start`, within int64
+_INT64_LIMIT = 2 ** 62
+
+
+@functools.cache
+def _numpy() -> ModuleType | None:
+    """Return the numpy module or None if it is not installed."""
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+def _numpy_for(*columns: Sequence[int], scale: int = 1) -> ModuleType | None:
+    """
+    Return the numpy module if it is installed and int64 can hold `columns`.
+
+    `scale` is how many times larger than the bounds intermediate values
+    get. Wider values use the Python path, which has no overflow.
+    """
+    np = _numpy()
+    limit = _INT64_LIMIT // scale
+    if np is None or any(
+        column and not (-limit < min(column) and max(column) < limit)
+        for column in columns
+    ):
+        return None
+    return np
+
+
+def _resolve_bounds(
+    n: Sequence[int],
+    m: Sequence[int] | None
+) -> tuple[Sequence[int], Sequence[int]]:
+    """Mirror the `(n, m=None)` argument handling of the scalar functions."""
+    if m is None:
+        return [0] * len(n), n
+    elif len(n) != len(m):
+        raise TypeError("`start` and `stop` must be the same length")
+    else:
+        return n, m
+
+
+def _pad(
+    rows: Sequence[Sequence[T]],
+    width: int
+) -> tuple[list[list[T]], list[int]]:
+    """Pad each row to `width` by repeating its last value."""
+    return (
+        [list(row) + [row[-1]] * (width - len(row)) for row in rows],
+        [len(row) for row in rows]
+    )
+
+
+def _generator(np: ModuleType) -> 'numpy.random.Generator':
+    """Return a numpy generator seeded from `random`."""
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def _mid(np: ModuleType, start: '_IntArray', stop: '_IntArray') -> '_IntArray':
+    """
+    Return a random value strictly between start and stop for each pair.
+
+    Pairs without a value strictly between them get `start + 1`.
+    """
+    high = np.maximum(stop, start + 2)
+    return _generator(np).integers(start + 1, high)
+
+
+def _check_bounds(np: ModuleType, diff: '_IntArray', *, allow_equal: bool) -> None:
+    """
+    Raise the error the scalar function would for the first invalid row.
+
+    Reversed bounds fail in `random.randrange` and equal ones, unless
+    `allow_equal`, are refused, checking rows in order like the fallback.
+    """
+    invalid = diff < 0 if allow_equal else diff <= 0
+    if not np.any(invalid):
+        return
+    if diff[np.argmax(invalid)] == 0:
+        raise TypeError("`start` must not equal `stop`")
+    raise ValueError("empty range for randrange()")
+
+
+def test_range_batch(
+    n: Sequence[int],
+    m: Sequence[int] | None = None,
+    /
+) -> tuple[Any, Any]:
+    """Batch version of `utils.test_range`; rows are 3 wide."""
+    starts, stops = _resolve_bounds(n, m)
+    np = _numpy_for(starts, stops)
+
+    if np is None:
+        return _pad([utils.test_range(a, b) for a, b in zip(starts, stops)], 3)
+
+    start = np.asarray(starts, dtype=np.int64)
+    stop = np.asarray(stops, dtype=np.int64)
+    diff = stop - start
+    _check_bounds(np, diff, allow_equal=True)
+
+    values = np.stack((start, _mid(np, start, stop), stop), axis=1)
+    values[diff == 0, 1:] = start[diff == 0, None]
+    values[diff == 1, 1:] = stop[diff == 1, None]
+    lengths = np.minimum(diff + 1, 3)
+    return values, lengths
+
+
+def test_low_range_batch(
+    n: Sequence[int],
+    m: Sequence[int] | None = None,
+    /
+) -> tuple[Any, Any]:
+    """Batch version of `utils.test_low_range`; rows are 2 wide."""
+    starts, stops = _resolve_bounds(n, m)
+    np = _numpy_for(starts, stops)
+
+    if np is None:
+        return _pad([utils.test_low_range(a, b) for a, b in zip(starts, stops)], 2)
+
+    start = np.asarray(starts, dtype=np.int64)
+    stop = np.asarray(stops, dtype=np.int64)
+    diff = stop - start
+    _check_bounds(np, diff, allow_equal=False)
+
+    values = np.stack((start, _mid(np, start, stop)), axis=1)
+    values[diff == 1, 1] = start[diff == 1]
+    lengths = np.minimum(diff, 2)
+    return values, lengths
+
+
+def test_high_range_batch(
+    n: Sequence[int],
+    m: Sequence[int] | None = None,
+    /
+) -> tuple[Any, Any]:
+    """Batch version of `utils.test_high_range`; rows are 2 wide."""
+    starts, stops = _resolve_bounds(n, m)
+    np = _numpy_for(starts, stops)
+
+    if np is None:
+        return _pad([utils.test_high_range(a, b) for a, b in zip(starts, stops)], 2)
+
+    start = np.asarray(starts, dtype=np.int64)
+    stop = np.asarray(stops, dtype=np.int64)
+    diff = stop - start
+    _check_bounds(np, diff, allow_equal=False)
+
+    # for a difference of 2 the only value between is stop - 1 == start + 1
+    values = np.stack((_mid(np, start, stop), stop), axis=1)
+    values[diff == 1, 0] = stop[diff == 1]
+    lengths = np.minimum(diff, 2)
+    return values, lengths
+
+
+def split_int_batch(
+    ns: Sequence[int],
+    /,
+    *,
+    x: Sequence[int] | None = None
+) -> tuple[Any, Any]:
+    """
+    Batch version of `utils.split_int`; rows are 3 splits of 2 wide.
+
+    Splits are ordered `(n, 0)`, `(0, n)` then the middle split.
+    """
+    if x is not None and len(x) != len(ns):
+        raise TypeError("`ns` and `x` must be the same length")
+
+    np = _numpy_for(ns, x or ())
+
+    if np is None:
+        rows: list[tuple[tuple[int, int], ...]] = []
+        for i, n in enumerate(ns):
+            xi = None if x is None else x[i]
+            splits = utils.split_int(n, x=xi if n > 1 else None)
+            rows.append(tuple(sorted(splits, key=lambda s: (s != (n, 0), s[0] != 0))))
+        return _pad(rows, 3)
+
+    n_arr = np.asarray(ns, dtype=np.int64)
+    if x is None:
+        x_arr = _generator(np).integers(1, np.maximum(n_arr, 2))
+    else:
+        x_arr = np.asarray(x, dtype=np.int64)
+        wide = n_arr > 1
+        if np.any(wide & ((x_arr <= 0) | (x_arr >= n_arr))):
+            raise TypeError("`x` must be in range 1..n-1")
+
+    zeros = np.zeros_like(n_arr)
+    values = np.stack((
+        np.stack((n_arr, zeros), axis=1),
+        np.stack((zeros, n_arr), axis=1),
+        np.stack((x_arr, n_arr - x_arr), axis=1),
+    ), axis=1)
+
+    small = n_arr <= 1
+    values[small, 2] = values[small, 1]
+    values[n_arr <= 0] = 0
+    lengths = np.clip(n_arr + 1, 1, 3)
+    return values, lengths
+
+
+def test_stratified_range_batch(
+    starts: Sequence[int],
+    stops: Sequence[int],
+    k: int,
+    /
+) -> tuple[Any, Any]:
+    """Batch version of `utils.test_stratified_range`; rows are k + 2 wide."""
+    if k < 1:
+        raise TypeError("`k` must be at least 1")
+    elif len(starts) != len(stops):
+        raise TypeError("`start` and `stop` must be the same length")
+
+    # the strata bounds multiply the range's size by up to k
+    np = _numpy_for(starts, stops, scale=2 * (k + 1))
+
+    if np is None:
+        return _pad(
+            [utils.test_stratified_range(a, b, k) for a, b in zip(starts, stops)],
+            k + 2
+        )
+
+    start = np.asarray(starts, dtype=np.int64)
+    stop = np.asarray(stops, dtype=np.int64)
+    if np.any(stop < start):
+        raise TypeError("`stop` must not be less than `start`")
+
+    # stratum i of each row is low[:, i]..high[:, i] - 1 and may be empty
+    size = stop - start + 1
+    bounds = start[:, None] + (np.arange(k + 1)[None, :] * size[:, None]) // k
+    low, high = bounds[:, :-1], bounds[:, 1:]
+    picks = _generator(np).integers(low, np.maximum(high, low + 1))
+    picks = np.where(high > low, picks, start[:, None])
+
+    values = np.sort(np.concatenate((start[:, None], picks, stop[:, None]), axis=1))
+
+    # push duplicates to the end of each row and pad with the row's maximum
+    duplicate = np.zeros_like(values, dtype=bool)
+    duplicate[:, 1:] = values[:, 1:] == values[:, :-1]
+    lengths = values.shape[1] - duplicate.sum(axis=1)
+    values = np.sort(np.where(duplicate, np.iinfo(np.int64).max, values))
+    values = np.where(np.arange(values.shape[1])[None, :] < lengths[:, None],
+                      values, stop[:, None])
+    return values, lengths
@@ -0,0 +1,279 @@
+"""
+Generate skeletons and test cases within a time budget.
+
+A `Deadline` reads the monotonic clock at most once every `stride` checks,
+so checking it per item costs a counter decrement. Budgeted generation
+stops before starting an item once the deadline has passed and returns what
+it produced along with a report of what was covered and what was skipped.
+Passing the report's `next_index` as `start` to the next run resumes where
+this one stopped.
+"""
+
+import dataclasses
+import itertools
+import random
+import time
+from typing import Any, Callable, Generic, Iterable, Iterator, Self, TypeVar
+
+from .arguments import TestCaseContainer
+from .cases import CaseCoordinates, iter_case_coordinates, make_test_case
+from .constants_and_types import (
+    ParameterKind,
+    POSITIONAL_ONLY,
+    POSITIONAL_OR_KEYWORD,
+    KEYWORD_ONLY
+)
+from .parameter_stats import ParameterStats
+from .signature_gen import (
+    ALL_FLAGS,
+    COUNT,
+    FLAG_PERMUTATION,
+    OPT_COUNT_F,
+    SHAPE,
+    SKELETON,
+    ParameterFlag,
+    SkeletonInterner,
+    build_skeleton_signatures,
+    flag_permutations,
+    skeleton_shape
+)
+
+
+T = TypeVar('T')
+
+
+class Deadline:
+    """
+    A time on the monotonic clock after which work should stop.
+
+    `expired` only reads `clock` on every `stride`th call, including the
+    first, so work may overrun by up to `stride - 1` items. Once expired a
+    deadline stays expired.
+    """
+
+    end: float
+    stride: int
+    clock: Callable[[], float]
+    _countdown: int
+    _expired: bool
+
+    def __init__(
+        self: Self,
+        seconds: float,
+        /,
+        *,
+        stride: int = 16,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Expire `seconds` from now on `clock`, checking it every `stride` calls."""
+        if stride < 1:
+            raise TypeError("`stride` must be at least 1")
+        self.clock = clock
+        self.end = clock() + seconds
+        self.stride = stride
+        self._countdown = 1
+        self._expired = False
+
+    def expired(self: Self) -> bool:
+        """Return True if the deadline has passed."""
+        if self._expired:
+            return True
+        self._countdown -= 1
+        if self._countdown:
+            return False
+        self._countdown = self.stride
+        self._expired = self.clock() >= self.end
+        return self._expired
+
+    def remaining(self: Self) -> float:
+        """Return the seconds left, reading the clock."""
+        return max(0.0, self.end - self.clock())
+
+
+def within(iterable: Iterable[T], deadline: Deadline, /) -> Iterator[T]:
+    """Yield from `iterable` until it is exhausted or `deadline` expires."""
+    iterator = iter(iterable)
+    while not deadline.expired():
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        yield item
+
+
+def _deadline(budget: float | Deadline, stride: int) -> Deadline:
+    return budget if isinstance(budget, Deadline) else Deadline(budget, stride=stride)
+
+
+@dataclasses.dataclass
+class BudgetReport(Generic[T]):
+    """What a budgeted run covered and skipped, in generation order."""
+
+    start: int
+    covered: list[T]
+    skipped: list[T]
+    seconds: float
+
+    @property
+    def complete(self: Self) -> bool:
+        """True if nothing was skipped."""
+        return not self.skipped
+
+    @property
+    def next_index(self: Self) -> int:
+        """The `start` that resumes after this run."""
+        return self.start + len(self.covered)
+
+
+@dataclasses.dataclass
+class SkeletonBudgetReport(BudgetReport[FLAG_PERMUTATION]):
+    """
+    Flag permutations and parameter counts covered and skipped.
+
+    `counts` holds the parameter counts of each kind that were generated
+    and `skipped_counts` those in the requested ranges that were not.
+    Counts given as callables have no known range, so none are reported
+    as skipped for them.
+    """
+
+    counts: dict[ParameterKind, list[int]] = dataclasses.field(default_factory=dict)
+    skipped_counts: dict[ParameterKind, list[int]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def to_json(self: Self) -> dict[str, Any]:
+        """Return a JSON serializable form of the report."""
+        return {
+            'start': self.start,
+            'next_index': self.next_index,
+            'seconds': self.seconds,
+            'covered': [[f.name for f in p] for p in self.covered],
+            'skipped': [[f.name for f in p] for p in self.skipped],
+            'counts': {kind.name: c for kind, c in self.counts.items()},
+            'skipped_counts': {kind.name: c for kind, c in self.skipped_counts.items()},
+        }
+
+
+def _count_values(count: COUNT) -> set[int]:
+    if isinstance(count, int):
+        return {count}
+    if isinstance(count, tuple):
+        return set(range(count[0], count[1] + 1))
+    return set()
+
+
+def _kind_count(shape: SHAPE, kind: ParameterKind) -> int:
+    po_required, po_optional, pk_required, pk_optional, _, ko_count, _, _ = shape
+    if kind is POSITIONAL_ONLY:
+        return po_required + po_optional
+    if kind is POSITIONAL_OR_KEYWORD:
+        return pk_required + pk_optional
+    return ko_count
+
+
+def budgeted_skeletons(
+    budget: float | Deadline,
+    /,
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ALL_FLAGS,
+    positional_only_optional_count: OPT_COUNT_F | None = None,
+    positional_or_keyword_optional_count: OPT_COUNT_F | None = None,
+    keyword_only_optional_count: OPT_COUNT_F | None = None,
+    rle: bool = False,
+    interner: SkeletonInterner | None = None,
+    rng: random.Random | None = None,
+    start: int = 0,
+    stride: int = 16
+) -> tuple[list[SKELETON], SkeletonBudgetReport]:
+    """
+    Run `build_skeleton_signatures` until it finishes or `budget` runs out.
+
+    `budget` is a number of seconds or a `Deadline` shared with other work.
+    The other arguments are passed on to `build_skeleton_signatures`.
+    """
+    deadline = _deadline(budget, stride)
+    begin = time.monotonic()
+    skeletons = list(within(
+        build_skeleton_signatures(
+            positional_only=positional_only,
+            positional_or_keyword=positional_or_keyword,
+            keyword_only=keyword_only,
+            flag=flag,
+            positional_only_optional_count=positional_only_optional_count,
+            positional_or_keyword_optional_count=positional_or_keyword_optional_count,
+            keyword_only_optional_count=keyword_only_optional_count,
+            rle=rle,
+            interner=interner,
+            rng=rng,
+            start=start
+        ),
+        deadline
+    ))
+    permutations = list(itertools.islice(flag_permutations(flag), start, None))
+
+    # (kind, requested count, index in a permutation, flag for no parameters)
+    kinds = (
+        (POSITIONAL_ONLY, positional_only, 0, ParameterFlag.NO_POSITIONAL_ONLY),
+        (POSITIONAL_OR_KEYWORD, positional_or_keyword, 1,
+         ParameterFlag.NO_POSITIONAL_OR_KEYWORD),
+        (KEYWORD_ONLY, keyword_only, 3, ParameterFlag.NO_KEYWORD_ONLY),
+    )
+    shapes = [skeleton_shape(skeleton) for skeleton in skeletons]
+    counts: dict[ParameterKind, list[int]] = {}
+    skipped_counts: dict[ParameterKind, list[int]] = {}
+    for kind, count, i, no_flag in kinds:
+        # only permutations with parameters of this kind draw a count for it
+        if all(p[i] is no_flag for p in permutations):
+            continue
+        seen = {
+            _kind_count(shape, kind)
+            for shape, p in zip(shapes, permutations)
+            if p[i] is not no_flag
+        }
+        counts[kind] = sorted(seen)
+        skipped_counts[kind] = sorted(_count_values(count) - seen)
+
+    return skeletons, SkeletonBudgetReport(
+        start,
+        permutations[:len(skeletons)],
+        permutations[len(skeletons):],
+        time.monotonic() - begin,
+        counts=counts,
+        skipped_counts=skipped_counts
+    )
+
+
+def budgeted_test_cases(
+    budget: float | Deadline,
+    stats: ParameterStats,
+    /,
+    *,
+    extras: int = 1,
+    k: int | None = None,
+    rng: random.Random | None = None,
+    start: int = 0,
+    stride: int = 16
+) -> tuple[list[TestCaseContainer], BudgetReport[CaseCoordinates]]:
+    """
+    Generate the cases `generate_test_cases` would until `budget` runs out.
+
+    Cases before number `start` are skipped without being built. Draws
+    come from `rng`, by default the `random` module.
+    """
+    deadline = _deadline(budget, stride)
+    begin = time.monotonic()
+    coordinates = list(
+        itertools.islice(
+            iter_case_coordinates(stats, extras=extras, k=k, rng=rng), start, None
+        )
+    )
+    cases = [make_test_case(stats, c, rng=rng) for c in within(coordinates, deadline)]
+    return cases, BudgetReport(
+        start,
+        coordinates[:len(cases)],
+        coordinates[len(cases):],
+        time.monotonic() - begin
+    )
@@ -0,0 +1,140 @@
+"""Generate test cases for a function signature."""
+
+import random
+from typing import Iterator, NamedTuple
+
+from .arguments import (
+    TestCaseContainer,
+    TestKeyword,
+    TestKeywordExtra,
+    TestPositional,
+    TestPositionalExtra,
+    TestPositionalOrKeyword
+)
+from .constants_and_types import POSITIONAL_ONLY, POSITIONAL_OR_KEYWORD, KEYWORD_ONLY
+from .parameter_ranges import ParameterRanges
+from .parameter_stats import ParameterStats
+from . import utils
+
+
+class CaseCoordinates(NamedTuple):
+    """
+    The argument counts that pick out one test case of a signature.
+
+    `po` positional only arguments, `as_pos` and `as_kw` positional/keyword
+    arguments passed positionally and by keyword, `ko` keyword only
+    arguments, and `pe` and `ke` extra positional and keyword arguments.
+    """
+
+    po: int
+    as_pos: int
+    as_kw: int
+    ko: int
+    pe: int
+    ke: int
+
+
+def iter_case_coordinates(
+    stats: ParameterStats,
+    /,
+    *,
+    extras: int = 1,
+    k: int | None = None,
+    rng: random.Random | None = None
+) -> Iterator[CaseCoordinates]:
+    """
+    Yield the coordinates of each case `generate_test_cases` yields.
+
+    Argument counts and splits are drawn from `rng`, by default the `random`
+    module.
+    """
+    ranges = ParameterRanges(stats, k=k, rng=rng)
+    all_po = stats.counters[POSITIONAL_ONLY]
+    all_pk = stats.counters[POSITIONAL_OR_KEYWORD]
+    extra_counts = (0, extras) if extras else (0,)
+
+    for po in ranges[POSITIONAL_ONLY]:
+        for pk in ranges[POSITIONAL_OR_KEYWORD]:
+            for as_pos, as_kw in sorted(utils.split_int(pk, rng=rng)):
+                # positional/keyword parameters can only be passed positionally
+                # once every positional only parameter has been
+                if as_pos > 0 and po < all_po:
+                    continue
+
+                for ko in ranges[KEYWORD_ONLY]:
+                    for pe in extra_counts:
+                        # likewise extra positional arguments would just fill
+                        # in missing positional parameters
+                        if pe > 0 and (po < all_po or as_pos < all_pk):
+                            continue
+
+                        for ke in extra_counts:
+                            yield CaseCoordinates(po, as_pos, as_kw, ko, pe, ke)
+
+
+def make_test_case(
+    stats: ParameterStats,
+    coordinates: CaseCoordinates,
+    /,
+    *,
+    rng: random.Random | None = None
+) -> TestCaseContainer:
+    """
+    Return the test case at `coordinates`.
+
+    Which keyword only and positional/keyword parameters are passed by
+    keyword is still drawn at random, from `rng` or by default the `random`
+    module.
+    """
+    po, as_pos, as_kw, ko, pe, ke = coordinates
+    return TestCaseContainer.auto(
+        stats.test_positional_gen(po),
+        stats.test_keyword_or_positional_gen(as_pos=as_pos, as_kw=as_kw, rng=rng),
+        stats.test_positional_extra_gen(pe),
+        stats.test_keyword_gen(ko, rng=rng),
+        stats.test_keyword_extra_gen(ke)
+    )
+
+
+def case_coordinates(case: TestCaseContainer, /) -> CaseCoordinates:
+    """Return the coordinates of `case`; the inverse of `make_test_case`."""
+    po = as_pos = as_kw = ko = pe = ke = 0
+    for x in (*case.positional_arguments, *case.keyword_arguments):
+        if isinstance(x, TestPositional):
+            po += 1
+        elif isinstance(x, TestPositionalOrKeyword):
+            as_kw += x.as_keyword
+            as_pos += not x.as_keyword
+        elif isinstance(x, TestKeyword):
+            ko += 1
+        elif isinstance(x, TestPositionalExtra):
+            pe += 1
+        elif isinstance(x, TestKeywordExtra):
+            ke += 1
+        else:
+            raise TypeError("Unknown argument placeholder")
+    return CaseCoordinates(po, as_pos, as_kw, ko, pe, ke)
+
+
+def generate_test_cases(
+    stats: ParameterStats,
+    /,
+    *,
+    extras: int = 1,
+    k: int | None = None,
+    rng: random.Random | None = None
+) -> Iterator[TestCaseContainer]:
+    """
+    Yield test cases for a signature described by `stats`.
+
+    The number of arguments of each kind is drawn from `ParameterRanges`
+    (passing `k` to it), positional/keyword parameters are split between
+    positional and keyword arguments with `utils.split_int`, and each case
+    is tried with and without `extras` extra positional and keyword
+    arguments. Extra arguments are added whether or not the signature has a
+    variable parameter to collect them, so some cases are calls the function
+    should reject. Every draw comes from `rng`, by default the `random`
+    module.
+    """
+    for coordinates in iter_case_coordinates(stats, extras=extras, k=k, rng=rng):
+        yield make_test_case(stats, coordinates, rng=rng)
@@ -0,0 +1,297 @@
+"""
+Generators that can be stopped in one process and resumed in another.
+
+A `CheckpointedIterator` runs a generator that draws from a private
+`random.Random` and counts the items it yields. Its `Checkpoint` holds that
+count, the generator's random state and the generation parameters, all JSON
+serializable. Skeleton generation can skip its first items without drawing
+random numbers, so restarting from the count with the saved random state
+continues exactly where the old process stopped and the counts still to be
+drawn come out the same. Test cases draw their coordinates between cases,
+so they are resumed by regenerating the skipped cases of the one skeleton.
+"""
+
+import dataclasses
+import json
+import os
+import random
+import tempfile
+from typing import Any, Callable, Generic, Iterator, Literal, Self, TypeVar, overload
+
+from .arguments import TestCaseContainer
+from .cases import iter_case_coordinates, make_test_case
+from .parameter_stats import ParameterStats
+from .signature_gen import (
+    ALL_FLAGS,
+    COUNT,
+    SKELETON,
+    ParameterFlag,
+    ProtoParameter,
+    RLESkeleton,
+    build_skeleton_signatures,
+    skeleton_count
+)
+
+
+T_co = TypeVar('T_co', covariant=True)
+
+_FORMAT_VERSION: int = 1
+
+
+def random_state_to_json(state: tuple[Any, ...], /) -> list[Any]:
+    """Return `random.getstate()` output as JSON serializable lists."""
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def random_state_from_json(data: list[Any], /) -> tuple[Any, ...]:
+    """Inverse of `random_state_to_json`."""
+    version, internal, gauss_next = data
+    return version, tuple(internal), gauss_next
+
+
+def count_to_json(count: COUNT, /) -> int | list[int]:
+    """Return a parameter count as JSON; callables cannot be checkpointed."""
+    if isinstance(count, int):
+        return count
+    if isinstance(count, tuple):
+        return list(count)
+    raise TypeError("Only int and (low, high) counts can be checkpointed")
+
+
+@dataclasses.dataclass(frozen=True)
+class Checkpoint:
+    """
+    Where a checkpointed generator stopped.
+
+    `index` items had been yielded and `random_state` is the generator's
+    random state after the last of them. `parameters` describe what was
+    being generated so a resume with different parameters is refused.
+    """
+
+    index: int
+    random_state: tuple[Any, ...]
+    parameters: dict[str, Any]
+
+    def to_json(self: Self) -> dict[str, Any]:
+        """Return a JSON serializable form of the checkpoint."""
+        return {
+            'version': _FORMAT_VERSION,
+            'index': self.index,
+            'random_state': random_state_to_json(self.random_state),
+            'parameters': self.parameters,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], /) -> Self:
+        """Inverse of `to_json`."""
+        if data.get('version') != _FORMAT_VERSION:
+            raise TypeError(f"Unsupported checkpoint version {data.get('version')!r}")
+        return cls(
+            data['index'],
+            random_state_from_json(data['random_state']),
+            data['parameters']
+        )
+
+    def save(self: Self, path: str | os.PathLike[str], /) -> None:
+        """Write the checkpoint to `path` as JSON, replacing it atomically."""
+        with tempfile.NamedTemporaryFile(
+            'w',
+            encoding='utf-8',
+            dir=os.path.dirname(os.path.abspath(path)),
+            prefix=f'.{os.path.basename(path)}.',
+            suffix='.tmp',
+            delete=False
+        ) as f:
+            temporary = f.name
+            try:
+                json.dump(self.to_json(), f, separators=(',', ':'))
+            except BaseException:
+                f.close()
+                os.unlink(temporary)
+                raise
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], /) -> Self:
+        """Read a checkpoint written by `save`."""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_json(json.load(f))
+
+
+class CheckpointedIterator(Generic[T_co]):
+    """
+    Iterate `factory(start, rng)` with a random state that can be checkpointed.
+
+    `factory(start, rng)` must return an iterator over the items from number
+    `start` on that draws only from `rng`. A fresh iterator passes
+    `random.Random(seed)`, a resumed one a generator restored to the
+    checkpoint's state, which a factory that skips the earlier items without
+    drawing continues from. Other factories may reseed `rng` and regenerate
+    the skipped items.
+    """
+
+    parameters: dict[str, Any]
+    index: int
+    _rng: random.Random
+    _iterator: Iterator[T_co]
+
+    def __init__(
+        self: Self,
+        factory: Callable[[int, random.Random], Iterator[T_co]],
+        seed: int | str,
+        /,
+        *,
+        parameters: dict[str, Any],
+        checkpoint: Checkpoint | None = None
+    ) -> None:
+        """Start from `checkpoint` if given, refusing one with other parameters."""
+        # round trip so comparisons with loaded checkpoints see JSON types
+        self.parameters = json.loads(json.dumps({'seed': seed, **parameters}))
+        self._rng = random.Random(seed)
+        if checkpoint is None:
+            self.index = 0
+        else:
+            if checkpoint.parameters != self.parameters:
+                raise TypeError("Checkpoint was made with different parameters")
+            self.index = checkpoint.index
+            self._rng.setstate(checkpoint.random_state)
+        self._iterator = factory(self.index, self._rng)
+
+    def __iter__(self: Self) -> Self:
+        """Return the iterator itself."""
+        return self
+
+    def __next__(self: Self) -> T_co:
+        """Return the next item and count it."""
+        item = next(self._iterator)
+        self.index += 1
+        return item
+
+    def checkpoint(self: Self) -> Checkpoint:
+        """Return a checkpoint for resuming after the last item yielded."""
+        return Checkpoint(self.index, self._rng.getstate(), self.parameters)
+
+
+@overload
+def checkpointed_skeletons(
+    seed: int | str,
+    /,
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ...,
+    repeat: int = ...,
+    rle: Literal[True],
+    checkpoint: Checkpoint | None = ...
+) -> CheckpointedIterator[RLESkeleton]: ...
+
+
+@overload
+def checkpointed_skeletons(
+    seed: int | str,
+    /,
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ...,
+    repeat: int = ...,
+    rle: Literal[False] = ...,
+    checkpoint: Checkpoint | None = ...
+) -> CheckpointedIterator[tuple[ProtoParameter, ...]]: ...
+
+
+@overload
+def checkpointed_skeletons(
+    seed: int | str,
+    /,
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ...,
+    repeat: int = ...,
+    rle: bool = ...,
+    checkpoint: Checkpoint | None = ...
+) -> CheckpointedIterator[SKELETON]: ...
+
+
+def checkpointed_skeletons(
+    seed: int | str,
+    /,
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ALL_FLAGS,
+    repeat: int = 1,
+    rle: bool = False,
+    checkpoint: Checkpoint | None = None
+) -> CheckpointedIterator[SKELETON]:
+    """
+    Return a checkpointable `build_skeleton_signatures`, run `repeat` times.
+
+    Counts must be ints or ranges, as callables cannot be saved.
+    """
+    counts = dict(
+        positional_only=positional_only,
+        positional_or_keyword=positional_or_keyword,
+        keyword_only=keyword_only,
+    )
+    parameters = {
+        **{name: count_to_json(count) for name, count in counts.items()},
+        'flag': flag.value,
+        'repeat': repeat,
+        'rle': rle,
+    }
+
+    def factory(start: int, rng: random.Random) -> Iterator[SKELETON]:
+        count = skeleton_count(flag) if start else 0
+        for repetition in range(repeat):
+            yield from build_skeleton_signatures(
+                positional_only=positional_only,
+                positional_or_keyword=positional_or_keyword,
+                keyword_only=keyword_only,
+                flag=flag,
+                rle=rle,
+                rng=rng,
+                start=max(0, start - repetition * count)
+            )
+
+    return CheckpointedIterator(
+        factory, seed, parameters=parameters, checkpoint=checkpoint
+    )
+
+
+def checkpointed_test_cases(
+    stats: ParameterStats,
+    seed: int | str,
+    /,
+    *,
+    extras: int = 1,
+    k: int | None = None,
+    checkpoint: Checkpoint | None = None
+) -> CheckpointedIterator[TestCaseContainer]:
+    """Return a checkpointable `generate_test_cases` for `stats`."""
+    parameters = {
+        'shape': [int(x) for x in stats.shape],
+        'extras': extras,
+        'k': k,
+    }
+
+    def factory(start: int, rng: random.Random) -> Iterator[TestCaseContainer]:
+        # coordinates are drawn lazily between cases, so the skipped cases
+        # are rebuilt from the seed to draw everything in the same order
+        if start:
+            rng.seed(seed)
+        coordinates = iter_case_coordinates(stats, extras=extras, k=k, rng=rng)
+        for n, c in enumerate(coordinates):
+            case = make_test_case(stats, c, rng=rng)
+            if n >= start:
+                yield case
+
+    return CheckpointedIterator(
+        factory, seed, parameters=parameters, checkpoint=checkpoint
+    )
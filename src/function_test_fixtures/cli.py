@@ -0,0 +1,199 @@
+"""
+Command line interface, run with ``python -m function_test_fixtures``.
+
+Streams skeletons from `build_skeleton_signatures` and the test cases of
+each one to stdout in one of the `serialize` formats.
+"""
+
+import argparse
+import contextlib
+import functools
+import operator
+import random
+import sys
+from typing import BinaryIO, Iterator, Sequence
+
+from .distributions import CorpusDistribution
+from .replay import DecisionLogWriter
+from .scheduling import CostModel, list_schedule
+from .serialize import ENCODERS
+from .signature_gen import (
+    ALL_FLAGS,
+    COUNT,
+    ParameterFlag,
+    RLESkeleton,
+    skeleton_shape
+)
+from .stream import FixtureStream
+
+
+def _count(value: str) -> COUNT:
+    """Parse ``N`` or ``LO:HI`` into a count."""
+    try:
+        low, sep, high = value.partition(':')
+        if sep:
+            return int(low), int(high)
+        return int(low)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected N or LO:HI, got {value!r}")
+
+
+def _shard(value: str) -> tuple[int, int]:
+    """Parse ``i/n`` into a shard index and a shard count."""
+    try:
+        i, n = map(int, value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/n, got {value!r}")
+    if not 0 <= i < n:
+        raise argparse.ArgumentTypeError("shard index must be in range 0..n-1")
+    return i, n
+
+
+def _flag(value: str) -> ParameterFlag:
+    try:
+        return ParameterFlag[value.upper()]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"unknown flag {value!r}")
+
+
+def make_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the command line interface."""
+    parser = argparse.ArgumentParser(
+        prog='python -m function_test_fixtures',
+        description="Stream skeleton signatures and their test cases."
+    )
+    parser.add_argument(
+        '--flag', type=_flag, action='append', metavar='NAME',
+        help="`ParameterFlag` member to generate for, may be repeated "
+             "(default: all flags)"
+    )
+    parser.add_argument(
+        '--positional-only', type=_count, default=(3, 5), metavar='COUNT',
+        help="positional only parameter count, N or LO:HI (default: 3:5)"
+    )
+    parser.add_argument(
+        '--positional-or-keyword', type=_count, default=(3, 5), metavar='COUNT',
+        help="positional or keyword parameter count (default: 3:5)"
+    )
+    parser.add_argument(
+        '--keyword-only', type=_count, default=(3, 5), metavar='COUNT',
+        help="keyword only parameter count (default: 3:5)"
+    )
+    parser.add_argument(
+        '--distribution', metavar='PATH',
+        help="draw counts from a saved `CorpusDistribution` instead"
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=1, metavar='N',
+        help="number of times to run the generator (default: 1)"
+    )
+    parser.add_argument('--seed', type=int, help="seed for reproducible output")
+    parser.add_argument(
+        '--format', choices=sorted(ENCODERS), default='jsonl',
+        help="output format (default: jsonl)"
+    )
+    parser.add_argument(
+        '--no-cases', dest='cases', action='store_false',
+        help="only emit skeletons"
+    )
+    parser.add_argument(
+        '--extras', type=int, default=1, metavar='N',
+        help="extra arguments to add to cases (default: 1)"
+    )
+    parser.add_argument(
+        '-k', type=int, metavar='K',
+        help="use stratified ranges of K values for argument counts"
+    )
+    parser.add_argument(
+        '--shard', type=_shard, default=(0, 1), metavar='i/n',
+        help="only emit skeletons whose index is i modulo n (default: 0/1)"
+    )
+    parser.add_argument(
+        '--balance', action='store_true',
+        help="give each skeleton to the shard with the least estimated cost "
+             "so far rather than by index modulo n"
+    )
+    parser.add_argument(
+        '--decision-log', metavar='PATH',
+        help="also write a `DecisionLog` of the emitted cases to PATH, "
+             "skeleton by skeleton"
+    )
+    parser.add_argument(
+        '--chunk-size', type=int, default=1024, metavar='N',
+        help="records to buffer between flushes (default: 1024)"
+    )
+    return parser
+
+
+def make_stream(args: argparse.Namespace, /) -> FixtureStream:
+    """Return the fixture stream for the parsed arguments."""
+    flag = functools.reduce(operator.or_, args.flag) if args.flag else ALL_FLAGS
+    counts: dict[str, COUNT]
+    if args.distribution is None:
+        counts = {
+            'positional_only': args.positional_only,
+            'positional_or_keyword': args.positional_or_keyword,
+            'keyword_only': args.keyword_only,
+        }
+    else:
+        counts = dict(CorpusDistribution.load(args.distribution).count_arguments())
+
+    seed = random.getrandbits(64) if args.seed is None else args.seed
+    return FixtureStream(seed, flag=flag, repeat=args.repeat, **counts)
+
+
+def main(argv: Sequence[str] | None = None, stdout: BinaryIO | None = None) -> int:
+    """
+    Run the command line interface and return the exit status.
+
+    Every shard sees the same `FixtureStream` and a skeleton's cases do not
+    depend on which shard generated them. With ``--balance`` costs are
+    estimated from each skeleton's shape by an untrained `CostModel`, not
+    from timings, so that every shard computes the same assignment.
+    """
+    args = make_parser().parse_args(argv)
+    out = sys.stdout.buffer if stdout is None else stdout
+    encoder = ENCODERS[args.format]()
+    shard, shards = args.shard
+    stream = make_stream(args)
+
+    assigned: Iterator[tuple[int, RLESkeleton]]
+    if args.balance:
+        assigned = list_schedule(stream, shards, cost=CostModel().estimate)
+    else:
+        assigned = ((index % shards, skeleton) for index, skeleton in enumerate(stream))
+
+    with contextlib.ExitStack() as stack:
+        log = None
+        if args.decision_log is not None:
+            log = stack.enter_context(
+                DecisionLogWriter(args.decision_log, extras=args.extras, k=args.k)
+            )
+
+        buffer = bytearray(encoder.header())
+        pending = 0
+        for index, (worker, skeleton) in enumerate(assigned):
+            if worker != shard:
+                continue
+
+            buffer += encoder.skeleton(index, skeleton_shape(skeleton))
+            pending += 1
+            if args.cases:
+                cases = (
+                    stream.test_cases(index, skeleton, extras=args.extras, k=args.k)
+                    if log is None
+                    else log.record_skeleton(stream, index, skeleton)
+                )
+                for case in cases:
+                    buffer += encoder.case(index, case)
+                    pending += 1
+
+            if pending >= args.chunk_size:
+                out.write(buffer)
+                out.flush()
+                buffer.clear()
+                pending = 0
+
+        out.write(buffer)
+        out.flush()
+    return 0
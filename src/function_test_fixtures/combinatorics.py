@@ -0,0 +1,305 @@
+"""Ranking, unranking and lazy enumeration of combinatorial objects."""
+
+import enum
+import functools
+import math
+import random
+import sys
+from typing import Iterator, Sequence
+
+
+def rank_combination(combination: Sequence[int], /) -> int:
+    """
+    Return the rank of a k-subset in the combinatorial number system.
+
+    `combination` must be sorted in ascending order. Ranks are in colex
+    order, so the rank does not depend on the size of the underlying set.
+    """
+    return sum(math.comb(c, i + 1) for i, c in enumerate(combination))
+
+
+def unrank_combination(rank: int, k: int, n: int, /) -> tuple[int, ...]:
+    """
+    Return the k-subset of range(n) with the given colex rank.
+
+    Inverse of `rank_combination`. Each element is found by a binary search
+    so this is O(k log n) binomial evaluations.
+    """
+    if not 0 <= rank < math.comb(n, k):
+        raise IndexError("`rank` out of range")
+
+    combination: list[int] = []
+    high: int = n - 1
+    for i in range(k, 0, -1):
+        # find the largest c with comb(c, i) <= rank
+        low: int = i - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if math.comb(mid, i) <= rank:
+                low = mid
+            else:
+                high = mid - 1
+        combination.append(low)
+        rank -= math.comb(low, i)
+        high = low - 1
+
+    combination.reverse()
+    return tuple(combination)
+
+
+def iter_combinations(
+    n: int,
+    k: int,
+    /,
+    start: int = 0,
+    stop: int | None = None
+) -> Iterator[tuple[int, ...]]:
+    """
+    Lazily yield the k-subsets of range(n) with colex ranks in start..stop-1.
+
+    Only the first subset is unranked, the rest are found by stepping to the
+    colex successor, so disjoint rank ranges can be walked by different
+    shards without materializing every combination.
+    """
+    total: int = math.comb(n, k)
+    if stop is None or stop > total:
+        stop = total
+    if start >= stop:
+        return
+
+    combination: list[int] = list(unrank_combination(start, k, n))
+    for _ in range(stop - start - 1):
+        yield tuple(combination)
+
+        # find the lowest element that can be moved up, move it and reset
+        # everything below it to the smallest possible values
+        j: int = 0
+        while j < k - 1 and combination[j] + 1 == combination[j + 1]:
+            j += 1
+        combination[j] += 1
+        combination[:j] = range(j)
+
+    yield tuple(combination)
+
+
+def gray_code_flips(m: int, /) -> Iterator[int]:
+    """
+    Yield the bit flipped at each step of the m bit reflected Gray code.
+
+    Starting from 0 and applying every flip visits all 2**m values and ends
+    on the top bit alone. The sequence is a palindrome, so the same flips
+    walk the code in reverse starting from the top bit.
+    """
+    for i in range(1, 1 << m):
+        yield (i & -i).bit_length() - 1
+
+
+# permutations of up to this many items have their index tables cached
+PERMUTATION_TABLE_LIMIT: int = 7
+
+
+def rank_permutation(permutation: Sequence[int], /) -> int:
+    """Return the lexicographic rank of a permutation of range(k)."""
+    k: int = len(permutation)
+    rank: int = 0
+    remaining: list[int] = list(range(k))
+    for i, x in enumerate(permutation):
+        # the Lehmer code digit is the position of x among unused items
+        digit = remaining.index(x)
+        del remaining[digit]
+        rank += digit * math.factorial(k - 1 - i)
+    return rank
+
+
+def _unrank_permutation(rank: int, k: int, /) -> tuple[int, ...]:
+    """Unrank a permutation without consulting the permutation tables."""
+    remaining: list[int] = list(range(k))
+    permutation: list[int] = []
+    for i in range(k - 1, -1, -1):
+        digit, rank = divmod(rank, math.factorial(i))
+        permutation.append(remaining.pop(digit))
+    return tuple(permutation)
+
+
+@functools.cache
+def permutation_table(k: int, /) -> tuple[tuple[int, ...], ...]:
+    """
+    Return every permutation of range(k) in lexicographic order.
+
+    Only meant for small `k`; tables are cached so repeated lookups are a
+    single index.
+    """
+    return tuple(_unrank_permutation(rank, k) for rank in range(math.factorial(k)))
+
+
+def unrank_permutation(rank: int, k: int, /) -> tuple[int, ...]:
+    """
+    Return the permutation of range(k) with the given lexicographic rank.
+
+    The rank is decoded as a Lehmer code in the factorial number system.
+    """
+    if not 0 <= rank < math.factorial(k):
+        raise IndexError("`rank` out of range")
+
+    if k <= PERMUTATION_TABLE_LIMIT:
+        return permutation_table(k)[rank]
+    else:
+        return _unrank_permutation(rank, k)
+
+
+def random_permutation(k: int, /) -> tuple[int, ...]:
+    """Return a uniformly random permutation of range(k)."""
+    if k <= PERMUTATION_TABLE_LIMIT:
+        return random.choice(permutation_table(k))
+    else:
+        return tuple(random.sample(range(k), k))
+
+
+# largest number of ranks `sample_ranks` will draw in one go
+_SAMPLE_LIMIT: int = 1 << 16
+
+
+def sample_ranks(total: int, count: int, /) -> Iterator[int]:
+    """
+    Lazily yield `count` distinct random ranks in range(total).
+
+    If `count` covers every rank they are all yielded, in a random order.
+    """
+    count = min(count, total)
+
+    # random.sample builds its whole result up front, so only use it when
+    # that is small
+    if total <= sys.maxsize and count <= _SAMPLE_LIMIT:
+        yield from random.sample(range(total), count)
+    else:
+        # draw ranks one at a time, rejecting the (usually rare) collisions
+        seen: set[int] = set()
+        while len(seen) < count:
+            rank = random.randrange(total)
+            if rank not in seen:
+                seen.add(rank)
+                yield rank
+
+
+def sample_permutation_ranks(k: int, count: int, /) -> Iterator[int]:
+    """
+    Lazily yield `count` distinct random permutation ranks of range(k).
+
+    If `count` covers every permutation they are all yielded, in a random
+    order.
+    """
+    yield from sample_ranks(math.factorial(k), count)
+
+
+class CompositionOrder(enum.Enum):
+    """Orders `compositions` can yield compositions in."""
+
+    RANK = 1
+    EXTREMES_FIRST = 2
+    RANDOM = 3
+
+
+def composition_count(n: int, k: int, /) -> int:
+    """Return the number of ways to write `n` as `k` ordered parts >= 0."""
+    if k == 0:
+        return 1 if n == 0 else 0
+    return math.comb(n + k - 1, k - 1)
+
+
+def rank_composition(parts: Sequence[int], /) -> int:
+    """
+    Return the rank of a composition.
+
+    Compositions of n into k parts are ranked as the positions of the k - 1
+    bars in a stars and bars layout of n + k - 1 slots.
+    """
+    bars: list[int] = []
+    position: int = -1
+    for part in parts[:-1]:
+        position += part + 1
+        bars.append(position)
+    return rank_combination(bars)
+
+
+def _bars_to_parts(bars: Sequence[int], n: int, k: int, /) -> tuple[int, ...]:
+    """Convert stars and bars bar positions into composition parts."""
+    parts: list[int] = []
+    previous: int = -1
+    for bar in bars:
+        parts.append(bar - previous - 1)
+        previous = bar
+    parts.append(n + k - 2 - previous)
+    return tuple(parts)
+
+
+def unrank_composition(rank: int, n: int, k: int, /) -> tuple[int, ...]:
+    """Return the composition of `n` into `k` parts with the given rank."""
+    if k == 0:
+        if rank == 0 and n == 0:
+            return ()
+        raise IndexError("`rank` out of range")
+    return _bars_to_parts(unrank_combination(rank, k - 1, n + k - 1), n, k)
+
+
+def iter_compositions(
+    n: int,
+    k: int,
+    /,
+    start: int = 0,
+    stop: int | None = None
+) -> Iterator[tuple[int, ...]]:
+    """Lazily yield the compositions of `n` into `k` parts in rank order."""
+    if k == 0:
+        if n == 0 and start == 0 and (stop is None or stop > 0):
+            yield ()
+        return
+
+    for bars in iter_combinations(n + k - 1, k - 1, start, stop):
+        yield _bars_to_parts(bars, n, k)
+
+
+def compositions(
+    n: int,
+    k: int,
+    /,
+    order: CompositionOrder = CompositionOrder.RANK,
+    count: int | None = None
+) -> Iterator[tuple[int, ...]]:
+    """
+    Lazily yield up to `count` distinct compositions of `n` into `k` parts.
+
+    Generalizes `utils.split_int` to more than two parts. With
+    `EXTREMES_FIRST` the k compositions that put all of `n` in one part are
+    yielded before random others, with `RANDOM` every composition is drawn at
+    random. Neither mode materializes the composition space.
+    """
+    total: int = composition_count(n, k)
+    if count is None or count > total:
+        count = total
+
+    if order is CompositionOrder.RANK:
+        yield from iter_compositions(n, k, 0, count)
+    elif order is CompositionOrder.RANDOM:
+        for rank in sample_ranks(total, count):
+            yield unrank_composition(rank, n, k)
+    elif order is CompositionOrder.EXTREMES_FIRST:
+        extremes: list[tuple[int, ...]] = []
+        for i in range(k):
+            extreme = (0,) * i + (n,) + (0,) * (k - i - 1)
+            if extreme not in extremes:
+                extremes.append(extreme)
+        extremes = extremes[:count]
+        yield from extremes
+
+        # `count` distinct ranks include at most len(extremes) extremes, so
+        # there are always enough others to make up the count
+        seen: set[int] = {rank_composition(e) for e in extremes}
+        remaining = count - len(extremes)
+        for rank in sample_ranks(total, count):
+            if remaining == 0:
+                break
+            if rank not in seen:
+                remaining -= 1
+                yield unrank_composition(rank, n, k)
+    else:
+        raise TypeError("Unknown composition order")
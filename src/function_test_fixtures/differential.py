@@ -0,0 +1,222 @@
+"""
+Check that two callables accept and reject exactly the same calls.
+
+Typical uses are checking that a decorator, a `functools.wraps` wrapper or a
+compatibility shim binds arguments like the function it stands in for.
+Both callables are called with the same arguments for each test case and
+their outcomes, returned or raised along with the exception type and a
+normalized message, are compared.
+"""
+
+import concurrent.futures
+import collections
+import dataclasses
+import inspect
+import itertools
+import os
+import re
+import time
+from typing import Any, Callable, Iterable, Iterator, Self
+
+from .arguments import TestCaseContainer
+from .cases import generate_test_cases
+from .parameter_stats import ParameterStats
+
+
+# `qualname()` prefix CPython puts on argument binding errors
+_CALLABLE_PREFIX = re.compile(r"^[\w.<>]+\(\)")
+_ADDRESS = re.compile(r"0x[0-9a-fA-F]+")
+
+
+def normalize_message(message: str, /) -> str:
+    """
+    Return an exception message with call specific details removed.
+
+    The name of the called function and object addresses are replaced, so
+    a wrapper raising the same error as the function it wraps compares
+    equal.
+    """
+    return _ADDRESS.sub('0x?', _CALLABLE_PREFIX.sub('<callable>()', message, count=1))
+
+
+@dataclasses.dataclass(frozen=True)
+class Outcome:
+    """How a call ended."""
+
+    exception_type: type[BaseException] | None = None
+    message: str | None = None
+    result: Any = dataclasses.field(default=None, compare=False)
+
+    @property
+    def returned(self: Self) -> bool:
+        """True if the call returned rather than raised."""
+        return self.exception_type is None
+
+
+@dataclasses.dataclass(frozen=True)
+class Mismatch:
+    """A test case the two callables handled differently."""
+
+    case: TestCaseContainer
+    first: Outcome
+    second: Outcome
+
+
+@dataclasses.dataclass
+class DifferentialReport:
+    """Results of `compare_callables`."""
+
+    # calls made to either callable, including those of batches that were
+    # already running when `max_mismatches` was reached
+    calls: int = 0
+    mismatches: list[Mismatch] = dataclasses.field(default_factory=list)
+    seconds: float = 0.0
+    # `max_mismatches` was reached before the cases were known to run out;
+    # cases are never read ahead to find out, so this is also set when the
+    # limit is reached in a final batch of exactly `batch_size` cases
+    stopped_early: bool = False
+
+    @property
+    def calls_per_second(self: Self) -> float:
+        """Calls made to both callables per second of wall time."""
+        return self.calls / self.seconds if self.seconds else 0.0
+
+    def __bool__(self: Self) -> bool:
+        """Return True if no mismatch was found."""
+        return not self.mismatches
+
+
+def call_outcome(
+    f: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    /
+) -> Outcome:
+    """Call `f` and return its outcome."""
+    try:
+        result = f(*args, **kwargs)
+    except Exception as e:
+        return Outcome(type(e), normalize_message(str(e)))
+    return Outcome(result=result)
+
+
+def _compare_batch(
+    first: Callable[..., Any],
+    second: Callable[..., Any],
+    stats: ParameterStats,
+    batch: list[TestCaseContainer],
+    compare_results: bool
+) -> list[Mismatch]:
+    mismatches: list[Mismatch] = []
+    for case in batch:
+        args, kwargs = case.call_arguments(stats)
+        a = call_outcome(first, args, kwargs)
+        b = call_outcome(second, args, kwargs)
+        if a != b or (compare_results and a.returned and a.result != b.result):
+            mismatches.append(Mismatch(case, a, b))
+    return mismatches
+
+
+def _batches(
+    cases: Iterable[TestCaseContainer],
+    size: int
+) -> Iterator[list[TestCaseContainer]]:
+    iterator = iter(cases)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def compare_callables(
+    first: Callable[..., Any],
+    second: Callable[..., Any],
+    /,
+    cases: Iterable[TestCaseContainer] | None = None,
+    *,
+    stats: ParameterStats | None = None,
+    batch_size: int = 256,
+    workers: int | None = 0,
+    max_mismatches: int | None = 1,
+    compare_results: bool = False
+) -> DifferentialReport:
+    """
+    Call `first` and `second` with each test case and compare the outcomes.
+
+    Keyword arguments are named using `stats`, by default the stats of
+    `first`'s signature, and `cases` defaults to `generate_test_cases` for
+    those stats. Outcomes match if both calls returned, or both raised the
+    same exception type with the same `normalize_message`. With
+    `compare_results` the returned values must also be equal.
+
+    Cases are handled in batches of `batch_size`. With `workers` other than
+    0 batches run on a thread pool of that many threads (`None` for the
+    default), so callables need not be picklable. Once `max_mismatches`
+    mismatches are found no more batches are started; pass `None` to check
+    every case. Mismatches are reported in case order.
+    """
+    if stats is None:
+        stats = ParameterStats(inspect.signature(first))
+    if cases is None:
+        cases = generate_test_cases(stats)
+    if batch_size < 1:
+        raise TypeError("`batch_size` must be at least 1")
+
+    report = DifferentialReport()
+    start = time.perf_counter()
+
+    def done() -> bool:
+        return max_mismatches is not None and len(report.mismatches) >= max_mismatches
+
+    def collect(batch: list[TestCaseContainer], mismatches: list[Mismatch]) -> None:
+        report.calls += 2 * len(batch)
+        report.mismatches.extend(mismatches)
+
+    batches = _batches(cases, batch_size)
+    in_flight: collections.deque[
+        tuple[list[TestCaseContainer], concurrent.futures.Future[list[Mismatch]]]
+    ] = collections.deque()
+
+    def drain(limit: int) -> None:
+        # collect in submission order to keep mismatches in case order
+        while len(in_flight) > limit and not done():
+            batch, future = in_flight.popleft()
+            collect(batch, future.result())
+
+    # a short batch is the last one, so the cases ran out with it
+    exhausted = False
+    cancelled = False
+    if workers == 0:
+        for batch in batches:
+            exhausted = len(batch) < batch_size
+            collect(batch, _compare_batch(first, second, stats, batch, compare_results))
+            if done():
+                break
+        else:
+            exhausted = True
+    else:
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            window = 2 * (workers or os.cpu_count() or 1)
+            for batch in batches:
+                exhausted = len(batch) < batch_size
+                in_flight.append((batch, executor.submit(
+                    _compare_batch, first, second, stats, batch, compare_results
+                )))
+                drain(window - 1)
+                if done():
+                    break
+            else:
+                exhausted = True
+            drain(0)
+            # batches already running make their calls anyway, so count them;
+            # mismatches past the limit are dropped below
+            while in_flight:
+                batch, future = in_flight.popleft()
+                if future.cancel():
+                    cancelled = True
+                else:
+                    collect(batch, future.result())
+
+    report.stopped_early = done() and (cancelled or not exhausted)
+    if max_mismatches is not None:
+        del report.mismatches[max_mismatches:]
+    report.seconds = time.perf_counter() - start
+    return report
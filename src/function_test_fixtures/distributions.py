@@ -0,0 +1,227 @@
+"""
+Parameter count distributions learned from real signatures.
+
+A `CorpusDistribution` keeps a histogram of parameter counts for each
+parameter kind, built from the `ParameterStats` of a corpus of functions.
+Its per kind `CountDistribution`s can be passed straight to
+`build_skeleton_signatures` as count arguments, and the histograms can be
+saved so a corpus only has to be scanned once.
+"""
+
+import collections
+import dataclasses
+import json
+import os
+import random
+from typing import Any, Iterable, Self
+
+from .constants_and_types import (
+    ParameterKind,
+    POSITIONAL_ONLY,
+    POSITIONAL_OR_KEYWORD,
+    KEYWORD_ONLY
+)
+from .parameter_stats import ParameterStats
+from .signature_gen import FLAG_PERMUTATION, _FLAG_INFO
+
+
+# position of each counted kind's flag in a flag permutation
+_FLAG_INDEX: dict[ParameterKind, int] = {
+    POSITIONAL_ONLY: 0,
+    POSITIONAL_OR_KEYWORD: 1,
+    KEYWORD_ONLY: 3,
+}
+
+# `build_skeleton_signatures` keyword for each counted kind
+_COUNT_ARGUMENT: dict[ParameterKind, str] = {
+    POSITIONAL_ONLY: 'positional_only',
+    POSITIONAL_OR_KEYWORD: 'positional_or_keyword',
+    KEYWORD_ONLY: 'keyword_only',
+}
+
+# a "some optional" run needs a required parameter and an optional one
+# between its ends, see `signature_gen._parameter_counts`
+_SOME_OPTIONAL_MINIMUM: int = 3
+
+_FORMAT_VERSION: int = 1
+
+
+class AliasSampler:
+    """
+    Draw indexes with probability proportional to their weights in O(1).
+
+    Uses Vose's alias method: building the tables is O(n), after which each
+    sample is one `random.randrange` and one `random.random` call.
+    """
+
+    probabilities: list[float]
+    aliases: list[int]
+
+    def __init__(self: Self, weights: Iterable[float], /) -> None:
+        """Build the probability and alias tables for `weights`."""
+        weights = list(weights)
+        total = sum(weights)
+        if not weights or total <= 0 or any(w < 0 for w in weights):
+            raise TypeError("`weights` must be non-negative with a positive sum")
+
+        n = len(weights)
+        scaled = [w * n / total for w in weights]
+        self.probabilities = [1.0] * n
+        self.aliases = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            under, over = small.pop(), large.pop()
+            self.probabilities[under] = scaled[under]
+            self.aliases[under] = over
+            scaled[over] -= 1.0 - scaled[under]
+            (small if scaled[over] < 1.0 else large).append(over)
+        # anything left over is 1 up to rounding error
+
+    def __len__(self: Self) -> int:
+        """Return the number of weights."""
+        return len(self.probabilities)
+
+    def sample(self: Self) -> int:
+        """Return a random index."""
+        i = random.randrange(len(self.probabilities))
+        return i if random.random() < self.probabilities[i] else self.aliases[i]
+
+
+@dataclasses.dataclass(frozen=True)
+class CountDistribution:
+    """
+    Distribution of the parameter count of one kind.
+
+    `histogram[n]` is how many signatures had `n` parameters of `kind`.
+    Instances are `COUNT` callables: called with a flag permutation they
+    return a count drawn from the histogram, restricted to counts the
+    permutation's flag for `kind` can use. Signatures without parameters of
+    `kind` never make it into a skeleton that asked for some, so zero counts
+    are never drawn.
+    """
+
+    kind: ParameterKind
+    histogram: tuple[int, ...]
+    _samplers: dict[int, AliasSampler | None] = dataclasses.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def minimum(self: Self, flag_perm: FLAG_PERMUTATION, /) -> int:
+        """Return the smallest count usable with the flag permutation."""
+        if flag_perm[_FLAG_INDEX[self.kind]] is _FLAG_INFO[self.kind][2]:
+            return _SOME_OPTIONAL_MINIMUM
+        return 1
+
+    def _sampler(self: Self, minimum: int, /) -> AliasSampler | None:
+        """Return a sampler over counts from `minimum` up, or None if there are none."""
+        try:
+            return self._samplers[minimum]
+        except KeyError:
+            weights = self.histogram[minimum:]
+            sampler = AliasSampler(weights) if any(weights) else None
+            self._samplers[minimum] = sampler
+            return sampler
+
+    def __call__(self: Self, flag_perm: FLAG_PERMUTATION, /) -> int:
+        """Return a count drawn for the flag permutation."""
+        minimum = self.minimum(flag_perm)
+        sampler = self._sampler(minimum)
+        if sampler is None:
+            # nothing in the corpus fits so use the smallest count that does
+            return minimum
+        return minimum + sampler.sample()
+
+
+class CorpusDistribution:
+    """Per kind parameter count distributions for a corpus of signatures."""
+
+    signatures: int
+    distributions: dict[ParameterKind, CountDistribution]
+
+    def __init__(
+        self: Self,
+        histograms: dict[ParameterKind, Iterable[int]],
+        /,
+        signatures: int
+    ) -> None:
+        """Use `histograms[kind][n]` signatures with `n` parameters of `kind`."""
+        self.signatures = signatures
+        self.distributions = {}
+        for kind in _COUNT_ARGUMENT:
+            histogram = list(histograms.get(kind, ()))
+            while histogram and not histogram[-1]:
+                histogram.pop()
+            self.distributions[kind] = CountDistribution(kind, tuple(histogram))
+
+    @classmethod
+    def from_stats(cls, corpus: Iterable[ParameterStats], /) -> Self:
+        """Build the distribution from the stats of each signature in a corpus."""
+        counters: dict[ParameterKind, collections.Counter[int]] = {
+            kind: collections.Counter() for kind in _COUNT_ARGUMENT
+        }
+        signatures = 0
+        for stats in corpus:
+            signatures += 1
+            for kind, counter in counters.items():
+                counter[stats.counters[kind]] += 1
+
+        return cls(
+            {
+                kind: [counter[n] for n in range(max(counter, default=-1) + 1)]
+                for kind, counter in counters.items()
+            },
+            signatures=signatures
+        )
+
+    def __getitem__(self: Self, kind: ParameterKind, /) -> CountDistribution:
+        """Return the distribution for `kind`."""
+        return self.distributions[kind]
+
+    def count_arguments(self: Self) -> dict[str, CountDistribution]:
+        """
+        Return the count keyword arguments for `build_skeleton_signatures`.
+
+        `build_skeleton_signatures(**corpus.count_arguments())` generates
+        skeletons with counts drawn from the corpus.
+        """
+        return {
+            _COUNT_ARGUMENT[kind]: distribution
+            for kind, distribution in self.distributions.items()
+        }
+
+    def to_json(self: Self) -> dict[str, Any]:
+        """Return a JSON serializable form of the histograms."""
+        return {
+            'version': _FORMAT_VERSION,
+            'signatures': self.signatures,
+            'histograms': {
+                kind.name: list(distribution.histogram)
+                for kind, distribution in self.distributions.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], /) -> Self:
+        """Inverse of `to_json`."""
+        if data.get('version') != _FORMAT_VERSION:
+            raise TypeError(f"Unsupported distribution version {data.get('version')!r}")
+        return cls(
+            {
+                ParameterKind[name]: histogram
+                for name, histogram in data['histograms'].items()
+            },
+            signatures=data['signatures']
+        )
+
+    def save(self: Self, path: str | os.PathLike[str], /) -> None:
+        """Write the histograms to `path` as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], /) -> Self:
+        """Read histograms written by `save`."""
+        with open(path, encoding='utf-8') as f:
+            return cls.from_json(json.load(f))
@@ -0,0 +1,398 @@
+"""
+Coverage guided fuzzing of code that handles signatures.
+
+`build_skeleton_signatures` samples skeletons blindly. `fuzz` instead keeps
+a corpus of shapes that reached new lines or branches of a target taking a
+function, such as an argument parser, dispatcher or serializer. Each step
+mutates a corpus shape by adding or removing a parameter, flipping a default
+or toggling ``*args`` or ``**kwargs``, calls the target with a stub of that
+shape and keeps the mutant if it reached anything new.
+
+Workers run in a process pool and share the corpus through a directory:
+each kept shape is written to its own file and every `sync_interval` steps
+workers run the shapes other workers found. Coverage needs `sys.monitoring`
+(Python 3.12+).
+"""
+
+import concurrent.futures
+import dataclasses
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any, Callable, Iterable, Self
+
+from .differential import Outcome
+from .monitoring import ARC, CoverageCollector
+from .signature_gen import SHAPE, SKELETON, skeleton_from_shape, skeleton_shape
+from .stubs import compile_stub
+
+
+EMPTY_SHAPE: SHAPE = (0, 0, 0, 0, False, 0, 0, False)
+
+
+def shape_parameter_count(shape: SHAPE, /) -> int:
+    """Return the number of named parameters of a shape."""
+    po_required, po_optional, pk_required, pk_optional, _, ko_count, _, _ = shape
+    return po_required + po_optional + pk_required + pk_optional + ko_count
+
+
+def is_valid_shape(shape: SHAPE, /) -> bool:
+    """
+    Return True if `shape` describes a signature Python accepts.
+
+    A required positional or keyword parameter may not follow an optional
+    positional only one.
+    """
+    po_required, po_optional, pk_required, pk_optional, _, \
+        ko_count, ko_mask, _ = shape
+    return (
+        min(po_required, po_optional, pk_required, pk_optional, ko_count) >= 0
+        and 0 <= ko_mask < 1 << ko_count
+        and not (po_optional and pk_required)
+    )
+
+
+def _insert_bit(mask: int, i: int, bit: bool) -> int:
+    low = mask & ((1 << i) - 1)
+    return low | bit << i | (mask >> i) << (i + 1)
+
+
+def _remove_bit(mask: int, i: int) -> int:
+    low = mask & ((1 << i) - 1)
+    return low | (mask >> (i + 1)) << i
+
+
+def add_parameter(shape: SHAPE, /, *, rng: random.Random | None = None) -> SHAPE:
+    """Add a required or optional parameter of a random kind."""
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+    rand = random.random if rng is None else rng.random
+    randrange = random.randrange if rng is None else rng.randrange
+    optional = rand() < 0.5
+    kind = randrange(3)
+    if kind == 0:
+        po_required += not optional
+        po_optional += optional
+    elif kind == 1:
+        pk_required += not optional
+        pk_optional += optional
+    else:
+        ko_mask = _insert_bit(ko_mask, randrange(ko_count + 1), optional)
+        ko_count += 1
+    return (
+        po_required, po_optional, pk_required, pk_optional, var_positional,
+        ko_count, ko_mask, var_keyword
+    )
+
+
+def remove_parameter(shape: SHAPE, /, *, rng: random.Random | None = None) -> SHAPE:
+    """Remove a random named parameter."""
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+    randrange = random.randrange if rng is None else rng.randrange
+    n = randrange(shape_parameter_count(shape) or 1)
+    if n < po_required:
+        po_required -= 1
+    elif (n := n - po_required) < po_optional:
+        po_optional -= 1
+    elif (n := n - po_optional) < pk_required:
+        pk_required -= 1
+    elif (n := n - pk_required) < pk_optional:
+        pk_optional -= 1
+    elif (n := n - pk_optional) < ko_count:
+        ko_mask = _remove_bit(ko_mask, n)
+        ko_count -= 1
+    return (
+        po_required, po_optional, pk_required, pk_optional, var_positional,
+        ko_count, ko_mask, var_keyword
+    )
+
+
+def flip_default(shape: SHAPE, /, *, rng: random.Random | None = None) -> SHAPE:
+    """
+    Make a random parameter optional if it is required and vice versa.
+
+    Positional parameters keep required before optional, so it is the last
+    required or first optional parameter of the run that changes.
+    """
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+    randrange = random.randrange if rng is None else rng.randrange
+    n = randrange(shape_parameter_count(shape) or 1)
+    if n < po_required:
+        po_required, po_optional = po_required - 1, po_optional + 1
+    elif (n := n - po_required) < po_optional:
+        po_required, po_optional = po_required + 1, po_optional - 1
+    elif (n := n - po_optional) < pk_required:
+        pk_required, pk_optional = pk_required - 1, pk_optional + 1
+    elif (n := n - pk_required) < pk_optional:
+        pk_required, pk_optional = pk_required + 1, pk_optional - 1
+    elif (n := n - pk_optional) < ko_count:
+        ko_mask ^= 1 << n
+    return (
+        po_required, po_optional, pk_required, pk_optional, var_positional,
+        ko_count, ko_mask, var_keyword
+    )
+
+
+def toggle_var_positional(
+    shape: SHAPE,
+    /,
+    *,
+    rng: random.Random | None = None
+) -> SHAPE:
+    """Add or remove ``*args``."""
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+    return (
+        po_required, po_optional, pk_required, pk_optional, not var_positional,
+        ko_count, ko_mask, var_keyword
+    )
+
+
+def toggle_var_keyword(shape: SHAPE, /, *, rng: random.Random | None = None) -> SHAPE:
+    """Add or remove ``**kwargs``."""
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+    return (
+        po_required, po_optional, pk_required, pk_optional, var_positional,
+        ko_count, ko_mask, not var_keyword
+    )
+
+
+# each takes a shape and an optional keyword `rng` to draw from
+MUTATIONS: tuple[Callable[..., SHAPE], ...] = (
+    add_parameter,
+    remove_parameter,
+    flip_default,
+    toggle_var_positional,
+    toggle_var_keyword,
+)
+
+
+def mutate(
+    shape: SHAPE,
+    /,
+    *,
+    max_parameters: int = 8,
+    attempts: int = 16,
+    rng: random.Random | None = None
+) -> SHAPE:
+    """
+    Return a random valid mutant of `shape` with at most `max_parameters`.
+
+    Returns `shape` itself if no such mutant is found in `attempts` tries.
+    Draws come from `rng`, by default the `random` module.
+    """
+    choice = random.choice if rng is None else rng.choice
+    for _ in range(attempts):
+        mutant = choice(MUTATIONS)(shape, rng=rng)
+        if (
+            mutant != shape
+            and is_valid_shape(mutant)
+            and shape_parameter_count(mutant) <= max_parameters
+        ):
+            return mutant
+    return shape
+
+
+class CorpusDirectory:
+    """
+    Shapes shared between fuzzing workers through a directory.
+
+    Each shape is a JSON file named after the shape and written atomically,
+    so workers can add and read shapes concurrently without locking.
+    """
+
+    path: Path
+    _read: set[str]
+
+    def __init__(self: Self, path: str | os.PathLike[str], /) -> None:
+        """Use the directory at `path`, creating it if needed."""
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._read = set()
+
+    @staticmethod
+    def _filename(shape: SHAPE) -> str:
+        return '-'.join(str(int(x)) for x in shape) + '.json'
+
+    def add(self: Self, shape: SHAPE, /) -> None:
+        """Write `shape` to the directory unless it is already there."""
+        name = self._filename(shape)
+        self._read.add(name)
+        target = self.path / name
+        if target.exists():
+            return
+        temporary = self.path / f'.{name}.{os.getpid()}.tmp'
+        temporary.write_text(json.dumps([int(x) for x in shape]), encoding='utf-8')
+        os.replace(temporary, target)
+
+    @staticmethod
+    def _read_shape(entry: Path, /) -> SHAPE | None:
+        """Return the shape in the file `entry`, or None if it holds no valid one."""
+        try:
+            data = json.loads(entry.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not (
+            isinstance(data, list)
+            and len(data) == len(EMPTY_SHAPE)
+            and all(isinstance(x, int) for x in data)
+        ):
+            return None
+        po_req, po_opt, pk_req, pk_opt, var_pos, ko, ko_mask, var_kw = data
+        shape: SHAPE = (
+            po_req, po_opt, pk_req, pk_opt, bool(var_pos), ko, ko_mask, bool(var_kw)
+        )
+        return shape if is_valid_shape(shape) else None
+
+    def new_shapes(self: Self) -> list[SHAPE]:
+        """
+        Return the shapes added since the last call, by anyone but this object.
+
+        Files that do not hold a valid shape, such as stray JSON files, are
+        skipped.
+        """
+        shapes: list[SHAPE] = []
+        for entry in sorted(self.path.glob('*.json')):
+            if entry.name in self._read:
+                continue
+            self._read.add(entry.name)
+            shape = self._read_shape(entry)
+            if shape is not None:
+                shapes.append(shape)
+        return shapes
+
+    def shapes(self: Self) -> list[SHAPE]:
+        """Return every shape in the directory."""
+        return CorpusDirectory(self.path).new_shapes()
+
+
+@dataclasses.dataclass
+class FuzzReport:
+    """What a fuzzing run executed and found."""
+
+    executions: int = 0
+    corpus: list[SHAPE] = dataclasses.field(default_factory=list)
+    coverage: set[ARC] = dataclasses.field(default_factory=set)
+    # shapes whose stub made the target raise, with the first such outcome
+    crashes: dict[SHAPE, Outcome] = dataclasses.field(default_factory=dict)
+
+    def merge(self: Self, other: 'FuzzReport', /) -> None:
+        """Add the results of another worker."""
+        self.executions += other.executions
+        self.coverage |= other.coverage
+        for shape, outcome in other.crashes.items():
+            self.crashes.setdefault(shape, outcome)
+
+
+def _fuzz_loop(
+    collector: CoverageCollector,
+    corpus: CorpusDirectory,
+    report: FuzzReport,
+    initial: tuple[SHAPE, ...],
+    iterations: int,
+    max_parameters: int,
+    sync_interval: int,
+    rng: random.Random
+) -> None:
+    """Run the fuzzing loop of one worker, drawing from `rng`."""
+    shapes: list[SHAPE] = []
+    executed: set[SHAPE] = set()
+
+    def execute(shape: SHAPE) -> bool:
+        executed.add(shape)
+        stub = compile_stub(skeleton_from_shape(shape))
+        outcome, _, new = collector.measure((stub,), {})
+        report.executions += 1
+        if not outcome.returned:
+            report.crashes.setdefault(shape, outcome)
+        return bool(new)
+
+    def sync() -> None:
+        for shape in corpus.new_shapes():
+            if shape not in executed:
+                execute(shape)
+                shapes.append(shape)
+
+    sync()
+    for shape in (EMPTY_SHAPE, *initial):
+        if shape not in executed and execute(shape):
+            corpus.add(shape)
+            shapes.append(shape)
+    if not shapes:
+        shapes.append(EMPTY_SHAPE)
+
+    for step in range(1, iterations + 1):
+        mutant = mutate(rng.choice(shapes), max_parameters=max_parameters, rng=rng)
+        if mutant not in executed and execute(mutant):
+            corpus.add(mutant)
+            shapes.append(mutant)
+        if step % sync_interval == 0:
+            sync()
+
+
+def _fuzz_worker(
+    target: Callable[..., Any],
+    path: str,
+    seed: str,
+    initial: tuple[SHAPE, ...],
+    iterations: int,
+    max_parameters: int,
+    sync_interval: int
+) -> FuzzReport:
+    report = FuzzReport()
+    with CoverageCollector(target) as collector:
+        _fuzz_loop(
+            collector, CorpusDirectory(path), report, initial,
+            iterations, max_parameters, sync_interval, random.Random(seed)
+        )
+        report.coverage = collector.seen
+    return report
+
+
+def fuzz(
+    target: Callable[..., Any],
+    directory: str | os.PathLike[str],
+    /,
+    *,
+    iterations: int = 1000,
+    workers: int | None = None,
+    seed: int | str = 0,
+    initial: Iterable[SKELETON] = (),
+    max_parameters: int = 8,
+    sync_interval: int = 50
+) -> FuzzReport:
+    """
+    Fuzz `target` with stubs of mutated shapes, keeping a corpus in `directory`.
+
+    `target` is called with a stub function from `compile_stub` and scored
+    by the lines and branches of its own code the call reached. Shapes
+    already in `directory`, e.g. from an earlier run, and `initial`
+    skeletons seed the corpus. Each of `workers` processes (one per CPU by
+    default) runs `iterations` steps drawing from a `random.Random` seeded by
+    `seed` and its number; with `workers=0` a single worker runs in this
+    process. In a process pool `target` must be picklable.
+    """
+    if sync_interval < 1:
+        raise TypeError("`sync_interval` must be at least 1")
+    path = os.fspath(directory)
+    shapes = tuple(skeleton_shape(skeleton) for skeleton in initial)
+    arguments = (shapes, iterations, max_parameters, sync_interval)
+
+    report = FuzzReport()
+    if workers == 0:
+        report.merge(_fuzz_worker(target, path, f'{seed}/0', *arguments))
+    else:
+        count = workers or os.cpu_count() or 1
+        with concurrent.futures.ProcessPoolExecutor(count) as executor:
+            futures = [
+                executor.submit(_fuzz_worker, target, path, f'{seed}/{n}', *arguments)
+                for n in range(count)
+            ]
+            for future in futures:
+                report.merge(future.result())
+    report.corpus = sorted(CorpusDirectory(path).shapes())
+    return report
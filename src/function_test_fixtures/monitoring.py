@@ -0,0 +1,217 @@
+"""
+Record which lines and branches of a function each test case reaches.
+
+Uses `sys.monitoring` (Python 3.12+), enabling events for the target's code
+object only. Each line reports once per call, as its callback returns
+`sys.monitoring.DISABLE`. A branch instruction is only disabled once both of
+its directions have been taken in the call, since disabling it disables
+both. Before each call the target's events are switched off and on again,
+which re-enables what was disabled for this tool and this code object only;
+`sys.monitoring.restart_events` would re-enable events of every tool in the
+process. On older Pythons constructing a `CoverageCollector` raises
+TypeError.
+
+Monitoring is process wide, so a collector must not be used from several
+threads at once.
+"""
+
+import dataclasses
+import sys
+from types import CodeType, TracebackType
+from typing import Any, Callable, Literal, Self, TypeAlias
+
+from .arguments import TestCaseContainer
+from .differential import Outcome, call_outcome
+from .parameter_stats import ParameterStats
+
+
+MONITORING_AVAILABLE: bool = hasattr(sys, 'monitoring')
+
+LINE_ARC: TypeAlias = tuple[Literal['line'], int]
+# ('branch', from offset, to offset)
+BRANCH_ARC: TypeAlias = tuple[Literal['branch'], int, int]
+ARC: TypeAlias = LINE_ARC | BRANCH_ARC
+
+_TOOL_NAME: str = 'function_test_fixtures'
+
+
+def target_code(target: Callable[..., Any], /) -> CodeType:
+    """Return the code object run when `target` is called."""
+    function = getattr(target, '__func__', target)
+    code = getattr(function, '__code__', None)
+    if code is None:
+        code = getattr(getattr(type(target), '__call__', None), '__code__', None)
+    if not isinstance(code, CodeType):
+        raise TypeError(f"{target!r} has no Python code object to monitor")
+    return code
+
+
+@dataclasses.dataclass(frozen=True)
+class CaseCoverage:
+    """Coverage of a single call."""
+
+    case: TestCaseContainer
+    outcome: Outcome
+    arcs: frozenset[ARC]
+    new: frozenset[ARC]
+
+    @property
+    def lines(self: Self) -> frozenset[int]:
+        """Line numbers reached."""
+        return frozenset(arc[1] for arc in self.arcs if arc[0] == 'line')
+
+    @property
+    def branches(self: Self) -> frozenset[tuple[int, int]]:
+        """(source, destination) bytecode offsets of branches taken."""
+        return frozenset(
+            (arc[1], arc[2]) for arc in self.arcs if arc[0] == 'branch'
+        )
+
+
+class CoverageCollector:
+    """
+    Collect per call line and branch coverage of `target`.
+
+    Use it as a context manager; `call` then runs one test case and returns
+    what it reached, including what no earlier call reached. `seen` holds
+    everything reached so far. `tool_id` defaults to the first free
+    `sys.monitoring` tool id.
+    """
+
+    target: Callable[..., Any]
+    code: CodeType
+    seen: set[ARC]
+    calls: int
+    _tool_id: int | None
+    _requested_tool_id: int | None
+    _current: set[ARC] | None
+    # destinations taken from each branch source during the current call
+    _destinations: dict[int, set[int]]
+
+    def __init__(
+        self: Self,
+        target: Callable[..., Any],
+        /,
+        *,
+        tool_id: int | None = None
+    ) -> None:
+        """Prepare to monitor `target`, optionally with a given tool id."""
+        if not MONITORING_AVAILABLE:
+            raise TypeError("Coverage collection needs sys.monitoring (Python 3.12+)")
+        self.target = target
+        self.code = target_code(target)
+        self.seen = set()
+        self.calls = 0
+        self._tool_id = None
+        self._requested_tool_id = tool_id
+        self._current = None
+        self._destinations = {}
+
+    def _line(self: Self, code: CodeType, line: int) -> object:
+        if self._current is not None:
+            self._current.add(('line', line))
+        return sys.monitoring.DISABLE
+
+    def _branch(self: Self, code: CodeType, source: int, destination: int) -> object:
+        if self._current is None:
+            return sys.monitoring.DISABLE
+        self._current.add(('branch', source, destination))
+        destinations = self._destinations.setdefault(source, set())
+        destinations.add(destination)
+        # a branch has two directions and disabling it stops both reporting
+        return sys.monitoring.DISABLE if len(destinations) > 1 else None
+
+    def start(self: Self) -> None:
+        """Claim a tool id and enable events on the target's code."""
+        if self._tool_id is not None:
+            return
+        monitoring = sys.monitoring
+        if self._requested_tool_id is not None:
+            candidates = [self._requested_tool_id]
+        else:
+            candidates = [i for i in range(6) if monitoring.get_tool(i) is None]
+        if not candidates:
+            raise TypeError("No free sys.monitoring tool id")
+        tool_id = candidates[0]
+        monitoring.use_tool_id(tool_id, _TOOL_NAME)
+        self._tool_id = tool_id
+        monitoring.register_callback(tool_id, monitoring.events.LINE, self._line)
+        monitoring.register_callback(tool_id, monitoring.events.BRANCH, self._branch)
+        self._enable_events()
+
+    def _enable_events(self: Self) -> None:
+        assert self._tool_id is not None
+        events = sys.monitoring.events
+        sys.monitoring.set_local_events(
+            self._tool_id, self.code, events.LINE | events.BRANCH
+        )
+
+    def stop(self: Self) -> None:
+        """Disable events and release the tool id."""
+        if self._tool_id is None:
+            return
+        monitoring = sys.monitoring
+        monitoring.set_local_events(
+            self._tool_id, self.code, monitoring.events.NO_EVENTS
+        )
+        monitoring.register_callback(self._tool_id, monitoring.events.LINE, None)
+        monitoring.register_callback(self._tool_id, monitoring.events.BRANCH, None)
+        monitoring.free_tool_id(self._tool_id)
+        self._tool_id = None
+
+    def __enter__(self: Self) -> Self:
+        """Start collecting."""
+        self.start()
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Stop collecting."""
+        self.stop()
+
+    def measure(
+        self: Self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        /
+    ) -> tuple[Outcome, frozenset[ARC], frozenset[ARC]]:
+        """
+        Call the target with `args` and `kwargs`.
+
+        Returns the outcome, the arcs reached and those of them no earlier
+        call reached.
+        """
+        if self._tool_id is None:
+            raise TypeError("CoverageCollector is not started")
+        arcs: set[ARC] = set()
+        # switching this tool's events off and on re-enables disabled ones
+        sys.monitoring.set_local_events(
+            self._tool_id, self.code, sys.monitoring.events.NO_EVENTS
+        )
+        self._enable_events()
+        self._current = arcs
+        self._destinations = {}
+        try:
+            outcome = call_outcome(self.target, args, kwargs)
+        finally:
+            self._current = None
+        new = arcs - self.seen
+        self.seen |= new
+        self.calls += 1
+        return outcome, frozenset(arcs), frozenset(new)
+
+    def call(
+        self: Self,
+        case: TestCaseContainer,
+        stats: ParameterStats,
+        /
+    ) -> CaseCoverage:
+        """Call the target with `case`, naming keywords using `stats`."""
+        if self._tool_id is None:
+            raise TypeError("CoverageCollector is not started")
+        args, kwargs = case.call_arguments(stats)
+        return CaseCoverage(case, *self.measure(args, kwargs))
@@ -0,0 +1,74 @@
+"""
+Reorder test cases so the most different ones run first.
+
+When a run stops at the first failure, trying cases that exercise different
+argument mixes early finds a failure sooner than running near duplicates
+back to back. `farthest_first` greedily picks the case farthest from every
+case already yielded, looking only a bounded window ahead so it streams.
+"""
+
+from typing import Iterable, Iterator
+
+from .arguments import TestCaseContainer
+from .cases import CaseCoordinates, case_coordinates
+
+
+def coordinate_distance(a: CaseCoordinates, b: CaseCoordinates, /) -> int:
+    """
+    Return the L1 distance between two cases' coordinates.
+
+    This counts the differences in arguments of each kind, in how
+    positional/keyword arguments are split and in extra arguments.
+    """
+    return sum(abs(x - y) for x, y in zip(a, b))
+
+
+def farthest_first(
+    cases: Iterable[TestCaseContainer],
+    /,
+    *,
+    window: int = 64
+) -> Iterator[TestCaseContainer]:
+    """
+    Yield `cases` reordered for diversity.
+
+    Up to `window` cases are buffered; each step yields the buffered case
+    whose coordinates are farthest from those of every case yielded so far,
+    the earliest one on ties, and refills the buffer. Every case is yielded
+    exactly once and memory is bounded by `window` plus the number of
+    distinct coordinates seen. With `window=1` the order is unchanged.
+    """
+    if window < 1:
+        raise TypeError("`window` must be at least 1")
+
+    iterator = iter(cases)
+    buffer: list[tuple[TestCaseContainer, CaseCoordinates]] = []
+    yielded: set[CaseCoordinates] = set()
+    # distance from each buffered coordinate to the nearest yielded one
+    nearest: dict[CaseCoordinates, float] = {}
+
+    def fill() -> None:
+        for case in iterator:
+            coordinates = case_coordinates(case)
+            buffer.append((case, coordinates))
+            if coordinates not in nearest:
+                nearest[coordinates] = min(
+                    (coordinate_distance(coordinates, y) for y in yielded),
+                    default=float('inf')
+                )
+            if len(buffer) >= window:
+                return
+
+    fill()
+    while buffer:
+        best = max(range(len(buffer)), key=lambda i: (nearest[buffer[i][1]], -i))
+        case, coordinates = buffer.pop(best)
+        yield case
+
+        if coordinates not in yielded:
+            yielded.add(coordinates)
+            for c in nearest:
+                nearest[c] = min(nearest[c], coordinate_distance(c, coordinates))
+        fill()
+        if not any(c == coordinates for _, c in buffer):
+            del nearest[coordinates]
@@ -1,5 +1,6 @@
 """ParameterRanges class."""
 
+import random
 from typing import Self
 from .parameter_stats import ParameterStats
 from .constants_and_types import ParameterKind, NON_VAR_PARAM_TYPES
@@ -12,15 +13,43 @@ class ParameterRanges:
     _internal: dict[ParameterKind, tuple[int, ...]]
 
 
-    def __init__(self: Self, stats: ParameterStats) -> None:
-        """Initialize ParameterRanges using ParameterStats object stats."""
-        self._internal = {
-            pt: utils.test_range(
-                stats.required_counters[pt],
-                stats.counters[pt]
-            )
-            for pt in NON_VAR_PARAM_TYPES
-        }
+    def __init__(
+        self: Self,
+        stats: ParameterStats,
+        *,
+        k: int | None = None,
+        rng: random.Random | None = None
+    ) -> None:
+        """
+        Initialize ParameterRanges using ParameterStats object stats.
+
+        By default each range holds the bounds and one random value between
+        them. If `k` is passed a value is drawn from each of `k` strata
+        between the bounds instead. Values are drawn from `rng`, by default
+        the `random` module's generator.
+        """
+        # draw in a fixed order; iterating the set directly would depend on
+        # string hashing and so differ between processes
+        kinds = sorted(NON_VAR_PARAM_TYPES, key=lambda pt: pt.value)
+        if k is None:
+            self._internal = {
+                pt: utils.test_range(
+                    stats.required_counters[pt],
+                    stats.counters[pt],
+                    rng=rng
+                )
+                for pt in kinds
+            }
+        else:
+            self._internal = {
+                pt: utils.test_stratified_range(
+                    stats.required_counters[pt],
+                    stats.counters[pt],
+                    k,
+                    rng=rng
+                )
+                for pt in kinds
+            }
 
     def __getitem__(self: Self, key: ParameterKind) -> tuple[int,...]:
         """Return the test range associated with the parameter kind used as key."""
@@ -1,8 +1,12 @@
 """The ParameterStats class."""
 
+import dataclasses
+import enum
 import inspect
+import itertools
+import math
 import random
-from typing import Self, Iterator
+from typing import Self, Iterable, Iterator
 
 from .constants_and_types import (
     NON_VAR_PARAM_TYPES,
@@ -21,6 +25,13 @@ from .arguments import (
     TestPositionalExtra,
     TestKeywordExtra
 )
+from .signature_gen import (
+    SHAPE,
+    SKELETON,
+    is_optional,
+    skeleton_parameter_names
+)
+from . import combinatorics, utils
 
 
 PARAMETER_KIND_MAP = {
@@ -32,6 +43,27 @@ PARAMETER_KIND_MAP = {
 }
 
 
+class SplitMove(enum.Enum):
+    """Ways a positional/keyword split can change between consecutive cases."""
+
+    ADD_KEYWORD = 1
+    REMOVE_KEYWORD = 2
+    KEYWORD_TO_POSITIONAL = 3
+
+
+@dataclasses.dataclass(frozen=True, init=True, eq=True)
+class SplitDelta:
+    """
+    A single change to a positional/keyword split.
+
+    `n` matches `TestPositionalOrKeyword.n` for the parameter being changed.
+    A `KEYWORD_TO_POSITIONAL` move always appends to the positional arguments.
+    """
+
+    move: SplitMove
+    n: int
+
+
 class ParameterStats:
     """Encapsulsates stats for a function signature."""
 
@@ -44,24 +76,61 @@ class ParameterStats:
     counters: dict[ParameterKind, int]
     optional_counters: dict[ParameterKind, int]
     required_counters: dict[ParameterKind, int]
-    ko_required: tuple[int, ...]
-    ko_optional: tuple[int, ...]
+    ko_required_mask: int
+    ko_optional_mask: int
+    positional_or_keyword_names: tuple[str, ...]
+    keyword_only_names: tuple[str, ...]
     no_parameters: int
 
 
     def __init__(self: Self, signature: inspect.Signature) -> None:
+        self._build(
+            (name, PARAMETER_KIND_MAP[p.kind], p.default is not p.empty)
+            for name, p in signature.parameters.items()
+        )
+
+    @classmethod
+    def from_parameters(
+        cls,
+        parameters: Iterable[tuple[str, ParameterKind, bool]],
+        /
+    ) -> Self:
+        """
+        Build stats from `(name, kind, has_default)` triples.
+
+        For callers, like the source scanner, that know a signature's
+        parameters without an `inspect.Signature`.
+        """
+        stats = cls.__new__(cls)
+        stats._build(parameters)
+        return stats
+
+    @classmethod
+    def from_skeleton(cls, skeleton: SKELETON, /) -> Self:
+        """Build stats for a skeleton, naming parameters with its pooled names."""
+        return cls.from_parameters(
+            (name, p.kind, is_optional(p))
+            for p, name in zip(skeleton, skeleton_parameter_names(skeleton))
+        )
+
+    def _build(
+        self: Self,
+        parameters: Iterable[tuple[str, ParameterKind, bool]],
+        /
+    ) -> None:
         self.counters = {pt: 0 for pt in NON_VAR_PARAM_TYPES}
         self.optional_counters = {pt: 0 for pt in NON_VAR_PARAM_TYPES}
         self.required_counters = {pt: 0 for pt in NON_VAR_PARAM_TYPES}
-        self.no_parameters = len(signature.parameters) == 0
+        self.no_parameters = True
 
-        ko_required: list[int] = list()
-        ko_optional: list[int] = list()
+        # bit n is set if the nth keyword only parameter is optional
+        ko_optional_mask: int = 0
         ko_counter: int = 0
+        pk_names: list[str] = []
+        ko_names: list[str] = []
 
-        for name, parameter in signature.parameters.items():
-            param_kind: ParameterKind = PARAMETER_KIND_MAP[parameter.kind]
-            has_default: bool = parameter.default == parameter.empty
+        for name, param_kind, has_default in parameters:
+            self.no_parameters = False
 
             if param_kind in NON_VAR_PARAM_TYPES:
                 self.counters[param_kind] += 1
@@ -72,49 +141,179 @@ class ParameterStats:
 
                 if param_kind == KEYWORD_ONLY:
                     if has_default:
-                        ko_optional.append(ko_counter)
-                    else:
-                        ko_required.append(ko_counter)
+                        ko_optional_mask |= 1 << ko_counter
                     ko_counter += 1
+                    ko_names.append(name)
+                elif param_kind == POSITIONAL_OR_KEYWORD:
+                    pk_names.append(name)
             elif param_kind == ParameterKind.VAR_POSITIONAL:
                 self.uses_var_positional = True
             elif param_kind == ParameterKind.VAR_KEYWORD:
                 self.uses_var_keyword = True
 
-        self.ko_required = tuple(ko_required)
-        self.ko_optional = tuple(ko_optional)
+        self.ko_optional_mask = ko_optional_mask
+        self.ko_required_mask = ((1 << ko_counter) - 1) ^ ko_optional_mask
+        self.positional_or_keyword_names = tuple(pk_names)
+        self.keyword_only_names = tuple(ko_names)
 
         self.uses_positional_only = self.counters[POSITIONAL_ONLY] > 0
         self.uses_keyword_only = self.counters[KEYWORD_ONLY] > 0
         self.uses_keyword_or_positional = self.counters[POSITIONAL_OR_KEYWORD] > 0
 
-    def test_keyword_gen(self: Self, ko : int, /) -> Iterator[ArgumentBase]:
+    @property
+    def shape(self: Self) -> SHAPE:
+        """
+        The signature's shape, as returned by `signature_gen.skeleton_shape`.
+
+        Signatures with equal shapes get the same test cases, whatever their
+        parameters are called.
+        """
+        return (
+            self.required_counters[POSITIONAL_ONLY],
+            self.optional_counters[POSITIONAL_ONLY],
+            self.required_counters[POSITIONAL_OR_KEYWORD],
+            self.optional_counters[POSITIONAL_OR_KEYWORD],
+            self.uses_var_positional,
+            self.counters[KEYWORD_ONLY],
+            self.ko_optional_mask,
+            self.uses_var_keyword
+        )
+
+    @property
+    def ko_required(self: Self) -> tuple[int, ...]:
+        """Indices of the required keyword only parameters."""
+        return tuple(utils.bit_indices(self.ko_required_mask))
+
+    @property
+    def ko_optional(self: Self) -> tuple[int, ...]:
+        """Indices of the optional keyword only parameters."""
+        return tuple(utils.bit_indices(self.ko_optional_mask))
+
+    def keyword_mask(
+        self: Self,
+        ko : int,
+        /,
+        *,
+        rng: random.Random | None = None
+    ) -> int:
+        """
+        Return a mask of `ko` keyword only parameters to supply in a call.
+
+        Required parameters are always picked before optional ones, which are
+        then chosen at random using `rng`, by default the `random` module.
+        """
         assert 0 <= ko <= self.counters[KEYWORD_ONLY]
 
+        required_count = self.required_counters[KEYWORD_ONLY]
+
+        if ko == self.counters[KEYWORD_ONLY]:
+            # Don't over think this case, everything is being used
+            return self.ko_required_mask | self.ko_optional_mask
+        elif ko < required_count:
+            return utils.random_submask(self.ko_required_mask, ko, rng=rng)
+        else:
+            # first make sure we have required parameters and then add in
+            # random optional parameters to make up the count
+            return self.ko_required_mask | utils.random_submask(
+                self.ko_optional_mask,
+                ko - required_count,
+                rng=rng
+            )
+
+    def test_keyword_gen(
+        self: Self,
+        ko : int,
+        /,
+        *,
+        rng: random.Random | None = None
+    ) -> Iterator[ArgumentBase]:
         if ko > 0:
-            seq: list[int] = []
-            required_count = len(self.ko_required)
+            mask = self.keyword_mask(ko, rng=rng)
+            yield from (TestKeyword(n + 1) for n in utils.bit_indices(mask))
 
-            if ko == self.counters[KEYWORD_ONLY]:
-                # Don't over think this case, everything is being used
-                seq.extend(range(self.counters[KEYWORD_ONLY]))
-            elif ko < required_count:
-                seq.extend(random.sample(self.ko_required, k=ko))
-            else:
-                # first make sure we have required parameters
-                seq.extend(self.ko_required)
-                if ko > required_count:
-                    # now add in random optional parameters to make up the count
-                    remaining = ko - required_count
-                    seq.extend(random.sample(self.ko_optional, k=remaining))
+    def _keyword_subset_pool(self: Self, ko : int, /) -> tuple[int, int, int]:
+        """
+        Return the fixed mask, pool mask and subset size for `ko` keywords.
 
-            yield from (TestKeyword(n + 1) for n in seq)
+        Every mask `keyword_mask` can return for `ko` is the fixed mask plus
+        a subset of the pool mask of the returned size.
+        """
+        assert 0 <= ko <= self.counters[KEYWORD_ONLY]
+
+        required_count = self.required_counters[KEYWORD_ONLY]
+        if ko < required_count:
+            return 0, self.ko_required_mask, ko
+        else:
+            return self.ko_required_mask, self.ko_optional_mask, ko - required_count
+
+    def keyword_mask_count(self: Self, ko : int, /) -> int:
+        """Return the number of distinct masks `keyword_mask` may return for `ko`."""
+        _, pool, k = self._keyword_subset_pool(ko)
+        return math.comb(pool.bit_count(), k)
+
+    def keyword_mask_rank(self: Self, ko : int, mask : int, /) -> int:
+        """Return the rank of a mask returned by `keyword_mask` for `ko`."""
+        _, pool, k = self._keyword_subset_pool(ko)
+        position_index = {p: i for i, p in enumerate(utils.bit_indices(pool))}
+        return combinatorics.rank_combination(
+            [position_index[n] for n in utils.bit_indices(mask & pool)]
+        )
+
+    def keyword_mask_unrank(self: Self, ko : int, rank : int, /) -> int:
+        """
+        Return the keyword mask for `ko` keywords with the given rank.
+
+        Masks are ranked by the subset of optional (or, if `ko` is less than
+        the number of required keyword only parameters, required) parameters
+        they pick using the combinatorial number system.
+        """
+        fixed, pool, k = self._keyword_subset_pool(ko)
+        positions = utils.bit_indices(pool)
+        combination = combinatorics.unrank_combination(rank, k, len(positions))
+        return fixed | utils.mask_from_indices(
+            (positions[c] for c in combination),
+            self.counters[KEYWORD_ONLY]
+        )
+
+    def iter_keyword_masks(
+        self: Self,
+        ko : int,
+        /,
+        start : int = 0,
+        stop : int | None = None
+    ) -> Iterator[int]:
+        """
+        Lazily yield the keyword masks for `ko` with ranks in start..stop-1.
+
+        Shards can walk disjoint rank ranges to cover every mask exactly once.
+        """
+        fixed, pool, k = self._keyword_subset_pool(ko)
+        positions = utils.bit_indices(pool)
+        n = self.counters[KEYWORD_ONLY]
+        for combination in combinatorics.iter_combinations(
+            len(positions), k, start, stop
+        ):
+            yield fixed | utils.mask_from_indices(
+                (positions[c] for c in combination), n
+            )
+
+    def test_keyword_enum(
+        self: Self,
+        ko : int,
+        /,
+        start : int = 0,
+        stop : int | None = None
+    ) -> Iterator[tuple[ArgumentBase, ...]]:
+        """Deterministic counterpart of `test_keyword_gen` over a rank range."""
+        for mask in self.iter_keyword_masks(ko, start, stop):
+            yield tuple(TestKeyword(n + 1) for n in utils.bit_indices(mask))
 
     def test_keyword_or_positional_gen(
         self: Self,
         *,
         as_pos : int,
-        as_kw : int
+        as_kw : int,
+        rng: random.Random | None = None
     ) -> Iterator[ArgumentBase]:
 
         assert (
@@ -144,10 +343,92 @@ class ParameterStats:
                 # parameters with a default value
                 count = self.counters[POSITIONAL_OR_KEYWORD]
                 sample_space: range = range(as_pos + kw_wo_defaults, count)
-                seq.extend(random.sample(sample_space, k=as_kw - kw_wo_defaults))
+                sample = random.sample if rng is None else rng.sample
+                seq.extend(sample(sample_space, k=as_kw - kw_wo_defaults))
 
             yield from (TestPositionalOrKeyword(n+1, True) for n in seq)
 
+    def keyword_or_positional_split_count(self: Self) -> int:
+        """Return the number of valid positional/keyword splits."""
+        count = self.counters[POSITIONAL_OR_KEYWORD]
+        required = self.required_counters[POSITIONAL_OR_KEYWORD]
+        return sum(1 << (count - max(p, required)) for p in range(count + 1))
+
+    def _keyword_or_positional_gray_start(self: Self) -> int:
+        """Return the keyword mask of the first split in Gray code order."""
+        count = self.counters[POSITIONAL_OR_KEYWORD]
+        required = self.required_counters[POSITIONAL_OR_KEYWORD]
+
+        # the blocks before `required` parameters are positional alternate
+        # direction and must leave the free bits clear for the block after
+        mask = (1 << required) - 1
+        if required % 2 == 1 and required < count:
+            mask |= 1 << required
+        return mask
+
+    def keyword_or_positional_gray_deltas(self: Self) -> Iterator[SplitDelta]:
+        """
+        Yield the changes between consecutive splits in Gray code order.
+
+        The first split passes no positional/keyword parameters positionally
+        and passes the parameters set in the mask from
+        `keyword_or_positional_gray_splits` as keywords. Every valid split is
+        then reached exactly once by applying one delta at a time, so the
+        caller only ever touches one keyword and at most one positional
+        argument between cases.
+
+        Splits are walked in blocks by the number of positional parameters.
+        Within a block the optional parameters that may be keywords follow a
+        reflected Gray code whose top bit is the next parameter to become
+        positional, so each block ends with it set as a keyword.
+        """
+        count = self.counters[POSITIONAL_OR_KEYWORD]
+        required = self.required_counters[POSITIONAL_OR_KEYWORD]
+        mask = self._keyword_or_positional_gray_start()
+
+        for p in range(count + 1):
+            for j in combinatorics.gray_code_flips(count - max(p, required)):
+                # bit j of the Gray code is parameter count - 1 - j
+                n = count - 1 - j
+                mask ^= 1 << n
+                if mask >> n & 1:
+                    yield SplitDelta(SplitMove.ADD_KEYWORD, n + 1)
+                else:
+                    yield SplitDelta(SplitMove.REMOVE_KEYWORD, n + 1)
+
+            if p < count:
+                mask ^= 1 << p
+                yield SplitDelta(SplitMove.KEYWORD_TO_POSITIONAL, p + 1)
+
+    def keyword_or_positional_gray_splits(self: Self) -> Iterator[tuple[int, int]]:
+        """
+        Yield every valid split in Gray code order.
+
+        Splits are `(as_pos, mask)` pairs where the first `as_pos`
+        positional/keyword parameters are passed positionally and bit `n` of
+        `mask` is set if the nth parameter is passed as a keyword.
+        """
+        as_pos = 0
+        mask = self._keyword_or_positional_gray_start()
+        yield as_pos, mask
+
+        for delta in self.keyword_or_positional_gray_deltas():
+            if delta.move is SplitMove.KEYWORD_TO_POSITIONAL:
+                as_pos += 1
+            mask ^= 1 << (delta.n - 1)
+            yield as_pos, mask
+
+    def test_keyword_or_positional_gray(
+        self: Self
+    ) -> Iterator[tuple[ArgumentBase, ...]]:
+        """Yield the arguments of every valid split in Gray code order."""
+        for as_pos, mask in self.keyword_or_positional_gray_splits():
+            yield tuple(itertools.chain(
+                (TestPositionalOrKeyword(n + 1, False) for n in range(as_pos)),
+                (TestPositionalOrKeyword(n + 1, True)
+                 for n in utils.bit_indices(mask))
+            ))
+
     def test_positional_gen(self: Self, po : int, /) -> Iterator[ArgumentBase]:
         assert 0 <= po <= self.counters[POSITIONAL_ONLY]
 
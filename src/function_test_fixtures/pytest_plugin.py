@@ -0,0 +1,253 @@
+"""
+Pytest plugin that parametrizes tests over generated skeletons lazily.
+
+Enable it with ``-p function_test_fixtures.pytest_plugin`` or with
+``pytest_plugins = ['function_test_fixtures.pytest_plugin']`` in a root
+``conftest.py``. It is not registered as an entry point, so it never loads
+into pytest runs that did not ask for it. Mark tests with
+``skeleton_stream``, whose keyword arguments are those of `FixtureStream`
+plus ``extras`` and ``k`` for `generate_test_cases` and
+``cases_per_skeleton``::
+
+    @pytest.mark.skeleton_stream(seed=1, flag=ParameterFlag.KEYWORD_ONLY_SOME_OPTIONAL)
+    def test_skeleton(fixture_skeleton):
+        for case in fixture_skeleton.cases:
+            ...
+
+    @pytest.mark.skeleton_stream(seed=1, cases_per_skeleton=64)
+    def test_case(fixture_case):
+        ...
+
+Collection only computes how many skeletons there are and parametrizes by
+index; each skeleton and its cases are generated when a test needs them.
+``fixture_case`` tests get a slot per case index, and slots past the end of
+a skeleton's cases are skipped.
+
+With ``--fixture-shard i/n`` only indices equal to i modulo n are collected.
+Under pytest-xdist every worker must collect the same tests, so instead each
+index is put in the ``xdist_group`` for its index modulo the worker count;
+run with ``--dist loadgroup`` to give each worker a fixed share.
+"""
+
+import dataclasses
+import os
+import time
+from typing import Any, Iterator, Mapping, Self
+
+import pytest
+
+from .arguments import TestCaseContainer
+from .parameter_stats import ParameterStats
+from .signature_gen import RLESkeleton
+from .stream import FixtureStream
+
+
+MARKER: str = 'skeleton_stream'
+
+_CASE_ARGUMENTS: frozenset[str] = frozenset({'extras', 'k'})
+
+
+@dataclasses.dataclass
+class PluginStats:
+    """Collection and materialization counts for the terminal summary."""
+
+    indices: int = 0
+    collection_seconds: float = 0.0
+    skeletons: int = 0
+    cases: int = 0
+    materialization_seconds: float = 0.0
+
+
+@dataclasses.dataclass(frozen=True)
+class SkeletonFixture:
+    """A skeleton from a `skeleton_stream` with its stats and test cases."""
+
+    index: int
+    skeleton: RLESkeleton
+    stats: ParameterStats
+    cases: tuple[TestCaseContainer, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class CaseFixture:
+    """A single test case of a skeleton from a `skeleton_stream`."""
+
+    skeleton: SkeletonFixture
+    index: int
+    case: TestCaseContainer
+
+
+_STATS_KEY = pytest.StashKey[PluginStats]()
+_STREAMS_KEY = pytest.StashKey[dict[tuple[Any, ...], '_StreamCache']]()
+
+
+class _StreamCache:
+    """A stream and the most recently materialized skeleton fixture."""
+
+    stream: FixtureStream
+    case_arguments: dict[str, Any]
+    _last: SkeletonFixture | None
+
+    def __init__(self: Self, marker_arguments: Mapping[str, Any]) -> None:
+        """Build the stream and case arguments from a marker's arguments."""
+        arguments = dict(marker_arguments)
+        arguments.pop('cases_per_skeleton', None)
+        self.case_arguments = {
+            name: arguments.pop(name)
+            for name in _CASE_ARGUMENTS if name in arguments
+        }
+        self.stream = FixtureStream(arguments.pop('seed', 0), **arguments)
+        self._last = None
+
+    def skeleton(self: Self, index: int, stats: PluginStats, /) -> SkeletonFixture:
+        """Return the fixture for skeleton `index`, generating it if needed."""
+        if self._last is None or self._last.index != index:
+            start = time.perf_counter()
+            skeleton = self.stream[index]
+            cases = tuple(
+                self.stream.test_cases(index, skeleton, **self.case_arguments)
+            )
+            self._last = SkeletonFixture(
+                index,
+                skeleton,
+                ParameterStats.from_skeleton(skeleton),
+                cases
+            )
+            stats.skeletons += 1
+            stats.cases += len(cases)
+            stats.materialization_seconds += time.perf_counter() - start
+        return self._last
+
+
+def _parse_shard(value: str) -> tuple[int, int]:
+    i, n = map(int, value.split('/'))
+    if not 0 <= i < n:
+        raise TypeError("shard index must be in range 0..n-1")
+    return i, n
+
+
+def _key(arguments: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple(sorted(arguments.items()))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the ``--fixture-shard`` option."""
+    group = parser.getgroup('function_test_fixtures')
+    group.addoption(
+        '--fixture-shard',
+        type=_parse_shard,
+        default=None,
+        metavar='i/n',
+        help="only collect skeleton indices equal to i modulo n"
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the marker and set up the plugin's state."""
+    config.addinivalue_line(
+        'markers',
+        f"{MARKER}(**kwargs): parametrize `fixture_skeleton` or `fixture_case` "
+        "over a `FixtureStream` built from kwargs"
+    )
+    config.stash[_STATS_KEY] = PluginStats()
+    config.stash[_STREAMS_KEY] = {}
+
+
+def _stream_cache(
+    config: pytest.Config,
+    arguments: Mapping[str, Any]
+) -> _StreamCache:
+    streams = config.stash[_STREAMS_KEY]
+    key = _key(arguments)
+    if key not in streams:
+        streams[key] = _StreamCache(arguments)
+    return streams[key]
+
+
+def _indices(config: pytest.Config, count: int) -> Iterator[tuple[int, list[Any]]]:
+    """Yield this process's skeleton indices with the marks for each."""
+    shard = config.getoption('fixture_shard')
+    workers = int(os.environ.get('PYTEST_XDIST_WORKER_COUNT', 0))
+    for index in range(count):
+        if shard is not None and index % shard[1] != shard[0]:
+            continue
+        marks = []
+        if workers:
+            marks.append(pytest.mark.xdist_group(f'fixture-shard-{index % workers}'))
+        yield index, marks
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize marked tests by skeleton index, and case slot if needed."""
+    marker = metafunc.definition.get_closest_marker(MARKER)
+    if marker is None:
+        return
+
+    start = time.perf_counter()
+    config = metafunc.config
+    cache = _stream_cache(config, marker.kwargs)
+    stats = config.stash[_STATS_KEY]
+    count = len(cache.stream)
+
+    if 'fixture_case' in metafunc.fixturenames:
+        slots = marker.kwargs.get('cases_per_skeleton')
+        if slots is None:
+            raise TypeError("`fixture_case` tests need `cases_per_skeleton`")
+        params = [
+            pytest.param(
+                (marker.kwargs, index, slot), id=f's{index}-c{slot}', marks=marks
+            )
+            for index, marks in _indices(config, count)
+            for slot in range(slots)
+        ]
+        metafunc.parametrize('fixture_case', params, indirect=True)
+    elif 'fixture_skeleton' in metafunc.fixturenames:
+        params = [
+            pytest.param((marker.kwargs, index), id=f's{index}', marks=marks)
+            for index, marks in _indices(config, count)
+        ]
+        metafunc.parametrize('fixture_skeleton', params, indirect=True)
+    else:
+        return
+
+    stats.indices += len(params)
+    stats.collection_seconds += time.perf_counter() - start
+
+
+@pytest.fixture
+def fixture_skeleton(request: pytest.FixtureRequest) -> SkeletonFixture:
+    """Return the skeleton for this test's index, generated on first use."""
+    arguments, index = request.param
+    cache = _stream_cache(request.config, arguments)
+    return cache.skeleton(index, request.config.stash[_STATS_KEY])
+
+
+@pytest.fixture
+def fixture_case(request: pytest.FixtureRequest) -> CaseFixture:
+    """Return the case for this test's skeleton and case index."""
+    arguments, index, slot = request.param
+    cache = _stream_cache(request.config, arguments)
+    skeleton = cache.skeleton(index, request.config.stash[_STATS_KEY])
+    if slot >= len(skeleton.cases):
+        pytest.skip(f"skeleton {index} has {len(skeleton.cases)} cases")
+    return CaseFixture(skeleton, slot, skeleton.cases[slot])
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter,
+    config: pytest.Config
+) -> None:
+    """Report collection and generation counts and times."""
+    stats = config.stash.get(_STATS_KEY, None)
+    if stats is None or not stats.indices:
+        return
+    terminalreporter.write_sep('-', 'function_test_fixtures')
+    terminalreporter.write_line(
+        f"collected {stats.indices} skeleton indices in "
+        f"{stats.collection_seconds * 1000:.1f}ms"
+    )
+    terminalreporter.write_line(
+        f"generated {stats.skeletons} skeletons and {stats.cases} cases in "
+        f"{stats.materialization_seconds * 1000:.1f}ms during tests, "
+        "time saved from collection"
+    )
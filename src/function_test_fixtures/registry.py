@@ -0,0 +1,91 @@
+"""Share generated test cases between functions with the same signature shape."""
+
+import inspect
+from typing import Any, Callable, Iterable, Iterator, Self, TypeAlias
+
+from .arguments import TestCaseContainer
+from .cases import generate_test_cases
+from .parameter_stats import ParameterStats
+from .signature_gen import SHAPE
+
+
+CASE_GENERATOR: TypeAlias = Callable[[ParameterStats], Iterable[TestCaseContainer]]
+REPLAY: TypeAlias = tuple[
+    Callable[..., Any], ParameterStats, tuple[TestCaseContainer, ...]
+]
+
+
+class ShapeRegistry:
+    """
+    Group callables by signature shape and generate test cases once per shape.
+
+    Cases for a shape are only generated the first time they are asked for,
+    and are then replayed for every other callable with that shape.
+    """
+
+    generator: CASE_GENERATOR
+    generation_runs: int
+    case_requests: int
+    _callables: dict[SHAPE, list[tuple[Callable[..., Any], ParameterStats]]]
+    _cases: dict[SHAPE, tuple[TestCaseContainer, ...]]
+
+    def __init__(self: Self, generator: CASE_GENERATOR = generate_test_cases) -> None:
+        """Use `generator` to make the test cases for each shape."""
+        self.generator = generator
+        self.generation_runs = 0
+        self.case_requests = 0
+        self._callables = {}
+        self._cases = {}
+
+    def add(
+        self: Self,
+        f: Callable[..., Any],
+        /,
+        stats: ParameterStats | None = None
+    ) -> SHAPE:
+        """Register `f` and return its shape."""
+        if stats is None:
+            stats = ParameterStats(inspect.signature(f))
+        shape = stats.shape
+        self._callables.setdefault(shape, []).append((f, stats))
+        return shape
+
+    def __len__(self: Self) -> int:
+        """Return the number of distinct shapes registered."""
+        return len(self._callables)
+
+    def shapes(self: Self) -> list[SHAPE]:
+        """Return the registered shapes."""
+        return list(self._callables)
+
+    def callables(self: Self, shape: SHAPE, /) -> list[Callable[..., Any]]:
+        """Return the callables registered with `shape`."""
+        return [f for f, _ in self._callables.get(shape, [])]
+
+    def cases(self: Self, shape: SHAPE, /) -> tuple[TestCaseContainer, ...]:
+        """Return the test cases for `shape`, generating them on first use."""
+        self.case_requests += 1
+        try:
+            return self._cases[shape]
+        except KeyError:
+            stats = self._callables[shape][0][1]
+            self.generation_runs += 1
+            cases = tuple(self.generator(stats))
+            self._cases[shape] = cases
+            return cases
+
+    def __iter__(self: Self) -> Iterator[REPLAY]:
+        """
+        Yield each callable with its stats and its shape's test cases.
+
+        Use `TestCaseContainer.call_arguments` with the stats to turn a case
+        into arguments for that callable.
+        """
+        for shape, entries in self._callables.items():
+            for f, stats in entries:
+                yield f, stats, self.cases(shape)
+
+    @property
+    def saved_runs(self: Self) -> int:
+        """Number of generation runs avoided by sharing cases between callables."""
+        return self.case_requests - self.generation_runs
@@ -0,0 +1,366 @@
+"""
+Record the random decisions behind test cases and replay them.
+
+A skeleton is fully described by its shape and a test case by its
+`CaseCoordinates` plus the few random draws `make_test_case` makes to pick
+which parameters are passed by keyword. A `DecisionLog` stores just that,
+so any case can be rebuilt directly without running the generator over the
+skeletons and cases before it. A `DecisionLogWriter` writes the same
+records to a file as each skeleton is done, so memory does not grow with the
+log.
+
+Draws are captured by passing a recording or replaying `random.Random` to
+`make_test_case`, which leaves the `random` module's functions alone.
+"""
+
+import dataclasses
+import json
+import os
+import random
+from types import TracebackType
+from typing import IO, Any, Iterable, Iterator, Self, TypeAlias
+
+from .arguments import TestCaseContainer
+from .cases import CaseCoordinates, iter_case_coordinates, make_test_case
+from .parameter_stats import ParameterStats
+from .signature_gen import SHAPE, RLESkeleton, skeleton_from_shape, skeleton_shape
+from .stream import FixtureStream
+
+
+DRAW: TypeAlias = int | float
+
+_FORMAT_VERSION: int = 2
+
+
+class RecordingRandom(random.Random):
+    """
+    Generator that records every draw it makes.
+
+    All of `random.Random`'s methods are built on `random` and `getrandbits`,
+    so recording those two captures everything. It produces exactly what
+    `random.Random(seed)` would.
+    """
+
+    draws: list[DRAW]
+
+    def __init__(self: Self, seed: int | str, /) -> None:
+        """Seed the generator with `seed`."""
+        super().__init__(seed)
+        self.draws = []
+
+    def random(self: Self) -> float:
+        """Return and record the next float."""
+        x = super().random()
+        self.draws.append(x)
+        return x
+
+    def getrandbits(self: Self, k: int, /) -> int:
+        """Return and record the next `k` bit int."""
+        x = super().getrandbits(k)
+        self.draws.append(x)
+        return x
+
+
+class ReplayRandom(random.Random):
+    """Generator that returns previously recorded draws in order."""
+
+    _draws: Iterator[DRAW]
+
+    def __init__(self: Self, draws: Iterable[DRAW], /) -> None:
+        """Replay `draws`."""
+        super().__init__(0)
+        self._draws = iter(draws)
+
+    def _next(self: Self) -> DRAW:
+        try:
+            return next(self._draws)
+        except StopIteration:
+            raise TypeError("Decision log has fewer draws than the replay needs")
+
+    def random(self: Self) -> float:
+        """Return the next recorded draw as a float."""
+        return float(self._next())
+
+    def getrandbits(self: Self, k: int, /) -> int:
+        """Return the next recorded draw as an int."""
+        return int(self._next())
+
+
+@dataclasses.dataclass(frozen=True)
+class CaseDecision:
+    """What is needed to rebuild one test case of a known signature."""
+
+    coordinates: CaseCoordinates
+    draws: tuple[DRAW, ...]
+
+    def replay(self: Self, stats: ParameterStats, /) -> TestCaseContainer:
+        """Rebuild the test case for the signature described by `stats`."""
+        return make_test_case(stats, self.coordinates, rng=ReplayRandom(self.draws))
+
+
+def record_test_cases(
+    stats: ParameterStats,
+    seed: int | str,
+    /,
+    *,
+    extras: int = 1,
+    k: int | None = None
+) -> Iterator[tuple[TestCaseContainer, CaseDecision]]:
+    """
+    Yield the cases `generate_test_cases` would, each with its decisions.
+
+    The cases are those drawn from `random.Random(seed)`. One recorder
+    draws for all of them and each decision keeps just the draws made
+    building its own case.
+    """
+    recorder = RecordingRandom(seed)
+    coordinates = iter_case_coordinates(stats, extras=extras, k=k, rng=recorder)
+    for c in coordinates:
+        recorder.draws.clear()
+        case = make_test_case(stats, c, rng=recorder)
+        yield case, CaseDecision(c, tuple(recorder.draws))
+
+
+def _record_skeleton(
+    stream: FixtureStream,
+    index: int,
+    skeleton: RLESkeleton,
+    decisions: list[CaseDecision],
+    /,
+    *,
+    extras: int,
+    k: int | None
+) -> Iterator[TestCaseContainer]:
+    """Yield the cases `stream.test_cases` would, appending their decisions."""
+    stats = ParameterStats.from_skeleton(skeleton)
+    for case, decision in record_test_cases(
+        stats, f'{stream.seed}/{index}', extras=extras, k=k
+    ):
+        decisions.append(decision)
+        yield case
+
+
+def _header_json(extras: int, k: int | None, /) -> dict[str, Any]:
+    return {'version': _FORMAT_VERSION, 'extras': extras, 'k': k}
+
+
+def _check_header(data: dict[str, Any], /) -> None:
+    if data.get('version') != _FORMAT_VERSION:
+        raise TypeError(f"Unsupported decision log version {data.get('version')!r}")
+
+
+def _skeleton_json(
+    index: int,
+    shape: SHAPE,
+    decisions: Iterable[CaseDecision],
+    /
+) -> dict[str, Any]:
+    return {
+        'index': index,
+        'shape': [int(x) for x in shape],
+        'cases': [[*d.coordinates, list(d.draws)] for d in decisions],
+    }
+
+
+def _skeleton_from_json(
+    data: dict[str, Any],
+    /
+) -> tuple[int, SHAPE, list[CaseDecision]]:
+    po_req, po_opt, pk_req, pk_opt, var_pos, ko, ko_mask, var_kw = data['shape']
+    shape: SHAPE = (
+        po_req, po_opt, pk_req, pk_opt, bool(var_pos), ko, ko_mask, bool(var_kw)
+    )
+    return data['index'], shape, [
+        CaseDecision(CaseCoordinates(*case[:-1]), tuple(case[-1]))
+        for case in data['cases']
+    ]
+
+
+def _write_line(f: IO[str], data: dict[str, Any], /) -> None:
+    f.write(json.dumps(data, separators=(',', ':')))
+    f.write('\n')
+
+
+class DecisionLog:
+    """
+    Shapes and case decisions for skeletons of a stream, by skeleton index.
+
+    Looking up a skeleton or a case is a dictionary lookup followed by
+    building just that skeleton or case.
+    """
+
+    extras: int
+    k: int | None
+    _skeletons: dict[int, tuple[SHAPE, list[CaseDecision]]]
+
+    def __init__(self: Self, *, extras: int = 1, k: int | None = None) -> None:
+        """Start an empty log of cases generated with `extras` and `k`."""
+        self.extras = extras
+        self.k = k
+        self._skeletons = {}
+
+    @classmethod
+    def record(
+        cls,
+        stream: FixtureStream,
+        indices: Iterable[int] | None = None,
+        /,
+        *,
+        extras: int = 1,
+        k: int | None = None
+    ) -> Self:
+        """
+        Record the skeletons of `stream` at `indices`, by default all of them.
+
+        The recorded cases are those `stream.test_cases` yields.
+        """
+        log = cls(extras=extras, k=k)
+        wanted = None if indices is None else set(indices)
+        for index, skeleton in enumerate(stream):
+            if wanted is None or index in wanted:
+                for _ in log.record_skeleton(stream, index, skeleton):
+                    pass
+        return log
+
+    def record_skeleton(
+        self: Self,
+        stream: FixtureStream,
+        index: int,
+        skeleton: RLESkeleton,
+        /
+    ) -> Iterator[TestCaseContainer]:
+        """Yield the cases of skeleton `index` of `stream`, logging them."""
+        decisions: list[CaseDecision] = []
+        self._skeletons[index] = (skeleton_shape(skeleton), decisions)
+        yield from _record_skeleton(
+            stream, index, skeleton, decisions, extras=self.extras, k=self.k
+        )
+
+    def __len__(self: Self) -> int:
+        """Return the number of skeletons logged."""
+        return len(self._skeletons)
+
+    def indices(self: Self) -> list[int]:
+        """Return the logged skeleton indices in order."""
+        return sorted(self._skeletons)
+
+    def skeleton(self: Self, index: int, /) -> RLESkeleton:
+        """Return skeleton `index`."""
+        return skeleton_from_shape(self._skeletons[index][0])
+
+    def case_count(self: Self, index: int, /) -> int:
+        """Return the number of cases of skeleton `index`."""
+        return len(self._skeletons[index][1])
+
+    def test_case(self: Self, index: int, case: int, /) -> TestCaseContainer:
+        """Rebuild case number `case` of skeleton `index`."""
+        shape, decisions = self._skeletons[index]
+        stats = ParameterStats.from_skeleton(skeleton_from_shape(shape))
+        return decisions[case].replay(stats)
+
+    def to_json(self: Self) -> dict[str, Any]:
+        """Return a JSON serializable form of the log."""
+        return {
+            **_header_json(self.extras, self.k),
+            'skeletons': [
+                _skeleton_json(index, shape, decisions)
+                for index, (shape, decisions) in sorted(self._skeletons.items())
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], /) -> Self:
+        """Inverse of `to_json`."""
+        _check_header(data)
+        log = cls(extras=data['extras'], k=data['k'])
+        for entry in data['skeletons']:
+            index, shape, decisions = _skeleton_from_json(entry)
+            log._skeletons[index] = (shape, decisions)
+        return log
+
+    def save(self: Self, path: str | os.PathLike[str], /) -> None:
+        """Write the log to `path` as JSON lines, a header then each skeleton."""
+        with open(path, 'w', encoding='utf-8') as f:
+            _write_line(f, _header_json(self.extras, self.k))
+            for index, (shape, decisions) in sorted(self._skeletons.items()):
+                _write_line(f, _skeleton_json(index, shape, decisions))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], /) -> Self:
+        """Read a log written by `save` or a `DecisionLogWriter`."""
+        with open(path, encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            _check_header(header)
+            log = cls(extras=header['extras'], k=header['k'])
+            for line in f:
+                index, shape, decisions = _skeleton_from_json(json.loads(line))
+                log._skeletons[index] = (shape, decisions)
+        return log
+
+
+class DecisionLogWriter:
+    """
+    Write a decision log to a file as each skeleton's cases are generated.
+
+    Only the decisions of the skeleton being recorded are held in memory.
+    The file is in the format `DecisionLog.save` writes and is read back
+    with `DecisionLog.load`.
+    """
+
+    extras: int
+    k: int | None
+    _file: IO[str]
+
+    def __init__(
+        self: Self,
+        path: str | os.PathLike[str],
+        /,
+        *,
+        extras: int = 1,
+        k: int | None = None
+    ) -> None:
+        """Open `path` and write the header of a log of cases."""
+        self.extras = extras
+        self.k = k
+        self._file = open(path, 'w', encoding='utf-8')
+        _write_line(self._file, _header_json(extras, k))
+
+    def record_skeleton(
+        self: Self,
+        stream: FixtureStream,
+        index: int,
+        skeleton: RLESkeleton,
+        /
+    ) -> Iterator[TestCaseContainer]:
+        """
+        Yield the cases of skeleton `index` of `stream`, logging them.
+
+        The skeleton is written once its cases run out or the iterator is
+        closed, with the decisions of the cases yielded by then.
+        """
+        decisions: list[CaseDecision] = []
+        try:
+            yield from _record_skeleton(
+                stream, index, skeleton, decisions, extras=self.extras, k=self.k
+            )
+        finally:
+            _write_line(
+                self._file, _skeleton_json(index, skeleton_shape(skeleton), decisions)
+            )
+
+    def close(self: Self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self: Self) -> Self:
+        """Return the writer, which is closed on exit."""
+        return self
+
+    def __exit__(
+        self: Self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        """Close the file."""
+        self.close()
@@ -0,0 +1,176 @@
+"""
+Build `ParameterStats` from source files without importing them.
+
+Function signatures are read from `ast` argument nodes, so scanning a module
+never runs its code. Files can be scanned in a process pool and results are
+streamed as each file is done.
+"""
+
+import ast
+import concurrent.futures
+import dataclasses
+import os
+from pathlib import Path
+from typing import Iterable, Iterator, Self
+
+from .constants_and_types import (
+    ParameterKind,
+    POSITIONAL_ONLY,
+    POSITIONAL_OR_KEYWORD,
+    VAR_POSITIONAL,
+    KEYWORD_ONLY,
+    VAR_KEYWORD
+)
+from .parameter_stats import ParameterStats
+
+
+@dataclasses.dataclass(frozen=True)
+class ScannedFunction:
+    """A function found in a source file with stats for its signature."""
+
+    path: str
+    qualname: str
+    lineno: int
+    stats: ParameterStats
+
+
+def parameters_from_arguments(
+    arguments: ast.arguments,
+    /
+) -> Iterator[tuple[str, ParameterKind, bool]]:
+    """Yield `(name, kind, has_default)` for each parameter of an `ast.arguments`."""
+    positional = [(a.arg, POSITIONAL_ONLY) for a in arguments.posonlyargs]
+    positional += [(a.arg, POSITIONAL_OR_KEYWORD) for a in arguments.args]
+    # defaults belong to the last positional parameters
+    first_default = len(positional) - len(arguments.defaults)
+    for n, (name, kind) in enumerate(positional):
+        yield name, kind, n >= first_default
+
+    if arguments.vararg is not None:
+        yield arguments.vararg.arg, VAR_POSITIONAL, False
+
+    for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+        yield arg.arg, KEYWORD_ONLY, default is not None
+
+    if arguments.kwarg is not None:
+        yield arguments.kwarg.arg, VAR_KEYWORD, False
+
+
+class _FunctionVisitor(ast.NodeVisitor):
+    """Collect functions and lambdas with their qualified names."""
+
+    path: str
+    functions: list[ScannedFunction]
+    _scope: list[str]
+
+    def __init__(self: Self, path: str) -> None:
+        self.path = path
+        self.functions = []
+        self._scope = []
+
+    def _add(
+        self: Self,
+        name: str,
+        node: ast.FunctionDef | ast.AsyncFunctionDef | ast.Lambda
+    ) -> None:
+        self.functions.append(ScannedFunction(
+            self.path,
+            '.'.join(self._scope + [name]),
+            node.lineno,
+            ParameterStats.from_parameters(parameters_from_arguments(node.args))
+        ))
+
+    def _visit_function(
+        self: Self,
+        node: ast.FunctionDef | ast.AsyncFunctionDef
+    ) -> None:
+        self._add(node.name, node)
+        # decorators, defaults and annotations are evaluated in the outer scope
+        for child in node.decorator_list:
+            self.visit(child)
+        self.visit(node.args)
+        if node.returns is not None:
+            self.visit(node.returns)
+
+        self._scope += [node.name, '<locals>']
+        for statement in node.body:
+            self.visit(statement)
+        del self._scope[-2:]
+
+    def visit_FunctionDef(self: Self, node: ast.FunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_AsyncFunctionDef(self: Self, node: ast.AsyncFunctionDef) -> None:
+        self._visit_function(node)
+
+    def visit_Lambda(self: Self, node: ast.Lambda) -> None:
+        self._add('<lambda>', node)
+        self.visit(node.args)
+        self._scope += ['<lambda>', '<locals>']
+        self.visit(node.body)
+        del self._scope[-2:]
+
+    def visit_ClassDef(self: Self, node: ast.ClassDef) -> None:
+        for child in node.decorator_list + node.bases + node.keywords:
+            self.visit(child)
+        self._scope.append(node.name)
+        for statement in node.body:
+            self.visit(statement)
+        self._scope.pop()
+
+
+def scan_source(source: str | bytes, path: str = '<string>') -> list[ScannedFunction]:
+    """Return every function and lambda defined in `source`."""
+    visitor = _FunctionVisitor(path)
+    visitor.visit(ast.parse(source, path))
+    return visitor.functions
+
+
+def scan_file(path: str | os.PathLike[str]) -> list[ScannedFunction]:
+    """
+    Return every function and lambda defined in the file at `path`.
+
+    Files that cannot be read, or parsed without overflowing the stack, are
+    skipped and give an empty list.
+    """
+    path = os.fspath(path)
+    try:
+        with open(path, 'rb') as f:
+            return scan_source(f.read(), path)
+    except (OSError, RecursionError, SyntaxError, UnicodeDecodeError, ValueError):
+        return []
+
+
+def _source_files(paths: Iterable[str | os.PathLike[str]]) -> Iterator[str]:
+    """Yield the given files and the `.py` files under the given directories."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from (str(p) for p in sorted(path.rglob('*.py')))
+        else:
+            yield str(path)
+
+
+def scan_paths(
+    paths: Iterable[str | os.PathLike[str]],
+    /,
+    *,
+    workers: int | None = None,
+    chunksize: int = 16
+) -> Iterator[ScannedFunction]:
+    """
+    Scan files and directories, yielding functions as each file is done.
+
+    Files are parsed in a process pool of `workers` processes (by default
+    one per CPU). With `workers=0` files are parsed in this process instead.
+    Results are yielded in file order either way.
+    """
+    files = _source_files(paths)
+
+    if workers == 0:
+        for path in files:
+            yield from scan_file(path)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        for functions in executor.map(scan_file, files, chunksize=chunksize):
+            yield from functions
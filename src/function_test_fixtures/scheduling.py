@@ -0,0 +1,251 @@
+"""
+Cost aware scheduling of skeletons and test cases across workers.
+
+A `CostModel` estimates how long an item takes from its parameter and
+argument counts and refines the estimate from measured timings. `schedule`
+then splits items between workers with the longest processing time first
+rule, which keeps the slowest worker within 4/3 of the optimum.
+`list_schedule` assigns items as they stream past instead, keeping the
+slowest worker within 2 of the optimum in O(workers) memory.
+"""
+
+import dataclasses
+import heapq
+from typing import Callable, Generic, Iterable, Iterator, Self, TypeAlias, TypeVar
+
+from .arguments import TestCaseContainer
+from .parameter_stats import ParameterStats
+from .signature_gen import SHAPE, SKELETON, skeleton_shape
+
+
+T = TypeVar('T')
+
+ITEM: TypeAlias = ParameterStats | SKELETON | TestCaseContainer
+
+# (constant, positional only, positional or keyword, keyword only,
+#  variable parameters, arguments)
+FEATURES: TypeAlias = tuple[int, int, int, int, int, int]
+
+# a priori relative cost of each feature, until timings set the scale
+DEFAULT_WEIGHTS: FEATURES = (1, 1, 1, 1, 1, 1)
+
+
+def item_features(item: ITEM, /) -> FEATURES:
+    """Return the counts a cost estimate is based on."""
+    if isinstance(item, TestCaseContainer):
+        return 1, 0, 0, 0, 0, len(item)
+
+    shape: SHAPE = (
+        item.shape if isinstance(item, ParameterStats) else skeleton_shape(item)
+    )
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, _, var_keyword = shape
+    return (
+        1,
+        po_required + po_optional,
+        pk_required + pk_optional,
+        ko_count,
+        var_positional + var_keyword,
+        0
+    )
+
+
+def _solve(matrix: list[list[float]], vector: list[float]) -> list[float]:
+    """Solve a small linear system by Gaussian elimination with pivoting."""
+    n = len(vector)
+    rows = [row[:] + [v] for row, v in zip(matrix, vector)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(col + 1, n):
+            factor = rows[r][col] / rows[col][col]
+            for c in range(col, n + 1):
+                rows[r][c] -= factor * rows[col][c]
+    solution = [0.0] * n
+    for r in reversed(range(n)):
+        total = sum(rows[r][c] * solution[c] for c in range(r + 1, n))
+        solution[r] = (rows[r][n] - total) / rows[r][r]
+    return solution
+
+
+class CostModel:
+    """
+    Estimate the cost of items from their counts.
+
+    `prior` holds the relative cost of each of `item_features`, so until
+    any timing is observed estimates are in those arbitrary units. Timings
+    passed to `observe` are used in three ways: they scale the prior into
+    seconds, items whose features have been timed are estimated by a moving
+    average of their timings, and `fit` refits the weights to all timings so
+    unseen items benefit as well.
+
+    The fit is a ridge regression shrunk towards the scaled prior, which
+    counts as `ridge` observations of each feature at its average size, and
+    weights are clamped to be non-negative.
+    """
+
+    prior: list[float]
+    weights: list[float]
+    smoothing: float
+    ridge: float
+    observations: int
+    _timings: dict[FEATURES, float]
+    _gram: list[list[float]]
+    _moments: list[float]
+    _seconds: float
+    _prior_cost: float
+    _fitted: bool
+
+    def __init__(
+        self: Self,
+        prior: Iterable[float] = DEFAULT_WEIGHTS,
+        *,
+        smoothing: float = 0.25,
+        ridge: float = 1.0
+    ) -> None:
+        """Start from the relative feature costs `prior`."""
+        self.prior = list(prior)
+        if any(w < 0 for w in self.prior):
+            raise TypeError("`prior` weights must be non-negative")
+        # without shrinkage repeated or missing features leave the fit singular
+        if ridge <= 0:
+            raise TypeError("`ridge` must be positive")
+        self.weights = list(self.prior)
+        self.smoothing = smoothing
+        self.ridge = ridge
+        self.observations = 0
+        self._timings = {}
+        n = len(self.prior)
+        self._gram = [[0.0] * n for _ in range(n)]
+        self._moments = [0.0] * n
+        self._seconds = 0.0
+        self._prior_cost = 0.0
+        self._fitted = False
+
+    @property
+    def scale(self: Self) -> float:
+        """Seconds per prior unit over the items timed so far, 1 before any."""
+        return self._seconds / self._prior_cost if self._prior_cost else 1.0
+
+    def _scaled_prior(self: Self) -> list[float]:
+        scale = self.scale
+        return [scale * w for w in self.prior]
+
+    def estimate(self: Self, item: ITEM, /) -> float:
+        """Return the estimated cost of `item`."""
+        features = item_features(item)
+        try:
+            return self._timings[features]
+        except KeyError:
+            return max(0.0, sum(w * f for w, f in zip(self.weights, features)))
+
+    def observe(self: Self, item: ITEM, seconds: float, /) -> None:
+        """Record that `item` took `seconds`."""
+        features = item_features(item)
+        previous = self._timings.get(features)
+        self._timings[features] = (
+            seconds if previous is None
+            else previous + self.smoothing * (seconds - previous)
+        )
+
+        for i, fi in enumerate(features):
+            self._moments[i] += fi * seconds
+            for j, fj in enumerate(features):
+                self._gram[i][j] += fi * fj
+        self.observations += 1
+
+        self._seconds += seconds
+        self._prior_cost += sum(w * f for w, f in zip(self.prior, features))
+        if not self._fitted:
+            self.weights = self._scaled_prior()
+
+    def fit(self: Self) -> None:
+        """Refit the weights to every timing observed so far."""
+        if not self.observations:
+            return
+        prior = self._scaled_prior()
+        # features never observed, e.g. arguments when only skeletons were
+        # timed, have no data and keep their scaled prior weight
+        penalty = [
+            self.ridge * (self._gram[i][i] / self.observations or 1.0)
+            for i in range(len(prior))
+        ]
+        gram = [
+            [g + (penalty[i] if i == j else 0.0) for j, g in enumerate(row)]
+            for i, row in enumerate(self._gram)
+        ]
+        moments = [m + p * w for m, p, w in zip(self._moments, penalty, prior)]
+        self.weights = [max(0.0, w) for w in _solve(gram, moments)]
+        self._fitted = True
+
+
+@dataclasses.dataclass(frozen=True)
+class Schedule(Generic[T]):
+    """Items assigned to each worker and each worker's estimated load."""
+
+    assignments: tuple[tuple[T, ...], ...]
+    loads: tuple[float, ...]
+
+    @property
+    def makespan(self: Self) -> float:
+        """Estimated load of the busiest worker."""
+        return max(self.loads, default=0.0)
+
+
+def schedule(
+    items: Iterable[T],
+    workers: int,
+    /,
+    cost: Callable[[T], float]
+) -> Schedule[T]:
+    """
+    Assign items to `workers` with the longest processing time first rule.
+
+    Items are taken in decreasing order of `cost` and each is given to the
+    least loaded worker. Ties are broken by item order and worker number so
+    the result is deterministic. Each worker's items keep their input order.
+    """
+    if workers < 1:
+        raise TypeError("`workers` must be at least 1")
+
+    costed = [(cost(item), n, item) for n, item in enumerate(items)]
+    costed.sort(key=lambda x: (-x[0], x[1]))
+
+    heap: list[tuple[float, int]] = [(0.0, w) for w in range(workers)]
+    assigned: list[list[tuple[int, T]]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for c, n, item in costed:
+        load, w = heapq.heappop(heap)
+        assigned[w].append((n, item))
+        loads[w] = load + c
+        heapq.heappush(heap, (loads[w], w))
+
+    return Schedule(
+        tuple(
+            tuple(item for _, item in sorted(a, key=lambda x: x[0])) for a in assigned
+        ),
+        tuple(loads)
+    )
+
+
+def list_schedule(
+    items: Iterable[T],
+    workers: int,
+    /,
+    cost: Callable[[T], float]
+) -> Iterator[tuple[int, T]]:
+    """
+    Yield `(worker, item)`, giving each item to the least loaded worker.
+
+    Unlike `schedule` items are assigned in input order as they arrive, so
+    a stream is only read once. Ties go to the lowest numbered worker, so
+    processes that see the same items and costs agree on the assignment.
+    """
+    if workers < 1:
+        raise TypeError("`workers` must be at least 1")
+
+    heap: list[tuple[float, int]] = [(0.0, w) for w in range(workers)]
+    for item in items:
+        load, w = heapq.heappop(heap)
+        heapq.heappush(heap, (load + cost(item), w))
+        yield w, item
@@ -0,0 +1,227 @@
+"""
+Encode skeletons and test cases for tools outside Python.
+
+Two formats are supported and both decode to the same records:
+
+* ``jsonl``: one JSON object per line.
+* ``binary``: the magic bytes ``FTF1`` followed by tagged records made of
+  unsigned LEB128 varints.
+
+Skeletons are written as their shape (see `signature_gen.skeleton_shape`)
+with booleans as 0 or 1::
+
+    {"type": "skeleton", "index": 0, "shape": [1, 0, 2, 1, 0, 2, 2, 1]}
+
+Test cases refer to their skeleton by index and give each argument as its
+placeholder token, with the parameter number for mapped arguments. Keyword
+arguments are unordered so they are written sorted by token code and
+number, which keeps output reproducible::
+
+    {"type": "case", "skeleton": 0, "args": ["PO1", "PK1"], "kwargs": ["KO2", "KE"]}
+
+In the binary form a skeleton is ``b'S'``, its index and the 8 shape values.
+A case is ``b'C'``, the skeleton index, then for the positional and then the
+keyword arguments a count followed by each argument's token code (see
+`TOKEN_CODES`) and, for mapped arguments, its number.
+"""
+
+import abc
+import io
+import json
+from typing import Any, BinaryIO, ClassVar, Iterator, Self
+
+from .arguments import (
+    ArgumentBase,
+    MappedArgPlaceholder,
+    TestCaseContainer,
+    TestPositional,
+    TestPositionalOrKeyword,
+    TestKeyword,
+    TestPositionalExtra,
+    TestKeywordExtra
+)
+from .signature_gen import SHAPE
+
+
+BINARY_MAGIC: bytes = b'FTF1'
+
+TOKEN_CODES: dict[str, int] = {
+    TestPositional.TOKEN: 0,
+    TestPositionalOrKeyword.TOKEN: 1,
+    TestKeyword.TOKEN: 2,
+    TestPositionalExtra.TOKEN: 3,
+    TestKeywordExtra.TOKEN: 4,
+}
+_CODE_TOKENS: dict[int, str] = {code: token for token, code in TOKEN_CODES.items()}
+_MAPPED_TOKENS: frozenset[str] = frozenset({
+    TestPositional.TOKEN,
+    TestPositionalOrKeyword.TOKEN,
+    TestKeyword.TOKEN,
+})
+
+_SKELETON_TAG: bytes = b'S'
+_CASE_TAG: bytes = b'C'
+
+
+def encode_varint(n: int, /) -> bytes:
+    """Return `n` as an unsigned LEB128 varint."""
+    if n < 0:
+        raise TypeError("`n` must not be negative")
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _read_varint(stream: BinaryIO, /) -> int:
+    """Read an unsigned LEB128 varint from `stream`."""
+    n = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise EOFError("Truncated varint")
+        n |= (byte[0] & 0x7F) << shift
+        if not byte[0] & 0x80:
+            return n
+        shift += 7
+
+
+def argument_token(argument: ArgumentBase, /) -> str:
+    """Return the token for an argument placeholder, e.g. ``PK2`` or ``KE``."""
+    if isinstance(argument, MappedArgPlaceholder):
+        return f'{argument.TOKEN}{argument.n}'
+    return argument.TOKEN
+
+
+def _sorted_keywords(case: TestCaseContainer, /) -> list[ArgumentBase]:
+    """Return a case's keyword arguments, which are unordered, in a fixed order."""
+    return sorted(
+        case.keyword_arguments,
+        key=lambda x: (
+            TOKEN_CODES[x.TOKEN],
+            x.n if isinstance(x, MappedArgPlaceholder) else 0
+        )
+    )
+
+
+def skeleton_record(index: int, shape: SHAPE, /) -> dict[str, Any]:
+    """Return the record for a skeleton."""
+    return {'type': 'skeleton', 'index': index, 'shape': [int(x) for x in shape]}
+
+
+def case_record(skeleton: int, case: TestCaseContainer, /) -> dict[str, Any]:
+    """Return the record for a test case of the skeleton with index `skeleton`."""
+    return {
+        'type': 'case',
+        'skeleton': skeleton,
+        'args': [argument_token(x) for x in case.positional_arguments],
+        'kwargs': [argument_token(x) for x in _sorted_keywords(case)],
+    }
+
+
+class Encoder(abc.ABC):
+    """Turn skeletons and test cases into bytes."""
+
+    NAME: ClassVar[str]
+
+    def header(self: Self) -> bytes:
+        """Return the bytes written before any record."""
+        return b''
+
+    @abc.abstractmethod
+    def skeleton(self: Self, index: int, shape: SHAPE, /) -> bytes:
+        """Encode a skeleton."""
+
+    @abc.abstractmethod
+    def case(self: Self, skeleton: int, case: TestCaseContainer, /) -> bytes:
+        """Encode a test case of the skeleton with index `skeleton`."""
+
+
+class JSONLEncoder(Encoder):
+    """Encode records as JSON lines."""
+
+    NAME: ClassVar[str] = 'jsonl'
+
+    def skeleton(self: Self, index: int, shape: SHAPE, /) -> bytes:
+        """Encode a skeleton record as a JSON line."""
+        return _json_line(skeleton_record(index, shape))
+
+    def case(self: Self, skeleton: int, case: TestCaseContainer, /) -> bytes:
+        """Encode a test case record as a JSON line."""
+        return _json_line(case_record(skeleton, case))
+
+
+def _json_line(record: dict[str, Any], /) -> bytes:
+    return json.dumps(record, separators=(',', ':')).encode() + b'\n'
+
+
+class BinaryEncoder(Encoder):
+    """Encode records in the compact binary form."""
+
+    NAME: ClassVar[str] = 'binary'
+
+    def header(self: Self) -> bytes:
+        """Return the magic bytes that start a binary stream."""
+        return BINARY_MAGIC
+
+    def skeleton(self: Self, index: int, shape: SHAPE, /) -> bytes:
+        """Encode the skeleton's index and shape as tagged varints."""
+        return _SKELETON_TAG + b''.join(
+            encode_varint(int(x)) for x in (index, *shape)
+        )
+
+    def case(self: Self, skeleton: int, case: TestCaseContainer, /) -> bytes:
+        """Encode the case's positional then keyword arguments as token codes."""
+        out = bytearray(_CASE_TAG)
+        out += encode_varint(skeleton)
+        for arguments in (case.positional_arguments, _sorted_keywords(case)):
+            out += encode_varint(len(arguments))
+            for x in arguments:
+                out.append(TOKEN_CODES[x.TOKEN])
+                if isinstance(x, MappedArgPlaceholder):
+                    out += encode_varint(x.n)
+        return bytes(out)
+
+
+ENCODERS: dict[str, type[Encoder]] = {
+    JSONLEncoder.NAME: JSONLEncoder,
+    BinaryEncoder.NAME: BinaryEncoder,
+}
+
+
+def read_jsonl(stream: io.TextIOBase | BinaryIO, /) -> Iterator[dict[str, Any]]:
+    """Yield the records of a JSONL stream."""
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def read_binary(stream: BinaryIO, /) -> Iterator[dict[str, Any]]:
+    """Yield the records of a binary stream as their JSON form."""
+    if stream.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise TypeError("Not a binary fixture stream")
+
+    while tag := stream.read(1):
+        if tag == _SKELETON_TAG:
+            index = _read_varint(stream)
+            shape = [_read_varint(stream) for _ in range(8)]
+            yield {'type': 'skeleton', 'index': index, 'shape': shape}
+        elif tag == _CASE_TAG:
+            record: dict[str, Any] = {'type': 'case', 'skeleton': _read_varint(stream)}
+            for key in ('args', 'kwargs'):
+                tokens: list[str] = []
+                for _ in range(_read_varint(stream)):
+                    token = _CODE_TOKENS[stream.read(1)[0]]
+                    if token in _MAPPED_TOKENS:
+                        token += str(_read_varint(stream))
+                    tokens.append(token)
+                record[key] = tokens
+            yield record
+        else:
+            raise TypeError(f"Unknown record tag {tag!r}")
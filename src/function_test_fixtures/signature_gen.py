@@ -1,10 +1,26 @@
 import abc
 import enum
+import collections
 import dataclasses
+import functools
 import itertools
+import inspect
 import random
-from typing import Self, Iterator, Callable, TypeAlias
+import sys
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Literal,
+    Self,
+    Sequence,
+    TypeAlias,
+    TypeGuard,
+    overload
+)
 from .constants_and_types import ParameterKind
+from . import utils
 
 
 class ParameterFlag(enum.Flag):
@@ -135,57 +151,476 @@ class ProtoParameterWithDefault(ProtoParameter):
         name:str,
         default: Any,
         *,
-        annotation: object|None=None
-    ):
+        annotation: object=inspect.Parameter.empty
+    ) -> inspect.Parameter:
         return inspect.Parameter(
             kind=_KIND_TO_KIND_MAP[self.kind],
             name=name,
-            default=default
+            default=default,
+            annotation=annotation
         )
 
 
 class ProtoParameterWithoutDefault(ProtoParameter):
     """A bare required parameter representation."""
 
-    def make_parameter(self: Self, name: str, *, annotation: object|None=None):
+    def make_parameter(
+        self: Self,
+        name: str,
+        *,
+        annotation: object=inspect.Parameter.empty
+    ) -> inspect.Parameter:
         return inspect.Parameter(
             kind=_KIND_TO_KIND_MAP[self.kind],
-            name: name
+            name=name,
+            annotation=annotation
         )
 
 
-def is_optional(bare_parameter: BareParameter) -> TypeGuard[BareParameterWithDefault]:
-    """A type guard that returns True if the bare parameter is optional."""
-    if isinstance(bare_parameters, BareParameterWithDefault):
+def is_optional(
+    proto_parameter: ProtoParameter
+) -> TypeGuard[ProtoParameterWithDefault]:
+    """A type guard that returns True if the proto parameter is optional."""
+    if isinstance(proto_parameter, ProtoParameterWithDefault):
         return True
-    elif isinstance(bare_parameters, BareParameterWithoutDefault):
+    elif isinstance(proto_parameter, ProtoParameterWithoutDefault):
         return False
     else:
-        raise TypeError("argument must be a BareParameter")
+        raise TypeError("argument must be a ProtoParameter")
 
 
-def signature(parameters: Iterable[inspect.Parameters], /, *, annotation: object):
-    """Helper method that returns a signature."""
-    return inspect.Signature(parameters, annotation=annotation)
+# whether inspect.Signature accepts its private `__validate_parameters__`
+_CAN_SKIP_VALIDATION: bool = (
+    '__validate_parameters__' in inspect.signature(inspect.Signature).parameters
+)
 
 
-#def (...):
-#    parameters = []
-#    for p in bare_parameter:
-#        if is_optional(p):
-#            parameters.append(p.make_parameter(name, default, anotation=anotation))
-#        else:
-#            parameters.append(p.make_parameter(name, anotation=anotation))
+def signature(
+    parameters: Sequence[inspect.Parameter],
+    /,
+    *,
+    return_annotation: object=inspect.Signature.empty,
+    validate: bool = True
+) -> inspect.Signature:
+    """
+    Return an `inspect.Signature` with `parameters`.
+
+    With `validate=False` the parameters' order and names are not checked,
+    where this Python's `inspect.Signature` supports skipping that.
+    """
+    if not validate and _CAN_SKIP_VALIDATION:
+        return inspect.Signature(
+            parameters,
+            return_annotation=return_annotation,
+            __validate_parameters__=False
+        )
+    return inspect.Signature(parameters, return_annotation=return_annotation)
 
-#    signature(parameters, anotation=anotation)
 
+@functools.cache
+def make_proto_parameter(kind: ParameterKind, default: bool) -> ProtoParameter:
+    """
+    ProtoParameter constructor that picks the appropiate subclass.
 
-def bare_parameter(kind: ParameterKind, default: Bool) -> BareParameter:
-    """BareParamer constructor that picks the appropiate subclass."""
+    Proto parameters are immutable so one instance is shared for each kind
+    and default status.
+    """
     if default:
-        return BareoParameterWithDefault(kind)
+        return ProtoParameterWithDefault(kind)
     else:
-        return BareParameterWithoutDefault(kind)
+        return ProtoParameterWithoutDefault(kind)
+
+
+@dataclasses.dataclass(frozen=True, eq=True, init=True)
+class ParameterRun:
+    """
+    Run length encoding of the parameters of a positional kind.
+
+    Positional only and positional or keyword parameters are always laid out
+    as a prefix of required parameters followed by a suffix of optional
+    parameters, so two counts describe them exactly.
+    """
+
+    kind: ParameterKind
+    required: int
+    optional: int
+
+    def __len__(self: Self) -> int:
+        """Return the number of parameters in the run."""
+        return self.required + self.optional
+
+    def __iter__(self: Self) -> Iterator[ProtoParameter]:
+        """Lazily expand the run into proto parameters."""
+        yield from itertools.repeat(
+            make_proto_parameter(self.kind, False), self.required
+        )
+        yield from itertools.repeat(
+            make_proto_parameter(self.kind, True), self.optional
+        )
+
+
+@dataclasses.dataclass(frozen=True, eq=True, init=True)
+class MaskedParameterRun:
+    """
+    Encoding of parameters whose optional members may be placed anywhere.
+
+    Bit `n` of `optional_mask` is set if the nth parameter has a default.
+    """
+
+    kind: ParameterKind
+    count: int
+    optional_mask: int
+
+    def __len__(self: Self) -> int:
+        """Return the number of parameters in the run."""
+        return self.count
+
+    def __iter__(self: Self) -> Iterator[ProtoParameter]:
+        """Lazily expand the run into proto parameters."""
+        with_default = make_proto_parameter(self.kind, True)
+        without_default = make_proto_parameter(self.kind, False)
+        mask = self.optional_mask
+
+        for _ in range(self.count):
+            yield with_default if mask & 1 else without_default
+            mask >>= 1
+
+
+@dataclasses.dataclass(frozen=True, eq=True, init=True)
+class RLESkeleton:
+    """
+    Compact form of a skeleton signature.
+
+    Uses constant memory per parameter kind (bar the keyword only mask).
+    Iterating over it lazily yields the same proto parameters, in the same
+    order, as the equivalent tuple skeleton.
+    """
+
+    positional_only: ParameterRun
+    positional_or_keyword: ParameterRun
+    var_positional: bool
+    keyword_only: MaskedParameterRun
+    var_keyword: bool
+
+    def __len__(self: Self) -> int:
+        """Return the number of parameters in the skeleton."""
+        return (
+            len(self.positional_only)
+            + len(self.positional_or_keyword)
+            + self.var_positional
+            + len(self.keyword_only)
+            + self.var_keyword
+        )
+
+    def __iter__(self: Self) -> Iterator[ProtoParameter]:
+        """Lazily expand the skeleton into proto parameters."""
+        yield from self.positional_only
+        yield from self.positional_or_keyword
+        if self.var_positional:
+            yield make_proto_parameter(ParameterKind.VAR_POSITIONAL, False)
+        yield from self.keyword_only
+        if self.var_keyword:
+            yield make_proto_parameter(ParameterKind.VAR_KEYWORD, False)
+
+    def expand(self: Self) -> tuple[ProtoParameter, ...]:
+        """Return the equivalent tuple skeleton."""
+        return tuple(self)
+
+
+SKELETON: TypeAlias = tuple[ProtoParameter, ...] | RLESkeleton
+
+# (positional only required, positional only optional,
+#  positional or keyword required, positional or keyword optional,
+#  var positional, keyword only count, keyword only optional mask,
+#  var keyword)
+SHAPE: TypeAlias = tuple[int, int, int, int, bool, int, int, bool]
+
+
+def skeleton_shape(skeleton: SKELETON, /) -> SHAPE:
+    """
+    Return a hashable description of a skeleton's structure.
+
+    Structurally equal skeletons have equal shapes whether they are tuples
+    or `RLESkeleton`s. The shape holds no reference to the skeleton.
+    """
+    if isinstance(skeleton, RLESkeleton):
+        return (
+            skeleton.positional_only.required,
+            skeleton.positional_only.optional,
+            skeleton.positional_or_keyword.required,
+            skeleton.positional_or_keyword.optional,
+            skeleton.var_positional,
+            skeleton.keyword_only.count,
+            skeleton.keyword_only.optional_mask,
+            skeleton.var_keyword
+        )
+
+    counts: dict[tuple[ParameterKind, bool], int] = collections.Counter()
+    ko_count: int = 0
+    ko_mask: int = 0
+    for p in skeleton:
+        optional = is_optional(p)
+        if p.kind is ParameterKind.KEYWORD_ONLY:
+            ko_mask |= optional << ko_count
+            ko_count += 1
+        else:
+            counts[p.kind, optional] += 1
+
+    return (
+        counts[ParameterKind.POSITIONAL_ONLY, False],
+        counts[ParameterKind.POSITIONAL_ONLY, True],
+        counts[ParameterKind.POSITIONAL_OR_KEYWORD, False],
+        counts[ParameterKind.POSITIONAL_OR_KEYWORD, True],
+        counts[ParameterKind.VAR_POSITIONAL, False] > 0,
+        ko_count,
+        ko_mask,
+        counts[ParameterKind.VAR_KEYWORD, False] > 0
+    )
+
+
+def skeleton_from_shape(shape: SHAPE, /) -> RLESkeleton:
+    """Return the `RLESkeleton` with the given shape; inverse of `skeleton_shape`."""
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+    return RLESkeleton(
+        positional_only=ParameterRun(
+            ParameterKind.POSITIONAL_ONLY, po_required, po_optional
+        ),
+        positional_or_keyword=ParameterRun(
+            ParameterKind.POSITIONAL_OR_KEYWORD, pk_required, pk_optional
+        ),
+        var_positional=bool(var_positional),
+        keyword_only=MaskedParameterRun(
+            ParameterKind.KEYWORD_ONLY, ko_count, ko_mask
+        ),
+        var_keyword=bool(var_keyword)
+    )
+
+
+# prefix of the generated names for each parameter kind
+_NAME_PREFIX: dict[ParameterKind, str] = {
+    ParameterKind.POSITIONAL_ONLY: 'p',
+    ParameterKind.POSITIONAL_OR_KEYWORD: 'p',
+    ParameterKind.KEYWORD_ONLY: 'k',
+}
+
+# interned parameter names, grown on demand and shared by every skeleton
+_NAME_POOL: dict[str, list[str]] = {'p': [], 'k': []}
+
+
+def parameter_names(prefix: str, count: int, /) -> list[str]:
+    """
+    Return the first `count` pooled names with the given prefix.
+
+    Names are `p0`, `p1`... for positional parameters and `k0`, `k1`... for
+    keyword only parameters. Each name is formatted and interned once.
+    """
+    pool = _NAME_POOL[prefix]
+    for n in range(len(pool), count):
+        pool.append(sys.intern(f'{prefix}{n}'))
+    return pool[:count]
+
+
+def skeleton_parameter_names(skeleton: SKELETON, /) -> list[str]:
+    """Return the pooled name of each parameter of `skeleton` in order."""
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, _, var_keyword = skeleton_shape(skeleton)
+
+    names = parameter_names('p', po_required + po_optional + pk_required + pk_optional)
+    if var_positional:
+        names.append('args')
+    names.extend(parameter_names('k', ko_count))
+    if var_keyword:
+        names.append('kwargs')
+    return names
+
+
+def make_signature(
+    skeleton: SKELETON,
+    /,
+    *,
+    default: object = None,
+    annotation: object = inspect.Parameter.empty,
+    return_annotation: object = inspect.Signature.empty
+) -> inspect.Signature:
+    """
+    Return an `inspect.Signature` for `skeleton`.
+
+    Optional parameters default to `default` and every parameter is given
+    `annotation`. Skeletons are valid by construction so the signature's own
+    parameter validation is skipped where possible.
+    """
+    parameters: list[inspect.Parameter] = []
+    for p, name in zip(skeleton, skeleton_parameter_names(skeleton)):
+        if isinstance(p, ProtoParameterWithDefault):
+            parameters.append(p.make_parameter(name, default, annotation=annotation))
+        elif isinstance(p, ProtoParameterWithoutDefault):
+            parameters.append(p.make_parameter(name, annotation=annotation))
+        else:
+            raise TypeError("skeleton items must be ProtoParameters")
+
+    return signature(parameters, return_annotation=return_annotation, validate=False)
+
+
+class SignatureView:
+    """
+    Lazy signature view of a skeleton.
+
+    Counts and kinds are available straight away, from the skeleton's shape,
+    while the `inspect.Signature` is only built the first time `signature`
+    is accessed.
+    """
+
+    skeleton: SKELETON
+    shape: SHAPE
+    _default: object
+    _annotation: object
+    _return_annotation: object
+
+    def __init__(
+        self: Self,
+        skeleton: SKELETON,
+        /,
+        *,
+        default: object = None,
+        annotation: object = inspect.Parameter.empty,
+        return_annotation: object = inspect.Signature.empty
+    ) -> None:
+        """Keep `skeleton` and the arguments for `make_signature` for later."""
+        self.skeleton = skeleton
+        self.shape = skeleton_shape(skeleton)
+        self._default = default
+        self._annotation = annotation
+        self._return_annotation = return_annotation
+
+    def __len__(self: Self) -> int:
+        """Return the number of parameters in the signature."""
+        return sum(self.shape[:4]) + self.shape[4] + self.shape[5] + self.shape[7]
+
+    @property
+    def counters(self: Self) -> dict[ParameterKind, int]:
+        """Number of parameters of each non variable kind."""
+        return {
+            ParameterKind.POSITIONAL_ONLY: self.shape[0] + self.shape[1],
+            ParameterKind.POSITIONAL_OR_KEYWORD: self.shape[2] + self.shape[3],
+            ParameterKind.KEYWORD_ONLY: self.shape[5],
+        }
+
+    @property
+    def optional_counters(self: Self) -> dict[ParameterKind, int]:
+        """Number of optional parameters of each non variable kind."""
+        return {
+            ParameterKind.POSITIONAL_ONLY: self.shape[1],
+            ParameterKind.POSITIONAL_OR_KEYWORD: self.shape[3],
+            ParameterKind.KEYWORD_ONLY: self.shape[6].bit_count(),
+        }
+
+    @property
+    def uses_var_positional(self: Self) -> bool:
+        """True if the signature has a variable positional parameter."""
+        return self.shape[4]
+
+    @property
+    def uses_var_keyword(self: Self) -> bool:
+        """True if the signature has a variable keyword parameter."""
+        return self.shape[7]
+
+    @functools.cached_property
+    def kinds(self: Self) -> tuple[ParameterKind, ...]:
+        """Kind of each parameter in order."""
+        return tuple(p.kind for p in self.skeleton)
+
+    @functools.cached_property
+    def parameter_names(self: Self) -> tuple[str, ...]:
+        """Name of each parameter in order."""
+        return tuple(skeleton_parameter_names(self.skeleton))
+
+    @functools.cached_property
+    def signature(self: Self) -> inspect.Signature:
+        """The `inspect.Signature`, built on first access."""
+        return make_signature(
+            self.skeleton,
+            default=self._default,
+            annotation=self._annotation,
+            return_annotation=self._return_annotation
+        )
+
+
+class SkeletonInterner:
+    """
+    Opt-in hash-consing table for skeletons.
+
+    Structurally equal skeletons passed through the same interner come back
+    as the same object, so `is` becomes a cheap duplicate check.
+    `RLESkeleton`s are held by weak reference and drop out of the table once
+    nothing else uses them. Tuples cannot be weakly referenced so tuple
+    skeletons are kept in a least recently used table of at most `maxsize`
+    entries instead.
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+    _rle: weakref.WeakValueDictionary[SHAPE, RLESkeleton]
+    _tuples: collections.OrderedDict[
+        RLESkeleton | tuple[ProtoParameter, ...],
+        tuple[ProtoParameter, ...]
+    ]
+
+    def __init__(self: Self, maxsize: int = 4096) -> None:
+        """Start empty, keeping at most `maxsize` tuple skeletons."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._rle = weakref.WeakValueDictionary()
+        self._tuples = collections.OrderedDict()
+
+    def __len__(self: Self) -> int:
+        """Return the number of skeletons currently interned."""
+        return len(self._rle) + len(self._tuples)
+
+    def _lookup_tuple(
+        self: Self,
+        key: RLESkeleton | tuple[ProtoParameter, ...],
+        make: Callable[[], tuple[ProtoParameter, ...]]
+    ) -> tuple[ProtoParameter, ...]:
+        """Return the interned tuple for `key`, calling `make` on a miss."""
+        try:
+            skeleton = self._tuples[key]
+        except KeyError:
+            self.misses += 1
+            skeleton = make()
+            self._tuples[key] = skeleton
+            if len(self._tuples) > self.maxsize:
+                self._tuples.popitem(last=False)
+        else:
+            self.hits += 1
+            self._tuples.move_to_end(key)
+        return skeleton
+
+    def intern(self: Self, skeleton: SKELETON) -> SKELETON:
+        """Return the canonical skeleton structurally equal to `skeleton`."""
+        if isinstance(skeleton, RLESkeleton):
+            key = skeleton_shape(skeleton)
+            canonical = self._rle.get(key)
+            if canonical is None:
+                self.misses += 1
+                self._rle[key] = skeleton
+                return skeleton
+            else:
+                self.hits += 1
+                return canonical
+        else:
+            return self._lookup_tuple(skeleton, lambda: skeleton)
+
+    def expand(self: Self, skeleton: RLESkeleton) -> tuple[ProtoParameter, ...]:
+        """
+        Return the canonical tuple form of `skeleton`.
+
+        The tuple is only built the first time a skeleton with this shape is
+        seen.
+        """
+        return self._lookup_tuple(skeleton, skeleton.expand)
 
 
 ALL_POSITIONAL_FLAGS = (
@@ -279,38 +714,44 @@ def _valid_flag_permutation(flag_perm: FLAG_PERMUTATION) -> bool:
     return True
 
 
-def _resolve_count(flag_perm: FLAG_PERMUTATION, x: COUNT) -> int:
+def _resolve_count(
+    flag_perm: FLAG_PERMUTATION,
+    x: COUNT,
+    rng: random.Random | None = None
+) -> int:
     """
     Convert a generic parameter count value to an int.
 
     If the generic is an int nothing to do. If it's 2-int-tuple then
-    pick a random value in the interval. If the generic is a callable
-    call it and return the value.
+    pick a random value in the interval, from `rng` or by default the
+    `random` module. If the generic is a callable call it and return the
+    value.
     """
     if isinstance(x, int):
         return x
     elif isinstance(x, tuple):
-        return random.randrange(x[0], x[1]+1)
+        randrange = random.randrange if rng is None else rng.randrange
+        return randrange(x[0], x[1]+1)
     elif callable(x):
         return x(flag_perm)
     else:
-        return TypeError(
+        raise TypeError(
             """Value must be an int, a 2 int tuple or a callable that
             returns an int"""
         )
 
 
-def _make_parameters(
+def _parameter_counts(
     flag_permutation: FLAG_PERMUTATION,
     parameter_kind: ParameterKind,
     flag: ParameterFlag | None,
     counts: dict[ParameterKind, int],
     optional_count_func: OPT_COUNT_F | None,
-    /,
-    optional_distribution_ctl: None | int = None
-) -> Iterator[BareParameter]:
+    rng: random.Random | None,
+    /
+) -> tuple[int, int]:
     """
-    Yield BareParameters of the specified kind and count.
+    Return the total and optional number of parameters of the specified kind.
 
     Count is pulled from the `counts` dict. How many paramteers
     are optional is determined by the passed parmeter flag. For
@@ -318,54 +759,141 @@ def _make_parameters(
     """
     no_flag, no_opt_flag, some_opt_flag, all_opt_flag = _FLAG_INFO[parameter_kind]
 
+    total_count: int = 0
+    optional_count: int = 0
+
     if flag is not no_flag:
-        total_count: int = counts[parameter_kind]
+        total_count = counts[parameter_kind]
 
         if flag is no_opt_flag:
-            for n in range(total_count):
-                yield bare_parameter(kind=parameter_kind, default=False)
+            optional_count = 0
         elif flag is all_opt_flag:
-            for n in range(total_count):
-                yield bare_parameter(kind=parameter_kind, default=True)
+            optional_count = total_count
         elif flag is some_opt_flag:
-            optional_count: int
-
             if optional_count_func is None:
-                optional_count = random.randrange(1, total_count - 1)
+                randrange = random.randrange if rng is None else rng.randrange
+                optional_count = randrange(1, total_count - 1)
             else:
                 optional_count = optional_count_func(
                     flag_permutation, counts, flag, parameter_kind
                 )
-
-            if parameter_kind is ParameterKind.KEYWORD_ONLY:
-                if optional_distribution_ctl is None:
-                    optional_idx = set(
-                        random.sample(range(total_count), k=optional_count)
-                    )
-                    for n in range(total_count):
-                        yield bare_parameter(
-                            parameter_kind,
-                            default=n in optional_idx
-                        )
-            else:
-                for n in range(total_count):
-                    yield bare_parameter(
-                        kind=parameter_kind,
-                        default=n > optional_count
-                    )
         else:
             raise TypeError("Unknown keyword only flag")
 
+    return total_count, optional_count
+
+
+def _make_parameter_run(
+    flag_permutation: FLAG_PERMUTATION,
+    parameter_kind: ParameterKind,
+    flag: ParameterFlag | None,
+    counts: dict[ParameterKind, int],
+    optional_count_func: OPT_COUNT_F | None,
+    rng: random.Random | None,
+    /
+) -> ParameterRun:
+    """Return a run of positional parameters, required ones first."""
+    total_count, optional_count = _parameter_counts(
+        flag_permutation, parameter_kind, flag, counts, optional_count_func, rng
+    )
+    return ParameterRun(
+        parameter_kind,
+        total_count - optional_count,
+        optional_count
+    )
+
+
+def _make_masked_parameter_run(
+    flag_permutation: FLAG_PERMUTATION,
+    parameter_kind: ParameterKind,
+    flag: ParameterFlag | None,
+    counts: dict[ParameterKind, int],
+    optional_count_func: OPT_COUNT_F | None,
+    rng: random.Random | None,
+    /
+) -> MaskedParameterRun:
+    """
+    Return a run of keyword only parameters.
+
+    Their optional parameters may be placed anywhere, so for some optional
+    parameters the placement is drawn as a random bitmask.
+    """
+    total_count, optional_count = _parameter_counts(
+        flag_permutation, parameter_kind, flag, counts, optional_count_func, rng
+    )
+    optional_mask: int
+    if flag is _FLAG_INFO[parameter_kind][2]:
+        optional_mask = utils.random_bitmask(total_count, optional_count, rng=rng)
+    else:
+        optional_mask = (1 << optional_count) - 1
+    return MaskedParameterRun(parameter_kind, total_count, optional_mask)
+
 
 def _make_var_parameter(
     parameter_kind: ParameterKind,
     flag: ParameterFlag | None
-) -> Iterator[BareParameter]:
-
+) -> bool:
+    """Return True if the flag calls for a variable parameter."""
     no_flag, yes_flag = _FLAG_INFO[parameter_kind]
+    return flag is yes_flag
+
+
+def flag_permutations(flag: ParameterFlag=ALL_FLAGS) -> Iterator[FLAG_PERMUTATION]:
+    """Yield the valid flag permutations of `flag` in generation order."""
+    partition: FlagPartition = FlagPartition(flag)
+    if not partition.is_empty():
+        yield from filter(_valid_flag_permutation, partition.product())
+
 
-    if flag is yes_flag:
-        yield bare_parameter(kind=parameter_kind, default=False)
+@overload
+def build_skeleton_signatures(
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ...,
+    positional_only_optional_count: OPT_COUNT_F | None = ...,
+    positional_or_keyword_optional_count: OPT_COUNT_F | None = ...,
+    keyword_only_optional_count: OPT_COUNT_F | None = ...,
+    rle: Literal[True],
+    interner: SkeletonInterner | None = ...,
+    rng: random.Random | None = ...,
+    start: int = ...
+) -> Iterator[RLESkeleton]: ...
+
+
+@overload
+def build_skeleton_signatures(
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ...,
+    positional_only_optional_count: OPT_COUNT_F | None = ...,
+    positional_or_keyword_optional_count: OPT_COUNT_F | None = ...,
+    keyword_only_optional_count: OPT_COUNT_F | None = ...,
+    rle: Literal[False] = ...,
+    interner: SkeletonInterner | None = ...,
+    rng: random.Random | None = ...,
+    start: int = ...
+) -> Iterator[tuple[ProtoParameter, ...]]: ...
+
+
+@overload
+def build_skeleton_signatures(
+    *,
+    positional_only: COUNT,
+    positional_or_keyword: COUNT,
+    keyword_only: COUNT,
+    flag: ParameterFlag = ...,
+    positional_only_optional_count: OPT_COUNT_F | None = ...,
+    positional_or_keyword_optional_count: OPT_COUNT_F | None = ...,
+    keyword_only_optional_count: OPT_COUNT_F | None = ...,
+    rle: bool = ...,
+    interner: SkeletonInterner | None = ...,
+    rng: random.Random | None = ...,
+    start: int = ...
+) -> Iterator[SKELETON]: ...
 
 
 def build_skeleton_signatures(
@@ -376,66 +904,104 @@ def build_skeleton_signatures(
     flag: ParameterFlag=ALL_FLAGS,
     positional_only_optional_count: OPT_COUNT_F | None = None,
     positional_or_keyword_optional_count: OPT_COUNT_F | None = None,
-    keyword_only_optional_count: OPT_COUNT_F | None = None
-) -> Iterator[tuple[BareParameter,...]]:
+    keyword_only_optional_count: OPT_COUNT_F | None = None,
+    rle: bool = False,
+    interner: SkeletonInterner | None = None,
+    rng: random.Random | None = None,
+    start: int = 0
+) -> Iterator[SKELETON]:
+    """
+    Yield a skeleton signature for each valid permutation of `flag`.
 
-    partition: FlagPartition = FlagPartition(flag)
-    if not partition.is_empty():
-        for flag_perm in partition.product():
-            if _valid_flag_permutation(flag_perm):
-                po: int
-                pk: int
-                ko: int
-
-                if flag_perm[0] is _FLAG_INFO[ParameterKind.POSITIONAL_ONLY][0]:
-                    po = 0
-                else:
-                    po = _resolve_count(flag_perm, positional_only)
-
-                if flag_perm[1] is _FLAG_INFO[ParameterKind.POSITIONAL_OR_KEYWORD][0]:
-                    pk = 0
-                else:
-                    pk = _resolve_count(flag_perm, positional_or_keyword)
-
-                if flag_perm[3] is _FLAG_INFO[ParameterKind.KEYWORD_ONLY][0]:
-                    ko = 0
-                else:
-                    ko = _resolve_count(flag_perm, keyword_only)
-
-                ranges: dict[ParameterKind, int]  = {
-                    ParameterKind.POSITIONAL_ONLY: po,
-                    ParameterKind.POSITIONAL_OR_KEYWORD: pk,
-                    ParameterKind.KEYWORD_ONLY: ko
-                }
-
-                yield tuple(itertools.chain(
-                    _make_parameters(
-                        flag_perm,
-                        ParameterKind.POSITIONAL_ONLY,
-                        flag_perm[0],
-                        ranges,
-                        positional_only_optional_count
-                    ),
-                    _make_parameters(
-                        flag_perm,
-                        ParameterKind.POSITIONAL_OR_KEYWORD,
-                        flag_perm[1],
-                        ranges,
-                        positional_or_keyword_optional_count
-                    ),
-                    _make_var_parameter(
-                        ParameterKind.VAR_POSITIONAL,
-                        flag_perm[2]
-                    ),
-                    _make_parameters(
-                        flag_perm,
-                        ParameterKind.KEYWORD_ONLY,
-                        flag_perm[3],
-                        ranges,
-                        keyword_only_optional_count
-                    ),
-                    _make_var_parameter(
-                        ParameterKind.VAR_KEYWORD,
-                        flag_perm[4]
-                    )
-                ))
+    Permutations are taken in `flag_permutations` order starting from number
+    `start`; earlier ones are skipped without drawing any random counts.
+
+    Skeletons are tuples of `ProtoParameter` unless `rle` is True, in which
+    case an `RLESkeleton` is yielded instead. This is much cheaper for very
+    wide signatures and can be expanded lazily.
+
+    If an `interner` is passed structurally equal skeletons are yielded as
+    the same object.
+
+    Random counts and keyword only defaults are drawn from `rng`, by default
+    the `random` module.
+    """
+    for flag_perm in itertools.islice(flag_permutations(flag), start, None):
+        po: int
+        pk: int
+        ko: int
+
+        if flag_perm[0] is _FLAG_INFO[ParameterKind.POSITIONAL_ONLY][0]:
+            po = 0
+        else:
+            po = _resolve_count(flag_perm, positional_only, rng)
+
+        if flag_perm[1] is _FLAG_INFO[ParameterKind.POSITIONAL_OR_KEYWORD][0]:
+            pk = 0
+        else:
+            pk = _resolve_count(flag_perm, positional_or_keyword, rng)
+
+        if flag_perm[3] is _FLAG_INFO[ParameterKind.KEYWORD_ONLY][0]:
+            ko = 0
+        else:
+            ko = _resolve_count(flag_perm, keyword_only, rng)
+
+        ranges: dict[ParameterKind, int]  = {
+            ParameterKind.POSITIONAL_ONLY: po,
+            ParameterKind.POSITIONAL_OR_KEYWORD: pk,
+            ParameterKind.KEYWORD_ONLY: ko
+        }
+
+        skeleton = RLESkeleton(
+            positional_only=_make_parameter_run(
+                flag_perm,
+                ParameterKind.POSITIONAL_ONLY,
+                flag_perm[0],
+                ranges,
+                positional_only_optional_count,
+                rng
+            ),
+            positional_or_keyword=_make_parameter_run(
+                flag_perm,
+                ParameterKind.POSITIONAL_OR_KEYWORD,
+                flag_perm[1],
+                ranges,
+                positional_or_keyword_optional_count,
+                rng
+            ),
+            var_positional=_make_var_parameter(
+                ParameterKind.VAR_POSITIONAL,
+                flag_perm[2]
+            ),
+            keyword_only=_make_masked_parameter_run(
+                flag_perm,
+                ParameterKind.KEYWORD_ONLY,
+                flag_perm[3],
+                ranges,
+                keyword_only_optional_count,
+                rng
+            ),
+            var_keyword=_make_var_parameter(
+                ParameterKind.VAR_KEYWORD,
+                flag_perm[4]
+            )
+        )
+
+        if interner is not None:
+            if rle:
+                yield interner.intern(skeleton)
+            else:
+                yield interner.expand(skeleton)
+        elif rle:
+            yield skeleton
+        else:
+            yield skeleton.expand()
+
+
+def skeleton_count(flag: ParameterFlag=ALL_FLAGS) -> int:
+    """
+    Return the number of skeletons `build_skeleton_signatures` yields for `flag`.
+
+    Only the flag permutations are enumerated, no skeletons are built.
+    """
+    return sum(1 for _ in flag_permutations(flag))
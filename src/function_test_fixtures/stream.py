@@ -0,0 +1,168 @@
+"""
+Reproducible, indexable streams of skeletons and their test cases.
+
+A `FixtureStream` numbers the skeletons `build_skeleton_signatures` yields
+for a seed, so separate processes can agree on what skeleton `i` is and
+generate its test cases without generating anybody else's.
+"""
+
+import random
+from typing import Iterator, Self
+
+from .cases import generate_test_cases
+from .checkpoint import (
+    Checkpoint,
+    CheckpointedIterator,
+    checkpointed_skeletons,
+    checkpointed_test_cases
+)
+from .arguments import TestCaseContainer
+from .parameter_stats import ParameterStats
+from .signature_gen import (
+    ALL_FLAGS,
+    COUNT,
+    ParameterFlag,
+    RLESkeleton,
+    build_skeleton_signatures,
+    skeleton_count
+)
+
+
+class FixtureStream:
+    """
+    Skeletons from `build_skeleton_signatures`, numbered and reproducible.
+
+    Skeletons are drawn from a private `random.Random` seeded by `seed` and
+    the test cases of skeleton `i` from one seeded by `seed` and `i`, so a
+    skeleton's cases are the same whichever process or thread generates
+    them and the `random` module is left alone. The
+    generator is run `repeat` times; skeletons are `RLESkeleton`s.
+    """
+
+    seed: int
+    positional_only: COUNT
+    positional_or_keyword: COUNT
+    keyword_only: COUNT
+    flag: ParameterFlag
+    repeat: int
+    _skeletons: list[RLESkeleton]
+    _iterator: Iterator[RLESkeleton] | None
+
+    def __init__(
+        self: Self,
+        seed: int,
+        *,
+        positional_only: COUNT = (3, 5),
+        positional_or_keyword: COUNT = (3, 5),
+        keyword_only: COUNT = (3, 5),
+        flag: ParameterFlag = ALL_FLAGS,
+        repeat: int = 1
+    ) -> None:
+        """Generate nothing until a skeleton is asked for."""
+        self.seed = seed
+        self.positional_only = positional_only
+        self.positional_or_keyword = positional_or_keyword
+        self.keyword_only = keyword_only
+        self.flag = flag
+        self.repeat = repeat
+        self._skeletons = []
+        self._iterator = None
+
+    def __len__(self: Self) -> int:
+        """Return the number of skeletons, without generating any."""
+        return skeleton_count(self.flag) * self.repeat
+
+    def __iter__(self: Self) -> Iterator[RLESkeleton]:
+        """Yield every skeleton without keeping them."""
+        rng = random.Random(self.seed)
+        for _ in range(self.repeat):
+            yield from build_skeleton_signatures(
+                positional_only=self.positional_only,
+                positional_or_keyword=self.positional_or_keyword,
+                keyword_only=self.keyword_only,
+                flag=self.flag,
+                rle=True,
+                rng=rng
+            )
+
+    def __getitem__(self: Self, index: int, /) -> RLESkeleton:
+        """
+        Return skeleton `index`.
+
+        Skeletons up to `index` are generated and kept, so looking skeletons
+        up in any order costs one pass over the stream in total.
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("skeleton index out of range")
+        if self._iterator is None:
+            self._iterator = iter(self)
+        while len(self._skeletons) <= index:
+            self._skeletons.append(next(self._iterator))
+        return self._skeletons[index]
+
+    def test_cases(
+        self: Self,
+        index: int,
+        skeleton: RLESkeleton | None = None,
+        /,
+        *,
+        extras: int = 1,
+        k: int | None = None
+    ) -> Iterator[TestCaseContainer]:
+        """
+        Yield the test cases of skeleton `index`, see `generate_test_cases`.
+
+        Pass the skeleton too if it is already at hand, e.g. when iterating
+        over the stream, to save looking it up.
+        """
+        if skeleton is None:
+            skeleton = self[index]
+        return generate_test_cases(
+            ParameterStats.from_skeleton(skeleton),
+            extras=extras,
+            k=k,
+            rng=random.Random(f'{self.seed}/{index}')
+        )
+
+    def checkpointed(
+        self: Self,
+        checkpoint: Checkpoint | None = None,
+        /
+    ) -> CheckpointedIterator[RLESkeleton]:
+        """
+        Iterate the skeletons with checkpoints, see `CheckpointedIterator`.
+
+        Yields what iterating the stream does, resuming after `checkpoint`
+        if one is given.
+        """
+        return checkpointed_skeletons(
+            self.seed,
+            positional_only=self.positional_only,
+            positional_or_keyword=self.positional_or_keyword,
+            keyword_only=self.keyword_only,
+            flag=self.flag,
+            repeat=self.repeat,
+            rle=True,
+            checkpoint=checkpoint
+        )
+
+    def checkpointed_test_cases(
+        self: Self,
+        index: int,
+        skeleton: RLESkeleton | None = None,
+        /,
+        *,
+        extras: int = 1,
+        k: int | None = None,
+        checkpoint: Checkpoint | None = None
+    ) -> CheckpointedIterator[TestCaseContainer]:
+        """Yield what `test_cases` does, with checkpoints."""
+        if skeleton is None:
+            skeleton = self[index]
+        return checkpointed_test_cases(
+            ParameterStats.from_skeleton(skeleton),
+            f'{self.seed}/{index}',
+            extras=extras,
+            k=k,
+            checkpoint=checkpoint
+        )
@@ -0,0 +1,117 @@
+"""Compile skeleton signatures into real Python functions."""
+
+import functools
+import types
+from typing import NamedTuple
+
+from .signature_gen import SHAPE, SKELETON, parameter_names, skeleton_shape
+
+
+STUB_CACHE_SIZE: int = 1024
+
+
+class StubCacheInfo(NamedTuple):
+    """Statistics for the compiled code cache, as `functools.lru_cache` keeps."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def _stub_source(shape: SHAPE, /) -> tuple[str, int, tuple[str, ...]]:
+    """
+    Return the source of a stub with the given shape.
+
+    Also returns the number of positional parameters with defaults and the
+    names of keyword only parameters with defaults. Parameters are named as
+    by `signature_gen.parameter_names`.
+    """
+    po_required, po_optional, pk_required, pk_optional, var_positional, \
+        ko_count, ko_mask, var_keyword = shape
+
+    parameters: list[str] = []
+    names: list[str] = []
+
+    defaults: list[bool] = (
+        [False] * po_required + [True] * po_optional
+        + [False] * pk_required + [True] * pk_optional
+    )
+    for n, (name, optional) in enumerate(
+        zip(parameter_names('p', len(defaults)), defaults)
+    ):
+        parameters.append(f'{name}=None' if optional else name)
+        names.append(name)
+        if n == po_required + po_optional - 1:
+            parameters.append('/')
+
+    if var_positional:
+        parameters.append('*args')
+        names.append('args')
+    elif ko_count:
+        parameters.append('*')
+
+    ko_defaults: list[str] = []
+    for i, name in enumerate(parameter_names('k', ko_count)):
+        if ko_mask >> i & 1:
+            parameters.append(f'{name}=None')
+            ko_defaults.append(name)
+        else:
+            parameters.append(name)
+        names.append(name)
+
+    if var_keyword:
+        parameters.append('**kwargs')
+        names.append('kwargs')
+
+    source = (
+        f"def stub({', '.join(parameters)}):\n"
+        f"    return ({''.join(name + ', ' for name in names)})\n"
+    )
+    return source, po_optional + pk_optional, tuple(ko_defaults)
+
+
+@functools.lru_cache(maxsize=STUB_CACHE_SIZE)
+def _compile_stub(shape: SHAPE, /) -> tuple[types.CodeType, int, tuple[str, ...]]:
+    """Compile a stub's code object; cached by shape."""
+    source, positional_defaults, keyword_defaults = _stub_source(shape)
+    module = compile(source, f"<stub {shape}>", "exec")
+    code = next(c for c in module.co_consts if isinstance(c, types.CodeType))
+    return code, positional_defaults, keyword_defaults
+
+
+def compile_stub(
+    skeleton: SKELETON,
+    /,
+    *,
+    name: str = 'stub',
+    default: object = None
+) -> types.FunctionType:
+    """
+    Return a new function whose signature matches `skeleton`.
+
+    The function returns a tuple of its parameters' values in order, so
+    calling it exercises CPython's own argument binding. Every optional
+    parameter defaults to `default`.
+
+    Code objects are cached by the skeleton's shape, so after the first stub
+    of a shape creating another is just a function object allocation.
+    """
+    code, positional_defaults, keyword_defaults = _compile_stub(
+        skeleton_shape(skeleton)
+    )
+    stub = types.FunctionType(
+        code,
+        {},
+        name,
+        (default,) * positional_defaults or None
+    )
+    if keyword_defaults:
+        stub.__kwdefaults__ = dict.fromkeys(keyword_defaults, default)
+    stub.__qualname__ = name
+    return stub
+
+
+def stub_cache_info() -> StubCacheInfo:
+    """Return hit and miss statistics for the compiled code cache."""
+    return StubCacheInfo(*_compile_stub.cache_info())
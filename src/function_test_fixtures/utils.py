@@ -13,7 +13,13 @@ def copy_seq_generator(seq: Iterable[S]) -> Iterator[S]:
     yield from (copy.copy(x) for x in seq)
 
 
-def split_int(n: int, /, *, x: int | None=None) -> frozenset[tuple[int,int]]:
+def split_int(
+    n: int,
+    /,
+    *,
+    x: int | None=None,
+    rng: random.Random | None = None
+) -> frozenset[tuple[int,int]]:
     """
     Return 2-tuples where the sum of the tuple's members is 2.
 
@@ -22,11 +28,13 @@ def split_int(n: int, /, *, x: int | None=None) -> frozenset[tuple[int,int]]:
     determined split is also returned.
 
     This third split may be forced using the option `x` keyword
-    only parameter.
+    only parameter, otherwise it is drawn from `rng`, by default the
+    `random` module's generator.
     """
     if n > 1:
         if x is None:
-            x = random.randrange(1, n)
+            randrange = random.randrange if rng is None else rng.randrange
+            x = randrange(1, n)
         elif x <= 0 or x >= n:
             raise TypeError("`x` must be in range 1..n-1")
 
@@ -37,7 +45,12 @@ def split_int(n: int, /, *, x: int | None=None) -> frozenset[tuple[int,int]]:
         return frozenset({(0, 0)})
 
 
-def test_low_range(n: int, m: int | None = None) -> tuple[int,...]:
+def test_low_range(
+    n: int,
+    m: int | None = None,
+    *,
+    rng: random.Random | None = None
+) -> tuple[int,...]:
     """Equivlent to test_range(start, stop)[:-1] except start == stop is an error."""
     start: int
     stop: int
@@ -55,10 +68,16 @@ def test_low_range(n: int, m: int | None = None) -> tuple[int,...]:
         case 2:
             return (start, start+1)
         case _:
-            return (start, random.randrange(start+1, stop))
+            randrange = random.randrange if rng is None else rng.randrange
+            return (start, randrange(start+1, stop))
 
 
-def test_high_range(n: int, m: int | None = None) -> tuple[int,...]:
+def test_high_range(
+    n: int,
+    m: int | None = None,
+    *,
+    rng: random.Random | None = None
+) -> tuple[int,...]:
     """Equivlent to test_range(start, stop)[1:] except start == stop is an error."""
     start: int
     stop: int
@@ -76,15 +95,23 @@ def test_high_range(n: int, m: int | None = None) -> tuple[int,...]:
         case 2:
             return (stop-1, stop)
         case _:
-            return (random.randrange(start+1, stop), stop)
+            randrange = random.randrange if rng is None else rng.randrange
+            return (randrange(start+1, stop), stop)
 
 
-def test_range(n: int, m: int | None=None, /) -> tuple[int, ...]:
+def test_range(
+    n: int,
+    m: int | None=None,
+    /,
+    *,
+    rng: random.Random | None = None
+) -> tuple[int, ...]:
     """
     An immutable sequence of numbers between `start` and `stop`.
 
     This includes `start`, `stop` and if the the `stop - start > 1`
-    a third random int betwen start and stop.
+    a third random int betwen start and stop, drawn from `rng` or by
+    default the `random` module.
     """
     start: int
     stop: int
@@ -104,4 +131,128 @@ def test_range(n: int, m: int | None=None, /) -> tuple[int, ...]:
             # intermedite value
             return (start, start+1, stop)
         case _:
-            return (start, random.randrange(start + 1, stop), stop)
+            randrange = random.randrange if rng is None else rng.randrange
+            return (start, randrange(start + 1, stop), stop)
+
+
+def bit_indices(mask: int, /) -> list[int]:
+    """Return the indices of the set bits of `mask` in ascending order."""
+    if mask < 0:
+        raise TypeError("`mask` must not be negative")
+
+    # scanning the reversed binary string is done in C and so is far quicker
+    # than repeatedly clearing the lowest set bit of a wide int
+    bits: str = bin(mask)[:1:-1]
+    indices: list[int] = []
+    n: int = bits.find('1')
+    while n != -1:
+        indices.append(n)
+        n = bits.find('1', n + 1)
+    return indices
+
+
+def mask_from_indices(indices: Iterable[int], n: int, /) -> int:
+    """Return an `n` bit int with the bits at `indices` set."""
+    buffer = bytearray((n + 7) >> 3)
+    for i in indices:
+        buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def random_bitmask(n: int, k: int, /, *, rng: random.Random | None = None) -> int:
+    """
+    Return a uniformly random `n` bit int with exactly `k` bits set.
+
+    When `k` is close to n/2 a random int is drawn and bits are flipped until
+    the popcount is `k`; this keeps the distribution uniform as each flip is
+    made at a uniformly random position. Otherwise `k` (or n - k) indices are
+    sampled and written into a byte buffer, which is O(n + k).
+
+    Draws come from `rng`, by default the `random` module's generator.
+    """
+    if not 0 <= k <= n:
+        raise TypeError("`k` must be in range 0..n")
+
+    full: int = (1 << n) - 1
+    if k * 2 > n:
+        return full ^ random_bitmask(n, n - k, rng=rng)
+    elif k == 0:
+        return 0
+
+    # rough cost model: a flip costs a little interpreter overhead plus a copy
+    # of the int, sampling costs a little interpreter overhead per index
+    if (n // 2 - k) * (20000 + n) < 10000 * k:
+        getrandbits = random.getrandbits if rng is None else rng.getrandbits
+        randrange = random.randrange if rng is None else rng.randrange
+        mask: int = getrandbits(n)
+        count: int = mask.bit_count()
+
+        while count > k:
+            bit = 1 << randrange(n)
+            if mask & bit:
+                mask ^= bit
+                count -= 1
+        while count < k:
+            bit = 1 << randrange(n)
+            if not mask & bit:
+                mask |= bit
+                count += 1
+        return mask
+    else:
+        sample = random.sample if rng is None else rng.sample
+        return mask_from_indices(sample(range(n), k), n)
+
+
+def deposit_bits(source: int, mask: int, /) -> int:
+    """
+    Scatter the low bits of `source` into the set bit positions of `mask`.
+
+    Bit `i` of `source` is copied to the position of the ith set bit of
+    `mask`, like the PDEP instruction.
+    """
+    positions = bit_indices(mask)
+    return mask_from_indices(
+        (positions[i] for i in bit_indices(source)),
+        mask.bit_length()
+    )
+
+
+def random_submask(mask: int, k: int, /, *, rng: random.Random | None = None) -> int:
+    """Return a uniformly random submask of `mask` with exactly `k` bits set."""
+    return deposit_bits(random_bitmask(mask.bit_count(), k, rng=rng), mask)
+
+
+def test_stratified_range(
+    start: int,
+    stop: int,
+    k: int,
+    /,
+    *,
+    rng: random.Random | None = None
+) -> tuple[int, ...]:
+    """
+    A sorted, deduplicated sample of `k` strata between `start` and `stop`.
+
+    The integers in `start..stop` (inclusive) are split into `k` strata of
+    near equal size and one random value is drawn from each. `start` and
+    `stop` are always included. If `k` is at least the number of integers in
+    the interval every integer is returned. Draws come from `rng`, by
+    default the `random` module's generator.
+    """
+    if k < 1:
+        raise TypeError("`k` must be at least 1")
+    elif stop < start:
+        raise TypeError("`stop` must not be less than `start`")
+
+    size: int = stop - start + 1
+    points: set[int] = {start, stop}
+    low: int = start
+    randrange = random.randrange if rng is None else rng.randrange
+
+    for i in range(1, k + 1):
+        high = start + (i * size) // k
+        if high > low:
+            points.add(randrange(low, high))
+        low = high
+
+    return tuple(sorted(points))
@@ -1,6 +1,6 @@
 import pytest
 from function_test_fixtures.constants_and_types import ParameterKind
-from function_test_fixtures.sig_gen import ParameterFlag
+from function_test_fixtures.signature_gen import ParameterFlag
 
 
 @pytest.fixture(params=[
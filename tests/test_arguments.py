@@ -0,0 +1,41 @@
+import itertools
+from function_test_fixtures import arguments
+
+
+def make_container(k):
+    return arguments.TestCaseContainer(
+        positional_arguments=(arguments.TestPositional(1),),
+        keyword_arguments=tuple(arguments.TestKeyword(n) for n in range(1, k + 1))
+    )
+
+
+def test_shuffled_keyword_arguments():
+    c = make_container(5)
+    assert sorted(c.shuffled_keyword_arguments(), key=lambda x: x.n) == list(
+        c.keyword_arguments
+    )
+
+
+def test_iter_is_positional_first():
+    c = make_container(3)
+    xs = list(c)
+    assert xs[0] == arguments.TestPositional(1)
+    assert set(xs[1:]) == set(c.keyword_arguments)
+
+
+def test_iter_keyword_orderings_exhaustive():
+    c = make_container(4)
+    xs = list(c.iter_keyword_orderings())
+    assert len(xs) == c.keyword_ordering_count() == 24
+    assert set(xs) == set(itertools.permutations(c.keyword_arguments))
+
+
+def test_iter_keyword_orderings_sampled():
+    c = make_container(9)
+    xs = list(c.iter_keyword_orderings(100))
+    assert len(set(xs)) == 100
+
+
+def test_ordered_keyword_arguments_first():
+    c = make_container(6)
+    assert c.ordered_keyword_arguments(0) == c.keyword_arguments
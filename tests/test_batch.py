@@ -0,0 +1,143 @@
+import random
+import pytest
+from function_test_fixtures import batch, utils
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(batch, "_numpy", lambda: None)
+    return request.param
+
+
+def rows(result):
+    values, lengths = result
+    return [tuple(int(v) for v in row[:n]) for row, n in zip(values, lengths)]
+
+
+def rows2(result):
+    values, lengths = result
+    return [
+        tuple((int(a), int(b)) for a, b in row[:n]) for row, n in zip(values, lengths)
+    ]
+
+
+STARTS = [9, 16, 4, 13, 0, 0, 0, 0]
+STOPS = [10, 16, 6, 40, 0, 1, 2, 23]
+
+
+def test_test_range_batch_matches_scalar(backend):
+    xs = rows(batch.test_range_batch(STARTS, STOPS))
+    assert xs[:3] == [(9, 10), (16,), (4, 5, 6)]
+    assert xs[4:7] == [(0,), (0, 1), (0, 1, 2)]
+    for (a, b), x in zip(zip(STARTS, STOPS), xs):
+        assert len(x) == len(utils.test_range(a, b))
+        assert x[0] == a and x[-1] == b
+        assert all(a < v < b for v in x[1:-1])
+
+
+def test_test_range_batch_stop_only(backend):
+    assert rows(batch.test_range_batch([0, 1, 2])) == [(0,), (0, 1), (0, 1, 2)]
+
+
+def test_test_range_batch_padding(backend):
+    values, _ = batch.test_range_batch([5, 5], [5, 6])
+    assert [list(map(int, v)) for v in values] == [[5, 5, 5], [5, 6, 6]]
+
+
+def test_test_low_range_batch(backend):
+    xs = rows(batch.test_low_range_batch([9, 4, 13], [10, 6, 40]))
+    assert xs[:2] == [(9,), (4, 5)]
+    assert xs[2][0] == 13 and 13 < xs[2][1] < 40
+
+
+def test_test_high_range_batch(backend):
+    xs = rows(batch.test_high_range_batch([101, 34, 7], [102, 36, 51]))
+    assert xs[:2] == [(102,), (35, 36)]
+    assert 7 < xs[2][0] < 51 and xs[2][1] == 51
+
+
+@pytest.mark.parametrize("f", [batch.test_low_range_batch, batch.test_high_range_batch])
+def test_range_batch_diff0(backend, f):
+    with pytest.raises(TypeError):
+        f([1, 16], [2, 16])
+
+
+@pytest.mark.parametrize("f", [batch.test_low_range_batch, batch.test_high_range_batch])
+@pytest.mark.parametrize("starts, stops, error", [
+    ([5, 1], [1, 1], ValueError),
+    ([1, 5], [1, 1], TypeError),
+])
+def test_range_batch_first_invalid_row(backend, f, starts, stops, error):
+    # both backends report the first invalid row, as the scalar loop would
+    with pytest.raises(error):
+        f(starts, stops)
+
+
+def test_test_range_batch_reversed(backend):
+    with pytest.raises(ValueError):
+        batch.test_range_batch([10], [5])
+
+
+def test_split_int_batch(backend):
+    xs = rows2(batch.split_int_batch([0, 1, 11]))
+    assert xs[0] == ((0, 0),)
+    assert set(xs[1]) == {(1, 0), (0, 1)}
+    assert len(set(xs[2])) == 3
+    assert all(sum(s) == 11 for s in xs[2])
+
+
+def test_split_int_batch_forced(backend):
+    xs = rows2(batch.split_int_batch([11, 1], x=[3, 0]))
+    assert set(xs[0]) == {(11, 0), (3, 8), (0, 11)}
+    assert set(xs[1]) == {(1, 0), (0, 1)}
+
+
+def test_split_int_batch_invalid_x(backend):
+    with pytest.raises(TypeError):
+        batch.split_int_batch([11, 5], x=[3, 5])
+
+
+def test_batch_is_reproducible(backend):
+    random.seed(3)
+    a = rows(batch.test_range_batch([0] * 50, [1000] * 50))
+    random.seed(3)
+    b = rows(batch.test_range_batch([0] * 50, [1000] * 50))
+    assert a == b
+
+
+def test_test_stratified_range_batch(backend):
+    starts = [0, 4, 5, 13]
+    stops = [999, 7, 5, 400]
+    xs = rows(batch.test_stratified_range_batch(starts, stops, 10))
+    assert xs[1] == (4, 5, 6, 7)
+    assert xs[2] == (5,)
+    for a, b, x in zip(starts, stops, xs):
+        assert x[0] == a and x[-1] == b
+        assert list(x) == sorted(set(x))
+    assert {v // 100 for v in xs[0][1:-1]} >= set(range(1, 9))
+
+
+def test_test_stratified_range_batch_reversed(backend):
+    with pytest.raises(TypeError):
+        batch.test_stratified_range_batch([0, 10], [5, 0], 3)
+
+
+def test_test_stratified_range_batch_padding(backend):
+    values, lengths = batch.test_stratified_range_batch([4], [7], 10)
+    assert [int(v) for v in values[0]] == [4, 5, 6, 7] + [7] * 8
+
+
+def test_wide_values_do_not_overflow(backend):
+    big = 2 ** 70
+    xs = rows(batch.test_range_batch([0, -big], [big, 5]))
+    assert xs[0][0] == 0 and 0 < xs[0][1] < big and xs[0][2] == big
+    assert xs[1][0] == -big and -big < xs[1][1] < 5
+    assert rows(batch.test_low_range_batch([big], [big + 1])) == [(big,)]
+    assert rows(batch.test_high_range_batch([big], [big + 1])) == [(big + 1,)]
+    xs = rows2(batch.split_int_batch([big]))
+    assert all(sum(s) == big for s in xs[0])
+    xs = rows(batch.test_stratified_range_batch([0], [2 ** 60], 10))
+    assert xs[0][0] == 0 and xs[0][-1] == 2 ** 60 and list(xs[0]) == sorted(set(xs[0]))
@@ -0,0 +1,111 @@
+import inspect
+import itertools
+import json
+
+import pytest
+
+from function_test_fixtures.budget import (
+    Deadline,
+    budgeted_skeletons,
+    budgeted_test_cases,
+    within
+)
+from function_test_fixtures.cases import iter_case_coordinates
+from function_test_fixtures.constants_and_types import KEYWORD_ONLY, POSITIONAL_ONLY
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.signature_gen import (
+    ParameterFlag,
+    flag_permutations,
+    skeleton_count
+)
+
+
+COUNTS = dict(positional_only=(3, 5), positional_or_keyword=(3, 5), keyword_only=(3, 5))
+
+
+def ticking_clock():
+    """A clock that advances one second each time it is read."""
+    return itertools.count().__next__
+
+
+def f(a, b, /, c, d=1, *args, e, g=2, **kwargs):
+    pass
+
+
+def test_deadline_reads_clock_every_stride():
+    reads = []
+    clock = ticking_clock()
+
+    def counting_clock():
+        reads.append(None)
+        return clock()
+
+    deadline = Deadline(1000, stride=4, clock=counting_clock)
+    for _ in range(9):
+        assert not deadline.expired()
+    # one read on construction, then the 1st, 5th and 9th checks
+    assert len(reads) == 4
+
+
+def test_deadline_stays_expired():
+    deadline = Deadline(2, stride=1, clock=ticking_clock())
+    assert not deadline.expired()
+    assert deadline.expired()
+    assert deadline.expired()
+    assert deadline.remaining() == 0
+    assert list(within(range(10), deadline)) == []
+
+
+def test_budget_zero_produces_nothing():
+    skeletons, report = budgeted_skeletons(0, **COUNTS)
+    assert skeletons == []
+    assert report.next_index == 0
+    assert len(report.skipped) == skeleton_count()
+    assert report.skipped_counts[POSITIONAL_ONLY] == [3, 4, 5]
+
+
+def test_skeletons_resume_where_budget_stopped():
+    first, report = budgeted_skeletons(
+        Deadline(50, stride=1, clock=ticking_clock()), **COUNTS
+    )
+    assert 0 < len(first) < skeleton_count()
+    assert not report.complete
+    assert report.covered + report.skipped == list(flag_permutations())
+    json.dumps(report.to_json())
+
+    rest, resumed = budgeted_skeletons(1000, start=report.next_index, **COUNTS)
+    assert resumed.complete
+    assert resumed.covered == report.skipped
+    assert len(first) + len(rest) == skeleton_count()
+
+
+def test_counts_only_for_kinds_with_parameters():
+    flag = (
+        ParameterFlag.NO_POSITIONAL_ONLY
+        | ParameterFlag.POSITIONAL_OR_KEYWORD_NO_OPTIONAL
+        | ParameterFlag.KEYWORD_ONLY_NO_OPTIONAL
+    )
+    _, report = budgeted_skeletons(1000, flag=flag, **COUNTS)
+    assert POSITIONAL_ONLY not in report.counts
+    # a single permutation draws a single keyword only count
+    assert len(report.counts[KEYWORD_ONLY]) == 1
+    assert sorted(report.counts[KEYWORD_ONLY] + report.skipped_counts[KEYWORD_ONLY]) \
+        == [3, 4, 5]
+
+
+def test_test_cases_resume():
+    stats = ParameterStats(inspect.signature(f))
+    everything = list(iter_case_coordinates(stats))
+    cases, report = budgeted_test_cases(
+        Deadline(10, stride=1, clock=ticking_clock()), stats
+    )
+    assert len(cases) == len(report.covered) < len(everything)
+    rest, resumed = budgeted_test_cases(1000, stats, start=report.next_index)
+    assert resumed.complete
+    assert report.covered + resumed.covered == everything
+    assert len(cases) + len(rest) == len(everything)
+
+
+def test_bad_stride():
+    with pytest.raises(TypeError):
+        Deadline(1, stride=0)
@@ -0,0 +1,82 @@
+import inspect
+import random
+import pytest
+from function_test_fixtures import arguments
+from function_test_fixtures.cases import (
+    case_coordinates,
+    generate_test_cases,
+    iter_case_coordinates,
+    make_test_case
+)
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.serialize import case_record
+from function_test_fixtures.signature_gen import (
+    build_skeleton_signatures,
+    make_signature
+)
+from function_test_fixtures.stubs import compile_stub
+
+
+def f(a, b, /, c, d=1, *args, e, g=2, **kwargs):
+    pass
+
+
+def h(a, b=1, *, c):
+    pass
+
+
+def outcome(func, container, stats):
+    args, kwargs = container.call_arguments(stats)
+    try:
+        func(*args, **kwargs)
+    except TypeError:
+        return False
+    return True
+
+
+def test_generated_cases_call_real_functions():
+    stats = ParameterStats(inspect.signature(f))
+    xs = list(generate_test_cases(stats))
+    assert xs
+    assert all(outcome(f, x, stats) for x in xs)
+
+
+def test_extras_without_var_parameters_are_rejected():
+    stats = ParameterStats(inspect.signature(h))
+    xs = list(generate_test_cases(stats))
+    extras = [
+        any(isinstance(a, arguments.UnmappedArgPlaceholder) for a in x) for x in xs
+    ]
+    assert True in extras and False in extras
+    # exactly the cases passing extra arguments fail to call h
+    assert [outcome(h, x, stats) for x in xs] == [not extra for extra in extras]
+
+
+@pytest.mark.parametrize("n", range(0, 192, 17))
+def test_cases_for_generated_skeletons(n):
+    skeleton = list(build_skeleton_signatures(
+        positional_only=3,
+        positional_or_keyword=3,
+        keyword_only=3
+    ))[n]
+    stats = ParameterStats(make_signature(skeleton))
+    stub = compile_stub(skeleton)
+    for x in generate_test_cases(stats, extras=0):
+        assert outcome(stub, x, stats)
+
+
+def test_case_coordinates_inverts_make_test_case():
+    stats = ParameterStats(inspect.signature(f))
+    for coordinates in iter_case_coordinates(stats):
+        assert case_coordinates(make_test_case(stats, coordinates)) == coordinates
+
+
+@pytest.mark.parametrize("k", [None, 3])
+def test_every_draw_comes_from_rng(k):
+    stats = ParameterStats(inspect.signature(f))
+    random.seed(5)
+    expected = [case_record(0, x) for x in generate_test_cases(stats, k=k)]
+    random.seed(0)
+    cases = generate_test_cases(stats, k=k, rng=random.Random(5))
+    assert [case_record(0, x) for x in cases] == expected
+    assert random.random() == random.Random(0).random()
@@ -0,0 +1,147 @@
+import inspect
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from function_test_fixtures.checkpoint import (
+    Checkpoint,
+    checkpointed_skeletons,
+    checkpointed_test_cases
+)
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.serialize import JSONLEncoder
+from function_test_fixtures.signature_gen import skeleton_shape
+from function_test_fixtures.stream import FixtureStream
+
+
+# writes skeletons and their cases as JSON lines, stopping and saving a
+# checkpoint after skeleton `stop` or resuming from a saved checkpoint
+SCRIPT = '''
+import os
+import sys
+from function_test_fixtures.checkpoint import Checkpoint
+from function_test_fixtures.serialize import JSONLEncoder
+from function_test_fixtures.signature_gen import skeleton_shape
+from function_test_fixtures.stream import FixtureStream
+
+path, stop = sys.argv[1], int(sys.argv[2])
+stream = FixtureStream(7, repeat=2)
+skeletons = stream.checkpointed(Checkpoint.load(path) if os.path.exists(path) else None)
+encoder = JSONLEncoder()
+for skeleton in skeletons:
+    index = skeletons.index - 1
+    sys.stdout.buffer.write(encoder.skeleton(index, skeleton_shape(skeleton)))
+    for case in stream.test_cases(index, skeleton):
+        sys.stdout.buffer.write(encoder.case(index, case))
+    if skeletons.index == stop:
+        skeletons.checkpoint().save(path)
+        break
+'''
+
+
+def f(a, b, /, c, d=1, *args, e, g=2, **kwargs):
+    pass
+
+
+def run(path, stop, hash_seed):
+    result = subprocess.run(
+        [sys.executable, '-c', SCRIPT, str(path), str(stop)],
+        capture_output=True,
+        check=True,
+        env={
+            **os.environ,
+            'PYTHONPATH': os.pathsep.join(sys.path),
+            'PYTHONHASHSEED': str(hash_seed),
+        }
+    )
+    return result.stdout
+
+
+def test_resumed_run_is_byte_identical(tmp_path):
+    path = tmp_path / 'checkpoint.json'
+    uninterrupted = run(tmp_path / 'missing.json', -1, 0)
+    # stop in the second repetition of the flag permutations
+    first = run(path, 250, 1)
+    second = run(path, -1, 2)
+    assert first and second
+    assert first + second == uninterrupted
+
+
+def test_matches_uninterrupted_stream():
+    stream = FixtureStream(3, repeat=2)
+    expected = [skeleton_shape(s) for s in stream]
+    skeletons = stream.checkpointed()
+    shapes = [skeleton_shape(next(skeletons)) for _ in range(200)]
+    saved = json.loads(json.dumps(skeletons.checkpoint().to_json()))
+    checkpoint = Checkpoint.from_json(saved)
+    shapes.extend(skeleton_shape(s) for s in stream.checkpointed(checkpoint))
+    assert shapes == expected
+
+
+@pytest.mark.parametrize('stop', [1, 2, 5, 9])
+def test_test_cases_resume_mid_skeleton(stop):
+    stats = ParameterStats(inspect.signature(f))
+    encoder = JSONLEncoder()
+    uninterrupted = b''.join(
+        encoder.case(0, c) for c in checkpointed_test_cases(stats, 's')
+    )
+
+    cases = checkpointed_test_cases(stats, 's')
+    head = b''.join(encoder.case(0, next(cases)) for _ in range(stop))
+    # the global random state must not leak into the checkpointed iterator
+    random.seed(99)
+    resumed = checkpointed_test_cases(stats, 's', checkpoint=cases.checkpoint())
+    assert head + b''.join(encoder.case(0, c) for c in resumed) == uninterrupted
+
+
+def test_stream_test_cases_match():
+    stream = FixtureStream(3)
+    skeleton = stream[5]
+    encoder = JSONLEncoder()
+    assert [encoder.case(5, c) for c in stream.checkpointed_test_cases(5, skeleton)] \
+        == [encoder.case(5, c) for c in stream.test_cases(5, skeleton)]
+
+
+@pytest.mark.parametrize('index', [0, 3, 6, 9])
+def test_stream_test_cases_resume_anywhere(index):
+    stream = FixtureStream(3)
+    skeleton = stream[index]
+    encoder = JSONLEncoder()
+    expected = [
+        encoder.case(index, c)
+        for c in stream.checkpointed_test_cases(index, skeleton)
+    ]
+    for stop in range(1, len(expected)):
+        cases = stream.checkpointed_test_cases(index, skeleton)
+        head = [encoder.case(index, next(cases)) for _ in range(stop)]
+        resumed = stream.checkpointed_test_cases(
+            index, skeleton, checkpoint=cases.checkpoint()
+        )
+        assert head + [encoder.case(index, c) for c in resumed] == expected
+
+
+def test_refuses_other_parameters(tmp_path):
+    counts = dict(positional_only=3, positional_or_keyword=3, keyword_only=3)
+    skeletons = checkpointed_skeletons(1, **counts)
+    next(skeletons)
+    path = tmp_path / 'checkpoint.json'
+    skeletons.checkpoint().save(path)
+    checkpoint = Checkpoint.load(path)
+    assert checkpoint == skeletons.checkpoint()
+    with pytest.raises(TypeError):
+        checkpointed_skeletons(2, checkpoint=checkpoint, **counts)
+    with pytest.raises(TypeError):
+        checkpointed_skeletons(
+            1, checkpoint=checkpoint, **{**counts, 'keyword_only': 4}
+        )
+
+
+def test_callable_counts_cannot_be_checkpointed():
+    with pytest.raises(TypeError):
+        checkpointed_skeletons(
+            1, positional_only=lambda p: 3, positional_or_keyword=3, keyword_only=3
+        )
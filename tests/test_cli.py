@@ -0,0 +1,133 @@
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from function_test_fixtures.cli import main
+from function_test_fixtures.distributions import CorpusDistribution
+from function_test_fixtures.replay import DecisionLog
+from function_test_fixtures.serialize import (
+    _read_varint,
+    case_record,
+    encode_varint,
+    read_binary,
+    read_jsonl
+)
+
+
+ARGS = ['--seed', '7', '--chunk-size', '5']
+
+
+def run(*argv):
+    out = io.BytesIO()
+    assert main([*ARGS, *argv], stdout=out) == 0
+    return out.getvalue()
+
+
+def records(*argv):
+    return list(read_jsonl(io.BytesIO(run(*argv))))
+
+
+def test_seed_is_reproducible():
+    assert run() == run()
+
+
+def test_binary_matches_jsonl():
+    assert list(read_binary(io.BytesIO(run('--format', 'binary')))) == records()
+
+
+def test_shards_partition_the_output():
+    full = records()
+    shards = [records('--shard', f'{i}/3') for i in range(3)]
+    assert sorted(map(repr, full)) == sorted(
+        repr(r) for shard in shards for r in shard
+    )
+    for i, shard in enumerate(shards):
+        assert all(
+            r.get('index', r.get('skeleton')) % 3 == i for r in shard
+        )
+
+
+def test_balanced_shards_partition_the_output():
+    full = records()
+    shards = [records('--shard', f'{i}/3', '--balance') for i in range(3)]
+    assert sorted(map(repr, full)) == sorted(
+        repr(r) for shard in shards for r in shard
+    )
+
+
+def test_no_cases():
+    assert {r['type'] for r in records('--no-cases')} == {'skeleton'}
+
+
+def test_flags_and_counts():
+    skeletons = records(
+        '--no-cases',
+        '--flag', 'positional_only_no_optional',
+        '--positional-only', '2',
+        '--repeat', '3'
+    )
+    assert [r['shape'] for r in skeletons] == [[2, 0, 0, 0, 0, 0, 0, 0]] * 3
+
+
+def test_distribution(tmp_path):
+    path = tmp_path / 'counts.json'
+    CorpusDistribution({}, signatures=0).save(path)
+    skeletons = records(
+        '--no-cases', '--distribution', str(path),
+        '--flag', 'keyword_only_no_optional'
+    )
+    assert [r['shape'] for r in skeletons] == [[0, 0, 0, 0, 0, 1, 0, 0]]
+
+
+@pytest.mark.parametrize("argv", [['--shard', '3/3'], ['--positional-only', 'x']])
+def test_bad_arguments(argv):
+    with pytest.raises(SystemExit):
+        main(argv, stdout=io.BytesIO())
+
+
+@pytest.mark.parametrize("n", [0, 1, 127, 128, 300, 1 << 70])
+def test_varint_roundtrip(n):
+    assert _read_varint(io.BytesIO(encode_varint(n))) == n
+
+
+def test_module_entry_point():
+    result = subprocess.run(
+        [sys.executable, '-m', 'function_test_fixtures', *ARGS, '--no-cases'],
+        capture_output=True,
+        check=True,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    )
+    assert result.stdout == run('--no-cases')
+
+
+def test_decision_log(tmp_path):
+    path = tmp_path / 'log.json'
+    emitted = records('--shard', '1/4', '--decision-log', str(path))
+    log = DecisionLog.load(path)
+    cases = [r for r in emitted if r['type'] == 'case']
+    replayed = [
+        case_record(index, log.test_case(index, n))
+        for index in log.indices()
+        for n in range(log.case_count(index))
+    ]
+    assert replayed == cases
+
+
+def test_output_does_not_depend_on_hash_seed():
+    outputs = set()
+    for hash_seed in ('1', '2', '3'):
+        result = subprocess.run(
+            [sys.executable, '-m', 'function_test_fixtures', *ARGS],
+            capture_output=True,
+            check=True,
+            env={
+                **os.environ,
+                'PYTHONPATH': os.pathsep.join(sys.path),
+                'PYTHONHASHSEED': hash_seed
+            }
+        )
+        outputs.add(result.stdout)
+    assert len(outputs) == 1
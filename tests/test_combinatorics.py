@@ -0,0 +1,153 @@
+import itertools
+import math
+import pytest
+from function_test_fixtures import combinatorics
+
+
+@pytest.mark.parametrize("n,k", [(0, 0), (5, 0), (5, 1), (6, 3), (9, 4), (9, 9)])
+def test_rank_unrank_roundtrip(n, k):
+    for rank in range(math.comb(n, k)):
+        c = combinatorics.unrank_combination(rank, k, n)
+        assert combinatorics.rank_combination(c) == rank
+
+
+@pytest.mark.parametrize("n,k", [(6, 3), (9, 4), (7, 1)])
+def test_iter_combinations_covers_all(n, k):
+    xs = list(combinatorics.iter_combinations(n, k))
+    assert len(xs) == math.comb(n, k)
+    assert set(xs) == set(itertools.combinations(range(n), k))
+
+
+def test_iter_combinations_is_colex():
+    xs = list(combinatorics.iter_combinations(8, 3))
+    assert xs == [combinatorics.unrank_combination(r, 3, 8) for r in range(len(xs))]
+
+
+def test_iter_combinations_shards():
+    total = math.comb(10, 4)
+    shards = [
+        list(combinatorics.iter_combinations(10, 4, start, start + 37))
+        for start in range(0, total, 37)
+    ]
+    assert list(itertools.chain.from_iterable(shards)) == list(
+        combinatorics.iter_combinations(10, 4)
+    )
+
+
+def test_unrank_combination_wide():
+    n, k = 1000, 40
+    rank = math.comb(n, k) // 3
+    assert combinatorics.rank_combination(
+        combinatorics.unrank_combination(rank, k, n)
+    ) == rank
+
+
+def test_unrank_combination_out_of_range():
+    with pytest.raises(IndexError):
+        combinatorics.unrank_combination(10, 2, 5)
+
+
+@pytest.mark.parametrize("m", [0, 1, 2, 5])
+def test_gray_code_flips_visits_all(m):
+    x = 0
+    seen = {x}
+    for j in combinatorics.gray_code_flips(m):
+        x ^= 1 << j
+        seen.add(x)
+    assert len(seen) == 1 << m
+    assert x == (1 << m - 1 if m else 0)
+
+
+@pytest.mark.parametrize("k", [0, 1, 4, 8])
+def test_permutation_rank_unrank_roundtrip(k):
+    for rank in range(0, math.factorial(k), max(1, math.factorial(k) // 500)):
+        p = combinatorics.unrank_permutation(rank, k)
+        assert sorted(p) == list(range(k))
+        assert combinatorics.rank_permutation(p) == rank
+
+
+def test_unrank_permutation_is_lexicographic():
+    assert [
+        combinatorics.unrank_permutation(r, 4) for r in range(24)
+    ] == list(itertools.permutations(range(4)))
+
+
+def test_unrank_permutation_wide():
+    k = 30
+    rank = math.factorial(k) - 1
+    assert combinatorics.unrank_permutation(rank, k) == tuple(range(k - 1, -1, -1))
+
+
+def test_unrank_permutation_out_of_range():
+    with pytest.raises(IndexError):
+        combinatorics.unrank_permutation(6, 3)
+
+
+def test_sample_permutation_ranks_distinct():
+    xs = list(combinatorics.sample_permutation_ranks(5, 50))
+    assert len(set(xs)) == 50
+
+
+def test_sample_permutation_ranks_exhaustive():
+    xs = list(combinatorics.sample_permutation_ranks(4, 100))
+    assert sorted(xs) == list(range(24))
+
+
+def test_sample_permutation_ranks_huge():
+    xs = list(combinatorics.sample_permutation_ranks(40, 20))
+    assert len(set(xs)) == 20
+    assert all(0 <= x < math.factorial(40) for x in xs)
+
+
+@pytest.mark.parametrize("n,k", [(0, 0), (3, 0), (0, 3), (5, 1), (5, 2), (6, 4)])
+def test_iter_compositions_covers_all(n, k):
+    xs = list(combinatorics.iter_compositions(n, k))
+    expected = {
+        p for p in itertools.product(range(n + 1), repeat=k) if sum(p) == n
+    }
+    assert len(xs) == combinatorics.composition_count(n, k) == len(expected)
+    assert set(xs) == expected
+
+
+def test_composition_rank_unrank_roundtrip():
+    for rank in range(combinatorics.composition_count(7, 4)):
+        c = combinatorics.unrank_composition(rank, 7, 4)
+        assert combinatorics.rank_composition(c) == rank
+
+
+def test_compositions_extremes_first():
+    xs = list(combinatorics.compositions(
+        10, 4, combinatorics.CompositionOrder.EXTREMES_FIRST, count=8
+    ))
+    assert xs[:4] == [(10, 0, 0, 0), (0, 10, 0, 0), (0, 0, 10, 0), (0, 0, 0, 10)]
+    assert len(set(xs)) == 8
+    assert all(sum(x) == 10 for x in xs)
+
+
+def test_compositions_extremes_first_zero():
+    xs = list(combinatorics.compositions(
+        0, 3, combinatorics.CompositionOrder.EXTREMES_FIRST
+    ))
+    assert xs == [(0, 0, 0)]
+
+
+def test_compositions_random_distinct():
+    xs = list(combinatorics.compositions(
+        20, 5, combinatorics.CompositionOrder.RANDOM, count=200
+    ))
+    assert len(set(xs)) == 200
+    assert all(sum(x) == 20 and len(x) == 5 for x in xs)
+
+
+def test_compositions_huge_space_is_lazy():
+    gen = combinatorics.compositions(
+        10 ** 6, 50, combinatorics.CompositionOrder.EXTREMES_FIRST
+    )
+    xs = list(itertools.islice(gen, 60))
+    assert len(set(xs)) == 60
+    assert all(sum(x) == 10 ** 6 for x in xs)
+
+
+def test_sample_ranks_large_count_is_lazy():
+    xs = list(itertools.islice(combinatorics.sample_ranks(10 ** 15, 10 ** 15), 100))
+    assert len(set(xs)) == 100
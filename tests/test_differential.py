@@ -0,0 +1,123 @@
+import functools
+import inspect
+
+import pytest
+
+from function_test_fixtures.cases import generate_test_cases
+from function_test_fixtures.differential import (
+    compare_callables,
+    normalize_message
+)
+from function_test_fixtures.parameter_stats import ParameterStats
+
+
+def f(a, b=1, /, c=2, *args, d, e=3, **kwargs):
+    return a, b, c, args, d, e, kwargs
+
+
+@functools.wraps(f)
+def wrapped(*args, **kwargs):
+    return f(*args, **kwargs)
+
+
+def loose(*args, **kwargs):
+    return None
+
+
+def strict(a, b=1, /, c=2, *, d, e=3):
+    return a, b, c, (), d, e, {}
+
+
+def test_normalize_message():
+    assert normalize_message("f() missing 1 required positional argument: 'a'") \
+        == "<callable>() missing 1 required positional argument: 'a'"
+    assert normalize_message("C.m() got an unexpected keyword argument 'x'") \
+        == "<callable>() got an unexpected keyword argument 'x'"
+    assert normalize_message("<object at 0x7f00ab>") == "<object at 0x?>"
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_wrapper_matches(workers):
+    report = compare_callables(
+        f, wrapped, workers=workers, batch_size=3, compare_results=True
+    )
+    assert report
+    assert report.calls > 0
+    assert report.calls_per_second > 0
+    assert not report.stopped_early
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_finds_mismatches_in_order(workers):
+    cases = list(generate_test_cases(ParameterStats(inspect.signature(strict))))
+    every = compare_callables(
+        strict, loose, cases, workers=workers, batch_size=2, max_mismatches=None
+    )
+    assert every.mismatches
+    assert all(m.first.exception_type is TypeError for m in every.mismatches)
+    assert all(m.second.returned for m in every.mismatches)
+
+    first_two = compare_callables(
+        strict, loose, cases, workers=workers, batch_size=2, max_mismatches=2
+    )
+    assert [id(m.case) for m in first_two.mismatches] \
+        == [id(m.case) for m in every.mismatches[:2]]
+    assert first_two.stopped_early
+    assert first_two.calls < every.calls
+
+
+@pytest.mark.parametrize("workers", [0, 4])
+def test_stopping_reads_no_further_cases(workers):
+    cases = list(generate_test_cases(ParameterStats(inspect.signature(strict))))
+    read = []
+
+    def counted():
+        for case in cases:
+            read.append(case)
+            yield case
+
+    called = []
+
+    def counted_strict(*args, **kwargs):
+        called.append(None)
+        return strict(*args, **kwargs)
+
+    report = compare_callables(
+        counted_strict, loose, counted(), workers=workers, batch_size=1,
+        max_mismatches=1, stats=ParameterStats(inspect.signature(strict))
+    )
+    assert report.stopped_early
+    assert len(report.mismatches) == 1
+    # every call made is counted, even in batches finished after the limit
+    assert report.calls == 2 * len(called)
+    if workers == 0:
+        assert len(read) == len(called)
+
+    # the limit is only reached in the last, short, batch
+    every = compare_callables(strict, loose, cases, max_mismatches=None)
+    mismatched = {id(m.case) for m in every.mismatches}
+    last = max(i for i, case in enumerate(cases) if id(case) in mismatched)
+    report = compare_callables(
+        strict, loose, cases[:last + 1], workers=workers, batch_size=last + 2,
+        max_mismatches=len(every.mismatches)
+    )
+    assert len(report.mismatches) == len(every.mismatches)
+    assert not report.stopped_early
+
+
+def test_compares_exception_messages():
+    def one(*args, **kwargs):
+        raise ValueError("one")
+
+    def two(*args, **kwargs):
+        raise ValueError("two")
+
+    (mismatch,) = compare_callables(one, two).mismatches
+    assert mismatch.first.message == 'one'
+    assert mismatch.second.exception_type is ValueError
+    assert compare_callables(one, one)
+
+
+def test_bad_batch_size():
+    with pytest.raises(TypeError):
+        compare_callables(f, wrapped, batch_size=0)
@@ -0,0 +1,80 @@
+import collections
+import inspect
+import random
+
+import pytest
+
+from function_test_fixtures.constants_and_types import (
+    POSITIONAL_ONLY,
+    POSITIONAL_OR_KEYWORD,
+    KEYWORD_ONLY
+)
+from function_test_fixtures.distributions import AliasSampler, CorpusDistribution
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.signature_gen import (
+    ParameterFlag,
+    build_skeleton_signatures,
+    skeleton_shape
+)
+
+
+def f1(a, b, /, c): pass
+def f2(a, /, *, k1, k2, k3): pass
+def f3(a, b, c, d): pass
+def f4(): pass
+
+
+CORPUS = [ParameterStats(inspect.signature(f)) for f in (f1, f2, f3, f4)]
+
+
+def test_alias_sampler_frequencies():
+    random.seed(0)
+    weights = [1, 0, 3, 6]
+    sampler = AliasSampler(weights)
+    counts = collections.Counter(sampler.sample() for _ in range(20000))
+    assert counts[1] == 0
+    for i, w in enumerate(weights):
+        assert counts[i] / 20000 == pytest.approx(w / 10, abs=0.02)
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0], [1, -1]])
+def test_alias_sampler_rejects_bad_weights(weights):
+    with pytest.raises(TypeError):
+        AliasSampler(weights)
+
+
+def test_histograms():
+    corpus = CorpusDistribution.from_stats(CORPUS)
+    assert corpus.signatures == 4
+    assert corpus[POSITIONAL_ONLY].histogram == (2, 1, 1)
+    assert corpus[POSITIONAL_OR_KEYWORD].histogram == (2, 1, 0, 0, 1)
+    assert corpus[KEYWORD_ONLY].histogram == (3, 0, 0, 1)
+
+
+def test_save_load_roundtrip(tmp_path):
+    corpus = CorpusDistribution.from_stats(CORPUS)
+    path = tmp_path / 'counts.json'
+    corpus.save(path)
+    loaded = CorpusDistribution.load(path)
+    assert loaded.signatures == corpus.signatures
+    assert loaded.distributions == corpus.distributions
+
+
+def test_drives_build_skeleton_signatures():
+    random.seed(1)
+    corpus = CorpusDistribution.from_stats(CORPUS)
+    flag = (
+        ParameterFlag.POSITIONAL_ONLY_NO_OPTIONAL
+        | ParameterFlag.POSITIONAL_OR_KEYWORD_NO_OPTIONAL
+        | ParameterFlag.KEYWORD_ONLY_SOME_OPTIONAL
+    )
+    seen = set()
+    for _ in range(50):
+        for skeleton in build_skeleton_signatures(
+            flag=flag, rle=True, **corpus.count_arguments()
+        ):
+            po, _, pk, _, _, ko, _, _ = skeleton_shape(skeleton)
+            seen.add((po, pk, ko))
+    # zero counts are never drawn and some optional needs at least 3
+    assert seen <= {(p, k, 3) for p in (1, 2) for k in (1, 4)}
+    assert len(seen) == 4
@@ -0,0 +1,148 @@
+import inspect
+import random
+
+import pytest
+
+from function_test_fixtures.fuzzing import (
+    EMPTY_SHAPE,
+    MUTATIONS,
+    CorpusDirectory,
+    fuzz,
+    is_valid_shape,
+    mutate,
+    shape_parameter_count
+)
+from function_test_fixtures.monitoring import MONITORING_AVAILABLE
+from function_test_fixtures.signature_gen import skeleton_from_shape
+from function_test_fixtures.stubs import compile_stub
+
+
+needs_monitoring = pytest.mark.skipif(
+    not MONITORING_AVAILABLE, reason="sys.monitoring needs Python 3.12+"
+)
+
+
+def describe(f):
+    """Signature handling code with a bug for optional keyword only parameters."""
+    parameters = inspect.signature(f).parameters.values()
+    description = []
+    for p in parameters:
+        if p.kind is p.VAR_KEYWORD:
+            description.append('**')
+        elif p.kind is p.VAR_POSITIONAL:
+            description.append('*')
+        elif p.kind is p.KEYWORD_ONLY and p.default is not p.empty:
+            if '*' in description:
+                raise ValueError("unsupported")
+            description.append('k=')
+        else:
+            description.append(p.kind.name)
+    return description
+
+
+def kind_changes(f):
+    """Signature handling code with a bug for three kinds of parameters in a row."""
+    parameters = list(inspect.signature(f).parameters.values())
+    previous = parameters[0].kind if parameters else None
+    changes = 0
+    for p in parameters:
+        # the first parameter never changes kind, so a change only shows as
+        # the second direction of this branch within the same call
+        changes += 1 if p.kind is not previous else 0
+        previous = p.kind
+    if changes > 1:
+        raise ValueError("unsupported")
+    return changes
+
+
+def test_mutations_stay_valid():
+    random.seed(0)
+    shape = EMPTY_SHAPE
+    for _ in range(500):
+        shape = mutate(shape, max_parameters=6)
+        assert is_valid_shape(shape)
+        assert shape_parameter_count(shape) <= 6
+        # Python accepts the signature
+        compile_stub(skeleton_from_shape(shape))
+
+
+def test_each_mutation():
+    random.seed(1)
+    shape = (1, 0, 2, 1, False, 3, 0b101, False)
+    results = {m.__name__: {m(shape) for _ in range(50)} for m in MUTATIONS}
+    assert results['toggle_var_positional'] == {(1, 0, 2, 1, True, 3, 0b101, False)}
+    assert results['toggle_var_keyword'] == {(1, 0, 2, 1, False, 3, 0b101, True)}
+    assert all(
+        shape_parameter_count(s) == shape_parameter_count(shape) + 1
+        for s in results['add_parameter']
+    )
+    assert all(
+        shape_parameter_count(s) == shape_parameter_count(shape) - 1
+        for s in results['remove_parameter']
+    )
+    # removing keyword only parameter 1 of 0b101 gives 0b11
+    assert (1, 0, 2, 1, False, 2, 0b11, False) in results['remove_parameter']
+    assert (1, 0, 2, 1, False, 3, 0b100, False) in results['flip_default']
+
+
+def test_is_valid_shape():
+    assert is_valid_shape(EMPTY_SHAPE)
+    assert not is_valid_shape((0, 1, 1, 0, False, 0, 0, False))
+    assert not is_valid_shape((0, 0, 0, 0, False, 1, 0b10, False))
+
+
+def test_corpus_directory(tmp_path):
+    first = CorpusDirectory(tmp_path)
+    second = CorpusDirectory(tmp_path)
+    shape = (1, 0, 0, 0, True, 1, 1, False)
+    first.add(shape)
+    first.add(shape)
+    assert first.new_shapes() == []
+    assert second.new_shapes() == [shape]
+    assert second.new_shapes() == []
+    assert CorpusDirectory(tmp_path).shapes() == [shape]
+
+
+def test_corpus_directory_skips_bad_files(tmp_path):
+    shape = (1, 0, 0, 0, True, 1, 1, False)
+    CorpusDirectory(tmp_path).add(shape)
+    (tmp_path / 'notes.json').write_text('{}', encoding='utf-8')
+    (tmp_path / 'broken.json').write_text('[1, 0', encoding='utf-8')
+    (tmp_path / 'invalid.json').write_text('[0, 1, 1, 0, 0, 0, 0, 0]', encoding='utf-8')
+    (tmp_path / 'directory.json').mkdir()
+    corpus = CorpusDirectory(tmp_path)
+    assert corpus.new_shapes() == [shape]
+    assert corpus.new_shapes() == []
+
+
+@needs_monitoring
+@pytest.mark.parametrize('workers', [0, 2])
+def test_fuzz_finds_crash(tmp_path, workers):
+    report = fuzz(describe, tmp_path, iterations=300, workers=workers, seed=3)
+    assert report.crashes
+    for shape, outcome in report.crashes.items():
+        assert outcome.exception_type is ValueError
+        assert shape[4] and shape[6]
+    assert report.corpus == sorted(CorpusDirectory(tmp_path).shapes())
+    assert EMPTY_SHAPE in report.corpus
+    assert report.coverage
+
+
+@needs_monitoring
+def test_fuzz_finds_crash_behind_second_branch_direction(tmp_path):
+    # a single parameter gives no change and two at most one, so the crash
+    # needs a corpus shape kept only for the other direction of the branch
+    report = fuzz(kind_changes, tmp_path, iterations=300, workers=0, seed=3)
+    assert report.crashes
+    for shape, outcome in report.crashes.items():
+        assert outcome.exception_type is ValueError
+        stub = compile_stub(skeleton_from_shape(shape))
+        assert len(inspect.signature(stub).parameters) >= 3
+
+
+@needs_monitoring
+def test_fuzz_resumes_from_directory(tmp_path):
+    first = fuzz(describe, tmp_path, iterations=100, workers=0)
+    second = fuzz(describe, tmp_path, iterations=0, workers=0)
+    assert second.corpus == first.corpus
+    assert second.coverage == first.coverage
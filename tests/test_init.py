@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+import function_test_fixtures
+from function_test_fixtures import signature_gen
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, function_test_fixtures; "
+        "print([m for m in sys.modules if m.startswith('function_test_fixtures.')])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": ":".join(sys.path)}
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attribute():
+    assert function_test_fixtures.ParameterFlag is signature_gen.ParameterFlag
+
+
+def test_all_names_resolve():
+    for name in function_test_fixtures.__all__:
+        assert getattr(function_test_fixtures, name) is not None
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        function_test_fixtures.no_such_name
@@ -0,0 +1,134 @@
+import inspect
+import sys
+
+import pytest
+
+from function_test_fixtures.cases import generate_test_cases
+from function_test_fixtures.monitoring import (
+    MONITORING_AVAILABLE,
+    CoverageCollector,
+    target_code
+)
+from function_test_fixtures.parameter_stats import ParameterStats
+
+
+needs_monitoring = pytest.mark.skipif(
+    not MONITORING_AVAILABLE, reason="sys.monitoring needs Python 3.12+"
+)
+
+
+def f(a, b=1, *args, c, **kwargs):
+    if kwargs:
+        return 'kwargs'
+    if args:
+        return 'args'
+    return 'plain'
+
+
+def loop(*args):
+    total = 0
+    for x in args:
+        if x:
+            total += 1
+        else:
+            total -= 1
+    return total
+
+
+class C:
+    def method(self, a):
+        return a
+
+    def __call__(self, a):
+        return a
+
+
+def test_target_code():
+    assert target_code(f) is f.__code__
+    assert target_code(C().method) is C.method.__code__
+    assert target_code(C()) is C.__call__.__code__
+    with pytest.raises(TypeError):
+        target_code(len)
+
+
+@pytest.mark.skipif(MONITORING_AVAILABLE, reason="sys.monitoring is available")
+def test_unavailable():
+    with pytest.raises(TypeError):
+        CoverageCollector(f)
+
+
+@needs_monitoring
+def test_collects_new_arcs_per_case():
+    stats = ParameterStats(inspect.signature(f))
+    cases = list(generate_test_cases(stats, extras=1))
+    with CoverageCollector(f) as collector:
+        coverages = [collector.call(case, stats) for case in cases]
+
+    results = {c.outcome.result for c in coverages if c.outcome.returned}
+    assert results == {'kwargs', 'args', 'plain'}
+    assert set().union(*(c.new for c in coverages)) == collector.seen
+    # every case reaches the first line, only one case reports it as new
+    first_line = f.__code__.co_firstlineno + 1
+    assert all(first_line in c.lines for c in coverages if c.outcome.returned)
+    assert sum(('line', first_line) in c.new for c in coverages) == 1
+    assert all(c.branches for c in coverages if c.outcome.returned)
+    assert collector.calls == len(cases)
+
+
+@needs_monitoring
+def test_releases_tool_id():
+    with CoverageCollector(f) as collector:
+        tool_id = collector._tool_id
+        assert sys.monitoring.get_tool(tool_id) is not None
+    assert sys.monitoring.get_tool(tool_id) is None
+    # calls outside the collector are not recorded
+    f(1, c=2)
+    assert collector.calls == 0
+    with pytest.raises(TypeError):
+        collector.call(None, None)
+
+
+@needs_monitoring
+def test_both_directions_of_a_branch_in_a_loop():
+    with CoverageCollector(loop) as collector:
+        outcome, arcs, _ = collector.measure((True, False), {})
+        assert outcome.result == 0
+        # the `if x` branch went both ways in the one call
+        sources = [a[1] for a in arcs if a[0] == 'branch']
+        assert any(sources.count(source) == 2 for source in sources)
+
+        lines = loop.__code__.co_firstlineno
+        taken = {a[1] for a in arcs if a[0] == 'line'}
+        assert {lines + 4, lines + 6} <= taken
+
+        # disabled events come back for the next call
+        _, again, new = collector.measure((False, True), {})
+        assert again == arcs and not new
+
+
+@needs_monitoring
+def test_leaves_other_tools_disabled_events_alone():
+    calls = []
+
+    def other(code, line):
+        calls.append(line)
+        return sys.monitoring.DISABLE
+
+    with CoverageCollector(f) as collector:
+        tool_id = next(i for i in range(6) if sys.monitoring.get_tool(i) is None)
+        sys.monitoring.use_tool_id(tool_id, 'other')
+        try:
+            sys.monitoring.register_callback(tool_id, sys.monitoring.events.LINE, other)
+            sys.monitoring.set_local_events(
+                tool_id, f.__code__, sys.monitoring.events.LINE
+            )
+            f(1, c=2)
+            before = len(calls)
+            collector.measure((1,), {'c': 2})
+            collector.measure((1,), {'c': 2})
+            assert len(calls) == before
+            assert collector.measure((1,), {'c': 2})[1]
+        finally:
+            sys.monitoring.set_local_events(tool_id, f.__code__, 0)
+            sys.monitoring.register_callback(tool_id, sys.monitoring.events.LINE, None)
+            sys.monitoring.free_tool_id(tool_id)
@@ -0,0 +1,44 @@
+import inspect
+
+import pytest
+
+from function_test_fixtures.cases import case_coordinates, generate_test_cases
+from function_test_fixtures.ordering import coordinate_distance, farthest_first
+from function_test_fixtures.parameter_stats import ParameterStats
+
+
+def f(a, b, /, c, d=1, *args, e, g=2, **kwargs):
+    pass
+
+
+@pytest.fixture
+def cases():
+    return list(generate_test_cases(ParameterStats(inspect.signature(f))))
+
+
+@pytest.mark.parametrize('window', [1, 2, 16, 1000])
+def test_yields_every_case_once(cases, window):
+    ordered = list(farthest_first(iter(cases), window=window))
+    assert sorted(map(id, ordered)) == sorted(map(id, cases))
+
+
+def test_window_of_one_keeps_order(cases):
+    assert list(farthest_first(cases, window=1)) == cases
+
+
+def test_spreads_out_early_cases(cases):
+    def spread(order):
+        head = [case_coordinates(c) for c in order[:8]]
+        return sum(
+            coordinate_distance(a, b)
+            for i, a in enumerate(head) for b in head[i + 1:]
+        )
+
+    ordered = list(farthest_first(cases, window=len(cases)))
+    assert ordered[0] is cases[0]
+    assert spread(ordered) > spread(cases)
+
+
+def test_bad_window(cases):
+    with pytest.raises(TypeError):
+        list(farthest_first(cases, window=0))
@@ -0,0 +1,154 @@
+import inspect
+import pytest
+from function_test_fixtures.constants_and_types import ParameterKind
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.signature_gen import (
+    ALL_FLAGS,
+    build_skeleton_signatures,
+    make_signature,
+    skeleton_shape
+)
+from function_test_fixtures import arguments
+
+
+def f(a, b=1, *, c, d=2, e, g=3):
+    pass
+
+
+def test_counters():
+    stats = ParameterStats(inspect.signature(f))
+    assert stats.required_counters[ParameterKind.POSITIONAL_OR_KEYWORD] == 1
+    assert stats.optional_counters[ParameterKind.POSITIONAL_OR_KEYWORD] == 1
+    assert stats.required_counters[ParameterKind.KEYWORD_ONLY] == 2
+    assert stats.optional_counters[ParameterKind.KEYWORD_ONLY] == 2
+
+
+def test_keyword_only_masks():
+    stats = ParameterStats(inspect.signature(f))
+    assert stats.ko_required_mask == 0b0101
+    assert stats.ko_optional_mask == 0b1010
+    assert stats.ko_required == (0, 2)
+    assert stats.ko_optional == (1, 3)
+
+
+def test_keyword_gen_required_first():
+    stats = ParameterStats(inspect.signature(f))
+    xs = set(stats.test_keyword_gen(3))
+    assert len(xs) == 3
+    assert {arguments.TestKeyword(1), arguments.TestKeyword(3)} < xs
+
+
+def test_keyword_gen_all():
+    stats = ParameterStats(inspect.signature(f))
+    assert list(stats.test_keyword_gen(4)) \
+        == [arguments.TestKeyword(n) for n in range(1, 5)]
+
+
+def test_keyword_gen_wide():
+    parameters = [
+        inspect.Parameter(
+            f'k{n}',
+            inspect.Parameter.KEYWORD_ONLY,
+            **({'default': None} if n % 3 else {})
+        )
+        for n in range(3000)
+    ]
+    stats = ParameterStats(inspect.Signature(parameters))
+    mask = stats.keyword_mask(2500)
+    assert mask.bit_count() == 2500
+    assert mask & stats.ko_required_mask == stats.ko_required_mask
+
+
+def g(*, a, b=1, c=2, d, e=3, h=4):
+    pass
+
+
+def test_iter_keyword_masks_covers_all():
+    stats = ParameterStats(inspect.signature(g))
+    masks = list(stats.iter_keyword_masks(4))
+    assert len(masks) == stats.keyword_mask_count(4) == 6
+    assert len(set(masks)) == 6
+    assert all(m & stats.ko_required_mask == stats.ko_required_mask for m in masks)
+    assert all(m.bit_count() == 4 for m in masks)
+
+
+def test_keyword_mask_rank_roundtrip():
+    stats = ParameterStats(inspect.signature(g))
+    for ko in range(7):
+        for rank in range(stats.keyword_mask_count(ko)):
+            mask = stats.keyword_mask_unrank(ko, rank)
+            assert stats.keyword_mask_rank(ko, mask) == rank
+
+
+def test_test_keyword_enum_shards():
+    stats = ParameterStats(inspect.signature(g))
+    assert list(stats.test_keyword_enum(5, 1, 3)) \
+        == list(stats.test_keyword_enum(5))[1:3]
+
+
+@pytest.mark.parametrize("required,optional", [
+    (0, 0), (0, 3), (1, 0), (1, 3), (2, 2), (3, 1), (3, 4), (4, 0)
+])
+def test_keyword_or_positional_gray_splits(required, optional):
+    parameters = [
+        inspect.Parameter(
+            f'p{n}',
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            **({'default': None} if n >= required else {})
+        )
+        for n in range(required + optional)
+    ]
+    stats = ParameterStats(inspect.Signature(parameters))
+    count = required + optional
+    splits = list(stats.keyword_or_positional_gray_splits())
+
+    assert len(splits) == len(set(splits))
+    assert len(splits) == stats.keyword_or_positional_split_count()
+
+    for as_pos, mask in splits:
+        # positional arguments are a prefix and never also keywords
+        assert mask & ((1 << as_pos) - 1) == 0
+        # every required parameter is supplied
+        assert all(n < as_pos or mask >> n & 1 for n in range(required))
+        assert mask < 1 << count
+
+    for (p1, m1), (p2, m2) in zip(splits, splits[1:]):
+        assert (m1 ^ m2).bit_count() == 1
+        assert p2 - p1 in (0, 1)
+
+
+def test_test_keyword_or_positional_gray():
+    stats = ParameterStats(inspect.signature(lambda a, b=1: None))
+    assert list(stats.test_keyword_or_positional_gray()) == [
+        (arguments.TestPositionalOrKeyword(1, True),
+         arguments.TestPositionalOrKeyword(2, True)),
+        (arguments.TestPositionalOrKeyword(1, True),),
+        (arguments.TestPositionalOrKeyword(1, False),),
+        (arguments.TestPositionalOrKeyword(1, False),
+         arguments.TestPositionalOrKeyword(2, True)),
+        (arguments.TestPositionalOrKeyword(1, False),
+         arguments.TestPositionalOrKeyword(2, False)),
+    ]
+
+
+def test_parameter_ranges_stratified():
+    from function_test_fixtures.parameter_ranges import ParameterRanges
+    parameters = [
+        inspect.Parameter(f'k{n}', inspect.Parameter.KEYWORD_ONLY, default=None)
+        for n in range(300)
+    ]
+    ranges = ParameterRanges(ParameterStats(inspect.Signature(parameters)), k=8)
+    r = ranges[ParameterKind.KEYWORD_ONLY]
+    assert r[0] == 0 and r[-1] == 300
+    assert len(r) >= 8
+
+
+def test_from_skeleton_matches_signature():
+    for skeleton in build_skeleton_signatures(
+        positional_only=3, positional_or_keyword=3, keyword_only=3,
+        flag=ALL_FLAGS, rle=True
+    ):
+        stats = ParameterStats.from_skeleton(skeleton)
+        expected = ParameterStats(make_signature(skeleton))
+        assert stats.shape == expected.shape == skeleton_shape(skeleton)
+        assert stats.keyword_only_names == expected.keyword_only_names
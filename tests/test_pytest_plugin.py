@@ -0,0 +1,109 @@
+import os
+import re
+import sys
+
+import pytest
+
+
+pytest_plugins = ['pytester']
+
+
+TESTS = '''
+import pytest
+from function_test_fixtures.signature_gen import ParameterFlag, skeleton_shape
+
+FLAG = (
+    ParameterFlag.POSITIONAL_OR_KEYWORD_NO_OPTIONAL
+    | ParameterFlag.POSITIONAL_OR_KEYWORD_ALL_OPTIONAL
+    | ParameterFlag.KEYWORD_ONLY_SOME_OPTIONAL
+    | ParameterFlag.VAR_POSITIONAL
+)
+
+@pytest.mark.skeleton_stream(seed=3, flag=FLAG, repeat=2)
+def test_by_skeleton(fixture_skeleton):
+    assert skeleton_shape(fixture_skeleton.skeleton) == fixture_skeleton.stats.shape
+    assert fixture_skeleton.cases
+
+@pytest.mark.skeleton_stream(seed=3, flag=FLAG, repeat=2, cases_per_skeleton=100)
+def test_by_case(fixture_case):
+    assert fixture_case.case is fixture_case.skeleton.cases[fixture_case.index]
+'''
+
+
+XDIST_TESTS = '''
+import pytest
+from function_test_fixtures.signature_gen import ParameterFlag
+
+FLAG = ParameterFlag.POSITIONAL_OR_KEYWORD_NO_OPTIONAL | ParameterFlag.VAR_KEYWORD
+
+@pytest.mark.skeleton_stream(seed=3, flag=FLAG, repeat=4)
+def test_grouped(fixture_skeleton, request):
+    (group,) = request.node.get_closest_marker('xdist_group').args
+    assert group == f'fixture-shard-{fixture_skeleton.index % 2}'
+'''
+
+
+def outcomes(pytester, *args):
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest('-p', 'function_test_fixtures.pytest_plugin', *args)
+    return result, result.parseoutcomes()
+
+
+def test_parametrizes_by_index(pytester):
+    result, counts = outcomes(pytester, '-k', 'by_skeleton', '-v')
+    # 2 positional or keyword flags x 2 repeats
+    assert counts == {'passed': 4, 'deselected': 100 * 4}
+    result.stdout.fnmatch_lines([
+        '*test_by_skeleton?s0? PASSED*',
+        '*collected 404 skeleton indices*',
+    ])
+
+
+def test_case_slots_past_the_end_are_skipped(pytester):
+    _, counts = outcomes(pytester, '-k', 'by_case')
+    assert counts['passed'] + counts['skipped'] == 100 * 4
+    assert counts['passed'] > 0 and counts['skipped'] > 0
+
+
+@pytest.mark.parametrize('shards', [1, 2, 5])
+def test_shards_partition_indices(pytester, shards):
+    _, full = outcomes(pytester, '-k', 'by_skeleton')
+    passed = 0
+    for i in range(shards):
+        _, counts = outcomes(
+            pytester, '-k', 'by_skeleton', '--fixture-shard', f'{i}/{shards}'
+        )
+        # a shard may get no indices at all
+        passed += counts.get('passed', 0)
+    assert passed == full['passed']
+
+
+@pytest.mark.parametrize('shard', ['2/2', '-1/2', 'x/2'])
+def test_bad_shard_is_a_usage_error(pytester, shard):
+    pytester.makepyfile(TESTS)
+    result = pytester.runpytest(
+        '-p', 'function_test_fixtures.pytest_plugin', '--fixture-shard', shard
+    )
+    assert result.ret == pytest.ExitCode.USAGE_ERROR
+    result.stderr.fnmatch_lines(['*--fixture-shard*'])
+
+
+def test_xdist_groups_indices_by_worker(pytester, monkeypatch):
+    pytest.importorskip('xdist')
+    # workers are separate processes that must import the package
+    monkeypatch.setenv('PYTHONPATH', os.pathsep.join(sys.path))
+    pytester.makepyfile(XDIST_TESTS)
+    result = pytester.runpytest(
+        '-p', 'function_test_fixtures.pytest_plugin',
+        '-n', '2', '--dist', 'loadgroup', '-v'
+    )
+    # a single flag permutation repeated 4 times
+    assert result.parseoutcomes() == {'passed': 4}
+    workers = {}
+    for line in result.outlines:
+        match = re.search(r'\[(gw\d)\] .*PASSED .*@(fixture-shard-\d)', line)
+        if match:
+            workers.setdefault(match[2], set()).add(match[1])
+    # each group ran entirely on one worker
+    assert sorted(workers) == ['fixture-shard-0', 'fixture-shard-1']
+    assert all(len(w) == 1 for w in workers.values())
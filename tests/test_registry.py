@@ -0,0 +1,58 @@
+import inspect
+
+import pytest
+
+from function_test_fixtures import arguments
+from function_test_fixtures.registry import ShapeRegistry
+
+
+def f1(a, b=1, *, c): pass
+def f2(x, y=1, *, z): pass
+def f3(x, y=1, *, z=3): pass
+def f4(*args, **kwargs): pass
+
+
+def test_shapes_group_callables():
+    registry = ShapeRegistry()
+    for f in (f1, f2, f3, f4):
+        registry.add(f)
+    assert len(registry) == 3
+    assert registry.callables(registry.add(f1))[:2] == [f1, f2]
+
+
+def test_cases_generated_once_per_shape():
+    calls = []
+
+    def generator(stats):
+        calls.append(stats)
+        return iter(())
+
+    registry = ShapeRegistry(generator)
+    for f in (f1, f2, f3, f4):
+        registry.add(f)
+    replay = list(registry)
+
+    assert len(replay) == 4
+    assert len(calls) == 3
+    assert registry.generation_runs == 3
+    assert registry.saved_runs == 1
+
+
+def test_replayed_cases_bind_to_each_callable():
+    registry = ShapeRegistry()
+    registry.add(f1)
+    registry.add(f2)
+    replayed = {}
+    for f, stats, cases in registry:
+        replayed[f] = 0
+        signature = inspect.signature(f)
+        for case in cases:
+            args, kwargs = case.call_arguments(stats)
+            if any(isinstance(x, arguments.UnmappedArgPlaceholder) for x in case):
+                with pytest.raises(TypeError):
+                    signature.bind(*args, **kwargs)
+            else:
+                signature.bind(*args, **kwargs)
+                f(*args, **kwargs)
+                replayed[f] += 1
+    assert replayed[f1] == replayed[f2] > 0
@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from function_test_fixtures.cases import (
+    generate_test_cases,
+    iter_case_coordinates,
+    make_test_case
+)
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.replay import (
+    DecisionLog,
+    DecisionLogWriter,
+    RecordingRandom,
+    ReplayRandom,
+    record_test_cases
+)
+from function_test_fixtures.serialize import case_record
+from function_test_fixtures.stream import FixtureStream
+
+
+def records(index, cases):
+    return [case_record(index, case) for case in cases]
+
+
+def test_recording_matches_the_random_module():
+    random.seed(3)
+    expected = (
+        random.randrange(10 ** 20), random.sample(range(50), 5), random.random()
+    )
+
+    r = RecordingRandom(3)
+    recorded = (r.randrange(10 ** 20), r.sample(range(50), 5), r.random())
+    assert recorded == expected
+
+    r = ReplayRandom(r.draws)
+    replayed = (r.randrange(10 ** 20), r.sample(range(50), 5), r.random())
+    assert replayed == expected
+
+
+def test_replay_runs_out_of_draws():
+    with pytest.raises(TypeError):
+        ReplayRandom([]).getrandbits(8)
+
+
+def test_make_test_case_draws_from_rng():
+    stats = ParameterStats.from_skeleton(FixtureStream(1)[7])
+    coordinates = list(iter_case_coordinates(stats))
+    random.seed(9)
+    expected = records(0, (make_test_case(stats, c) for c in coordinates))
+
+    recorder = RecordingRandom(9)
+    # the random module is neither used nor patched
+    random.seed(0)
+    functions = random.sample, random.getrandbits
+    cases = [make_test_case(stats, c, rng=recorder) for c in coordinates]
+    assert (random.sample, random.getrandbits) == functions
+    assert random.getstate() == random.Random(0).getstate()
+    assert records(0, cases) == expected
+    assert recorder.draws
+
+
+def test_record_test_cases_leaves_the_stream_unchanged():
+    stats = ParameterStats.from_skeleton(FixtureStream(1)[7])
+    expected = records(0, generate_test_cases(stats, rng=random.Random(9)))
+    recorded = list(record_test_cases(stats, 9))
+    assert records(0, (case for case, _ in recorded)) == expected
+    # each decision holds only its own case's draws
+    for case, decision in recorded:
+        assert case_record(0, decision.replay(stats)) == case_record(0, case)
+
+
+def test_log_replays_any_case_directly():
+    stream = FixtureStream(4)
+    log = DecisionLog.record(stream, range(0, len(stream), 5))
+    assert log.indices() == list(range(0, len(stream), 5))
+
+    for index in reversed(log.indices()):
+        expected = records(index, stream.test_cases(index))
+        assert log.case_count(index) == len(expected)
+        assert log.skeleton(index) == stream[index]
+        for n in reversed(range(log.case_count(index))):
+            assert case_record(index, log.test_case(index, n)) == expected[n]
+
+
+def test_save_load_roundtrip(tmp_path):
+    stream = FixtureStream(5)
+    log = DecisionLog.record(stream, [2, 11], k=3)
+    path = tmp_path / 'log.json'
+    log.save(path)
+    loaded = DecisionLog.load(path)
+    assert loaded.indices() == [2, 11]
+    assert loaded.k == 3
+    for index in loaded.indices():
+        assert loaded.skeleton(index) == log.skeleton(index)
+        assert records(index, (
+            loaded.test_case(index, n) for n in range(loaded.case_count(index))
+        )) == records(index, stream.test_cases(index, k=3))
+
+
+def test_writer_matches_recorded_log(tmp_path):
+    stream = FixtureStream(6)
+    indices = [3, 8, 20]
+    path = tmp_path / 'log.jsonl'
+    with DecisionLogWriter(path, k=2) as writer:
+        for index in indices:
+            for _ in writer.record_skeleton(stream, index, stream[index]):
+                pass
+    loaded = DecisionLog.load(path)
+    assert loaded.to_json() == DecisionLog.record(stream, indices, k=2).to_json()
+    assert DecisionLog.from_json(loaded.to_json()).to_json() == loaded.to_json()
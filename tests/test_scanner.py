@@ -0,0 +1,82 @@
+import inspect
+import textwrap
+
+import pytest
+
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.scanner import scan_file, scan_paths, scan_source
+
+
+SOURCE = textwrap.dedent('''
+    def f(a, b=1, /, c=2, *args, d, e=3, **kwargs): pass
+
+    async def g(x, *, y=None): pass
+
+    class C:
+        def method(self, z): pass
+
+        def outer(self):
+            def inner(*, w): pass
+            return lambda q, r=1: q
+''')
+
+
+def expected(source):
+    namespace = {}
+    exec(source, namespace)
+    C = namespace['C']
+    return {
+        'f': namespace['f'],
+        'g': namespace['g'],
+        'C.method': C.method,
+        'C.outer': C.outer,
+        'C.outer.<locals>.inner': None,
+        'C.outer.<locals>.<lambda>': C().outer(),
+    }
+
+
+def test_scan_source_matches_inspect():
+    functions = {s.qualname: s for s in scan_source(SOURCE)}
+    assert set(functions) == set(expected(SOURCE))
+
+    for qualname, f in expected(SOURCE).items():
+        if f is None:
+            continue
+        stats = functions[qualname].stats
+        assert stats.shape == ParameterStats(inspect.signature(f)).shape
+        assert stats.positional_or_keyword_names == \
+            ParameterStats(inspect.signature(f)).positional_or_keyword_names
+
+
+def test_scan_source_line_numbers():
+    lines = {s.qualname: s.lineno for s in scan_source(SOURCE)}
+    assert lines['f'] == 2
+    assert lines['C.method'] == 7
+
+
+def test_no_parameters():
+    (function,) = scan_source('def f(): pass')
+    assert function.stats.no_parameters
+
+
+def test_scan_file_skips_invalid(tmp_path):
+    path = tmp_path / 'bad.py'
+    path.write_text('def f(:\n')
+    assert scan_file(path) == []
+    # nesting deep enough to exhaust the stack
+    path.write_text('f = ' + 'lambda: ' * 1000 + '0\n')
+    assert scan_file(path) == []
+    assert scan_file(tmp_path / 'missing.py') == []
+    assert scan_file(tmp_path) == []
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_scan_paths(tmp_path, workers):
+    (tmp_path / 'pkg').mkdir()
+    (tmp_path / 'pkg' / 'a.py').write_text('def a(x): pass\n')
+    (tmp_path / 'pkg' / 'b.py').write_text('def b(*, y): pass\n')
+    (tmp_path / 'pkg' / 'notes.txt').write_text('def c(): pass\n')
+
+    functions = list(scan_paths([tmp_path], workers=workers))
+    assert [f.qualname for f in functions] == ['a', 'b']
+    assert functions[1].stats.keyword_only_names == ('y',)
@@ -0,0 +1,156 @@
+import inspect
+import itertools
+import random
+
+import pytest
+
+from function_test_fixtures import arguments
+from function_test_fixtures.parameter_stats import ParameterStats
+from function_test_fixtures.scheduling import (
+    CostModel,
+    item_features,
+    list_schedule,
+    schedule
+)
+from function_test_fixtures.signature_gen import (
+    ParameterFlag,
+    build_skeleton_signatures
+)
+
+
+def f(a, /, b, *args, c, d=1, **kwargs): pass
+
+
+def test_item_features():
+    stats = ParameterStats(inspect.signature(f))
+    assert item_features(stats) == (1, 1, 1, 2, 2, 0)
+    case = arguments.TestCaseContainer.auto(
+        [arguments.TestPositional(1)], [arguments.TestKeyword(1)]
+    )
+    assert item_features(case) == (1, 0, 0, 0, 0, 2)
+
+
+def test_item_features_of_skeletons():
+    for skeleton in build_skeleton_signatures(
+        positional_only=3, positional_or_keyword=3, keyword_only=4, rle=True
+    ):
+        assert item_features(skeleton) == item_features(skeleton.expand()) \
+            == item_features(ParameterStats.from_skeleton(skeleton))
+
+
+def test_lpt_balances():
+    costs = [7, 7, 6, 6, 5, 4, 4, 2, 2, 1]
+    result = schedule(costs, 3, cost=float)
+    assert result.makespan == 15
+    assert sorted(itertools.chain(*result.assignments)) == sorted(costs)
+    assert result.loads == tuple(sum(a) for a in result.assignments)
+
+
+def test_lpt_beats_round_robin():
+    random.seed(0)
+    costs = [random.choice([1, 1, 1, 200]) for _ in range(64)]
+    round_robin = max(sum(costs[w::4]) for w in range(4))
+    assert schedule(costs, 4, cost=float).makespan < round_robin
+
+
+def test_schedule_is_deterministic():
+    items = list(range(20))
+    assert schedule(items, 3, cost=lambda x: x % 5) \
+        == schedule(items, 3, cost=lambda x: x % 5)
+
+
+def test_schedule_needs_workers():
+    with pytest.raises(TypeError):
+        schedule([1], 0, cost=float)
+
+
+def test_cost_model_learns_timings():
+    random.seed(0)
+    model = CostModel()
+    # keyword only parameters are ten times as expensive as anything else
+    for _ in range(5):
+        for skeleton in build_skeleton_signatures(
+            positional_only=(3, 6), positional_or_keyword=(3, 6),
+            keyword_only=(3, 30), rle=True
+        ):
+            _, po, pk, ko, var, _ = item_features(skeleton)
+            model.observe(skeleton, 0.5 + po + pk + var + 10 * ko)
+    model.fit()
+    # the prior is worth one observation out of hundreds
+    assert model.weights[3] == pytest.approx(10, rel=1e-2)
+
+    (unseen,) = build_skeleton_signatures(
+        positional_only=0, positional_or_keyword=0, keyword_only=100,
+        flag=ParameterFlag.KEYWORD_ONLY_NO_OPTIONAL, rle=True
+    )
+    assert model.estimate(unseen) == pytest.approx(1000.5, rel=1e-2)
+
+
+def test_cost_model_prefers_measured_timings():
+    stats = ParameterStats(inspect.signature(f))
+    model = CostModel(smoothing=0.5)
+    assert model.estimate(stats) == sum(item_features(stats))
+    model.observe(stats, 4.0)
+    model.observe(stats, 2.0)
+    assert model.estimate(stats) == 3.0
+
+
+def test_fit_keeps_unobserved_weights():
+    model = CostModel((1, 1, 1, 1, 1, 3))
+    # 7 prior units took 10 seconds
+    model.observe(ParameterStats(inspect.signature(f)), 10.0)
+    model.fit()
+    assert model.weights[5] == pytest.approx(3 * 10 / 7)
+
+
+def test_prior_is_scaled_to_seconds():
+    stats = ParameterStats(inspect.signature(f))
+    case = arguments.TestCaseContainer.auto([arguments.TestPositional(1)], [])
+    model = CostModel()
+    assert model.estimate(case) == 2
+    model.observe(stats, 0.007)
+    # a case is 2 of the 7 units the timed stats took
+    assert model.estimate(case) == pytest.approx(0.002)
+    assert model.estimate(stats) == 0.007
+
+
+def test_fit_with_identical_features():
+    stats = ParameterStats(inspect.signature(f))
+    model = CostModel()
+    for seconds in (1.0, 2.0, 3.0):
+        model.observe(stats, seconds)
+    model.fit()
+    assert model.estimate(stats) > 0
+    with pytest.raises(TypeError):
+        CostModel(ridge=0)
+
+
+def test_fit_clamps_negative_weights():
+    model = CostModel()
+    # more parameters of each kind made items faster
+    for skeleton in build_skeleton_signatures(
+        positional_only=(3, 6), positional_or_keyword=(3, 6), keyword_only=(3, 6),
+        rle=True
+    ):
+        _, po, pk, ko, var, _ = item_features(skeleton)
+        model.observe(skeleton, 100.0 - po - pk - ko - var)
+    model.fit()
+    assert all(w >= 0 for w in model.weights)
+    assert model.weights[0] > 0
+
+
+def test_list_schedule_streams():
+    random.seed(0)
+    costs = [random.choice([1, 1, 1, 200]) for _ in range(64)]
+    consumed = []
+    assigned = list_schedule(iter(costs), 4, cost=lambda c: consumed.append(c) or c)
+    first = next(assigned)
+    assert first == (0, costs[0]) and consumed == costs[:1]
+
+    loads = [0] * 4
+    for w, c in [first, *assigned]:
+        loads[w] += c
+    # within a factor of 2 of a perfect split
+    assert max(loads) <= 2 * sum(costs) / 4
+    assert list(list_schedule(costs, 4, cost=float)) \
+        == list(list_schedule(costs, 4, cost=float))
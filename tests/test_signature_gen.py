@@ -1,19 +1,33 @@
 import pytest
+import gc
+import random
 from unittest.mock import Mock
+from function_test_fixtures import signature_gen
 from function_test_fixtures.constants_and_types import ParameterKind
 from function_test_fixtures.signature_gen import (
     ParameterFlag,
-    BareParameter,
-    build_skeleton_signatures
+    make_proto_parameter,
+    is_optional,
+    build_skeleton_signatures,
+    flag_permutations,
+    RLESkeleton,
+    ParameterRun,
+    MaskedParameterRun,
+    SkeletonInterner,
+    SignatureView,
+    make_signature,
+    skeleton_count,
+    skeleton_from_shape,
+    skeleton_shape
 )
 
 
-def test_bare_parameter_equality():
-    x1 = BareParameter(
+def test_proto_parameter_equality():
+    x1 = make_proto_parameter(
         kind=ParameterKind.POSITIONAL_ONLY,
         default=False
     )
-    x2 = BareParameter(
+    x2 = make_proto_parameter(
         kind=ParameterKind.POSITIONAL_ONLY,
         default=False
     )
@@ -30,10 +44,10 @@ class TestStaticCount:
         ))
 
         assert xs == [(
-            BareParameter(no_optional_flag[1], False),
-            BareParameter(no_optional_flag[1], False),
-            BareParameter(no_optional_flag[1], False),
-            BareParameter(no_optional_flag[1], False)
+            make_proto_parameter(no_optional_flag[1], False),
+            make_proto_parameter(no_optional_flag[1], False),
+            make_proto_parameter(no_optional_flag[1], False),
+            make_proto_parameter(no_optional_flag[1], False)
         )]
 
     def test_some_optional_head(self, some_optional_flag_map):
@@ -44,11 +58,11 @@ class TestStaticCount:
             flag=some_optional_flag_map[0]
         ))
 
-        bare_w_optional = BareParameter(
+        bare_w_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=True
         )
-        bare_wo_optional = BareParameter(
+        bare_wo_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=False
         )
@@ -65,7 +79,7 @@ class TestStaticCount:
             flag=some_optional_flag_map[0]
         ))
 
-        bare_w_optional = BareParameter(
+        bare_w_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=True
         )
@@ -85,7 +99,7 @@ class TestStaticCount:
             for _ in range(30)
         ]
         d = {
-            tuple((1 if a.default else 0) for a in x) for x in xs
+            tuple((1 if is_optional(a) else 0) for a in x) for x in xs
         }
         assert len(d) > 1
 
@@ -100,7 +114,7 @@ class TestStaticCount:
             for _ in range(30)
         ]
         bounded = (
-            0 < sum(1 for a in x if a.default) < 16 for x in xs
+            0 < sum(1 for a in x if is_optional(a)) < 16 for x in xs
         )
         assert all(iter(bounded))
 
@@ -115,7 +129,7 @@ class TestStaticCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default) for x in xs
+            sum(1 for a in x if is_optional(a)) for x in xs
         }
         assert len(counts) > 1
 
@@ -130,7 +144,7 @@ class TestStaticCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default)
+            sum(1 for a in x if is_optional(a))
             for x in xs
         }
         assert all(iter(0 < a < 30 for a in counts))
@@ -146,7 +160,7 @@ class TestStaticCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default)
+            sum(1 for a in x if is_optional(a))
             for x in xs
         }
         assert len(set(counts)) > 1
@@ -160,10 +174,10 @@ class TestStaticCount:
         ))
 
         assert xs == [(
-            BareParameter(all_optional_flag[1], True),
-            BareParameter(all_optional_flag[1], True),
-            BareParameter(all_optional_flag[1], True),
-            BareParameter(all_optional_flag[1], True)
+            make_proto_parameter(all_optional_flag[1], True),
+            make_proto_parameter(all_optional_flag[1], True),
+            make_proto_parameter(all_optional_flag[1], True),
+            make_proto_parameter(all_optional_flag[1], True)
         )]
 
 
@@ -199,7 +213,7 @@ class TestRandrangeCount:
             positional_or_keyword=(3,30),
             flag=no_optional_flag[0]
         ))
-        assert set(xs[0]) == {BareParameter(no_optional_flag[1], False)}
+        assert set(xs[0]) == {make_proto_parameter(no_optional_flag[1], False)}
 
     def test_some_optional_head(self, some_optional_flag_map):
         xs = list(build_skeleton_signatures(
@@ -209,11 +223,11 @@ class TestRandrangeCount:
             flag=some_optional_flag_map[0]
         ))
 
-        bare_w_optional = BareParameter(
+        bare_w_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=True
         )
-        bare_wo_optional = BareParameter(
+        bare_wo_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=False
         )
@@ -230,7 +244,7 @@ class TestRandrangeCount:
             flag=some_optional_flag_map[0]
         ))
 
-        bare_w_optional = BareParameter(
+        bare_w_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=True
         )
@@ -250,7 +264,7 @@ class TestRandrangeCount:
             for _ in range(30)
         ]
         bounded = (
-            0 < sum(1 for a in x if a.default) < len(x) for x in xs
+            0 < sum(1 for a in x if is_optional(a)) < len(x) for x in xs
         )
         assert all(iter(bounded))
 
@@ -265,7 +279,7 @@ class TestRandrangeCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default) for x in xs
+            sum(1 for a in x if is_optional(a)) for x in xs
         }
         assert len(counts) > 1
 
@@ -280,7 +294,7 @@ class TestRandrangeCount:
             for _ in range(30)
         ]
         d = {
-            tuple((1 if a.default else 0) for a in x) for x in xs
+            tuple((1 if is_optional(a) else 0) for a in x) for x in xs
         }
         assert len(d) > 1
 
@@ -295,7 +309,7 @@ class TestRandrangeCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default)
+            sum(1 for a in x if is_optional(a))
             for x in xs
         }
         assert all(iter(0 < a < 30 for a in counts))
@@ -311,7 +325,7 @@ class TestRandrangeCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default)
+            sum(1 for a in x if is_optional(a))
             for x in xs
         }
         assert len(counts) > 1
@@ -324,7 +338,7 @@ class TestRandrangeCount:
             flag=all_optional_flag[0]
         ))
 
-        assert set(xs[0]) == {BareParameter(all_optional_flag[1], True)}
+        assert set(xs[0]) == {make_proto_parameter(all_optional_flag[1], True)}
 
 
 class TestCallableCount:
@@ -401,9 +415,9 @@ class TestCallableCount:
             flag=no_optional_flag[0]
         ))
         assert xs[0] == (
-            BareParameter(no_optional_flag[1], False),
-            BareParameter(no_optional_flag[1], False),
-            BareParameter(no_optional_flag[1], False),
+            make_proto_parameter(no_optional_flag[1], False),
+            make_proto_parameter(no_optional_flag[1], False),
+            make_proto_parameter(no_optional_flag[1], False),
         )
 
     def test_some_optional_head(self, some_optional_flag_map):
@@ -416,11 +430,11 @@ class TestCallableCount:
             flag=some_optional_flag_map[0]
         ))
 
-        bare_w_optional = BareParameter(
+        bare_w_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=True
         )
-        bare_wo_optional = BareParameter(
+        bare_wo_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=False
         )
@@ -439,7 +453,7 @@ class TestCallableCount:
             flag=some_optional_flag_map[0]
         ))
 
-        bare_w_optional = BareParameter(
+        bare_w_optional = make_proto_parameter(
             kind=some_optional_flag_map[1],
             default=True
         )
@@ -461,7 +475,7 @@ class TestCallableCount:
             for _ in range(30)
         ]
         bounded = (
-            0 < sum(1 for a in x if a.default) < len(x) for x in xs
+            0 < sum(1 for a in x if is_optional(a)) < len(x) for x in xs
         )
         assert all(iter(bounded))
 
@@ -478,7 +492,7 @@ class TestCallableCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default) for x in xs
+            sum(1 for a in x if is_optional(a)) for x in xs
         }
         assert len(counts) > 1
 
@@ -495,7 +509,7 @@ class TestCallableCount:
             for _ in range(30)
         ]
         d = {
-            tuple((1 if a.default else 0) for a in x) for x in xs
+            tuple((1 if is_optional(a) else 0) for a in x) for x in xs
         }
         assert len(d) > 1
 
@@ -512,7 +526,7 @@ class TestCallableCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default)
+            sum(1 for a in x if is_optional(a))
             for x in xs
         }
         assert all(iter(0 < a < 30 for a in counts))
@@ -530,7 +544,7 @@ class TestCallableCount:
             for _ in range(30)
         ]
         counts = {
-            sum(1 for a in x if a.default)
+            sum(1 for a in x if is_optional(a))
             for x in xs
         }
         assert len(counts) > 1
@@ -546,9 +560,9 @@ class TestCallableCount:
         ))
 
         assert xs[0] == (
-            BareParameter(all_optional_flag[1], True),
-            BareParameter(all_optional_flag[1], True),
-            BareParameter(all_optional_flag[1], True),
+            make_proto_parameter(all_optional_flag[1], True),
+            make_proto_parameter(all_optional_flag[1], True),
+            make_proto_parameter(all_optional_flag[1], True),
         )
 
 
@@ -575,3 +589,206 @@ def test_all_flags_permuations():
     ))
 
     assert len(xs) == 192
+
+
+def test_skeleton_count(invalid_flags):
+    assert skeleton_count() == 192
+    flag = invalid_flags[0]
+    for f in invalid_flags[1:]:
+        flag |= f
+    assert skeleton_count(flag) == 0
+    assert skeleton_count(ParameterFlag(0)) == 0
+
+
+class TestRLE:
+    def test_yields_rle_skeletons(self):
+        xs = list(build_skeleton_signatures(
+            positional_only=4,
+            keyword_only=4,
+            positional_or_keyword=4,
+            rle=True
+        ))
+        assert len(xs) == 192
+        assert all(isinstance(x, RLESkeleton) for x in xs)
+
+    def test_skeleton_from_shape(self):
+        for x in build_skeleton_signatures(
+            positional_only=4,
+            keyword_only=4,
+            positional_or_keyword=4,
+            rle=True
+        ):
+            assert skeleton_from_shape(skeleton_shape(x)) == x
+
+    def test_expansion_matches_tuples(self):
+        kwargs = dict(
+            positional_only=(3, 40),
+            keyword_only=(3, 40),
+            positional_or_keyword=(3, 40)
+        )
+        random.seed(7)
+        xs = list(build_skeleton_signatures(**kwargs))
+        random.seed(7)
+        ys = list(build_skeleton_signatures(rle=True, **kwargs))
+
+        assert xs == [y.expand() for y in ys]
+        assert [len(x) for x in xs] == [len(y) for y in ys]
+
+    def test_parameter_run(self):
+        run = ParameterRun(ParameterKind.POSITIONAL_ONLY, 2, 1)
+        assert tuple(run) == (
+            make_proto_parameter(ParameterKind.POSITIONAL_ONLY, False),
+            make_proto_parameter(ParameterKind.POSITIONAL_ONLY, False),
+            make_proto_parameter(ParameterKind.POSITIONAL_ONLY, True),
+        )
+
+    def test_masked_parameter_run(self):
+        run = MaskedParameterRun(ParameterKind.KEYWORD_ONLY, 4, 0b0101)
+        assert tuple(is_optional(p) for p in run) == (True, False, True, False)
+
+    def test_wide_signature(self):
+        x = next(iter(build_skeleton_signatures(
+            positional_only=10_000,
+            keyword_only=10_000,
+            positional_or_keyword=10_000,
+            flag=ParameterFlag.KEYWORD_ONLY_SOME_OPTIONAL,
+            rle=True
+        )))
+        assert len(x) == 10_000
+        assert 0 < x.keyword_only.optional_mask.bit_count() < 10_000
+
+
+class TestInterning:
+    def test_proto_parameters_are_singletons(self):
+        xs = list(build_skeleton_signatures(
+            positional_only=4,
+            keyword_only=4,
+            positional_or_keyword=4
+        ))
+        protos = {id(p) for x in xs for p in x}
+        assert len(protos) == len({p for x in xs for p in x})
+
+    def test_equal_tuples_are_identical(self):
+        interner = SkeletonInterner()
+        xs = [
+            x
+            for _ in range(3)
+            for x in build_skeleton_signatures(
+                positional_only=4,
+                keyword_only=4,
+                positional_or_keyword=4,
+                flag=ParameterFlag.KEYWORD_ONLY_NO_OPTIONAL
+                | ParameterFlag.KEYWORD_ONLY_ALL_OPTIONAL,
+                interner=interner
+            )
+        ]
+        assert xs[0] is xs[2] is xs[4]
+        assert interner.hits == 4
+        assert interner.misses == 2
+
+    def test_equal_rle_skeletons_are_identical(self):
+        interner = SkeletonInterner()
+        kwargs = dict(
+            positional_only=4,
+            keyword_only=4,
+            positional_or_keyword=4,
+            flag=ParameterFlag.POSITIONAL_ONLY_NO_OPTIONAL,
+            rle=True,
+            interner=interner
+        )
+        x1 = next(iter(build_skeleton_signatures(**kwargs)))
+        x2 = next(iter(build_skeleton_signatures(**kwargs)))
+        assert x1 is x2
+
+    def test_tuple_table_is_bounded(self):
+        interner = SkeletonInterner(maxsize=3)
+        for n in range(10):
+            interner.intern((make_proto_parameter(ParameterKind.KEYWORD_ONLY, False),) * n)
+        assert len(interner) == 3
+
+    def test_rle_table_is_weak(self):
+        interner = SkeletonInterner()
+        x = next(iter(build_skeleton_signatures(
+            positional_only=4,
+            keyword_only=4,
+            positional_or_keyword=4,
+            flag=ParameterFlag.POSITIONAL_ONLY_NO_OPTIONAL,
+            rle=True,
+            interner=interner
+        )))
+        assert len(interner) == 1
+        del x
+        gc.collect()
+        assert len(interner) == 0
+
+
+class TestSignatureView:
+    def test_counts_without_building_signature(self):
+        x = next(iter(build_skeleton_signatures(
+            positional_only=3,
+            keyword_only=5,
+            positional_or_keyword=4,
+            flag=ParameterFlag.KEYWORD_ONLY_ALL_OPTIONAL,
+            rle=True
+        )))
+        view = SignatureView(x)
+        assert view.counters[ParameterKind.KEYWORD_ONLY] == 5
+        assert view.optional_counters[ParameterKind.KEYWORD_ONLY] == 5
+        assert len(view) == 5
+        assert 'signature' not in vars(view)
+
+    def test_signature_matches_skeleton(self):
+        for x in build_skeleton_signatures(
+            positional_only=3,
+            keyword_only=3,
+            positional_or_keyword=3
+        ):
+            view = SignatureView(x, default=0)
+            parameters = list(view.signature.parameters.values())
+            assert [p.name for p in parameters] == list(view.parameter_names)
+            assert [p.default is not p.empty for p in parameters] == [
+                is_optional(p) for p in x
+            ]
+            assert view.kinds == tuple(p.kind for p in x)
+
+    def test_signature_is_cached(self):
+        x = next(iter(build_skeleton_signatures(
+            positional_only=3,
+            keyword_only=3,
+            positional_or_keyword=3
+        )))
+        view = SignatureView(x)
+        assert view.signature is view.signature
+
+    def test_names_are_pooled(self):
+        xs = list(build_skeleton_signatures(
+            positional_only=3,
+            keyword_only=3,
+            positional_or_keyword=3,
+            flag=ParameterFlag.KEYWORD_ONLY_NO_OPTIONAL
+        ))
+        s1 = make_signature(xs[0])
+        s2 = make_signature(xs[0])
+        assert all(
+            a is b for a, b in zip(s1.parameters.keys(), s2.parameters.keys())
+        )
+
+    def test_validated_signature_matches(self, monkeypatch):
+        xs = list(build_skeleton_signatures(
+            positional_only=3,
+            keyword_only=3,
+            positional_or_keyword=3
+        ))
+        unvalidated = [make_signature(x, default=0) for x in xs]
+        # Pythons whose inspect.Signature cannot skip validation
+        monkeypatch.setattr(signature_gen, '_CAN_SKIP_VALIDATION', False)
+        assert [make_signature(x, default=0) for x in xs] == unvalidated
+
+
+def test_build_skeleton_signatures_start():
+    counts = dict(positional_only=3, positional_or_keyword=3, keyword_only=3)
+    every = [skeleton_shape(s) for s in build_skeleton_signatures(**counts)]
+    later = [skeleton_shape(s) for s in build_skeleton_signatures(start=100, **counts)]
+    assert len(list(flag_permutations())) == len(every) == skeleton_count()
+    # fixed counts draw nothing random except keyword only optional masks
+    assert [s[:6] for s in later] == [s[:6] for s in every[100:]]
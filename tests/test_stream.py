@@ -0,0 +1,53 @@
+import concurrent.futures
+import random
+
+import pytest
+
+from function_test_fixtures.serialize import case_record
+from function_test_fixtures.stream import FixtureStream
+
+
+def test_len_matches_iteration():
+    stream = FixtureStream(1, repeat=2)
+    assert len(stream) == len(list(stream))
+
+
+def test_getitem_matches_iteration():
+    stream = FixtureStream(1)
+    skeletons = list(FixtureStream(1))
+    for index in (5, 0, len(skeletons) - 1, 3):
+        assert stream[index] == skeletons[index]
+    with pytest.raises(IndexError):
+        stream[len(skeletons)]
+
+
+def test_cases_do_not_depend_on_order():
+    def tokens(stream, index):
+        return [repr(c.positional_arguments) for c in stream.test_cases(index)]
+
+    first = FixtureStream(2)
+    second = FixtureStream(2)
+    expected = [tokens(first, i) for i in range(6)]
+    assert [tokens(second, i) for i in reversed(range(6))] == expected[::-1]
+
+
+def records(stream, index):
+    return [case_record(index, c) for c in stream.test_cases(index)]
+
+
+def test_generation_leaves_global_state_alone():
+    expected = [records(FixtureStream(3), i) for i in range(6)]
+    for i in range(6):
+        # skeletons and cases neither read nor advance the global state
+        random.seed(i)
+        assert records(FixtureStream(3), i) == expected[i]
+        assert random.random() == random.Random(i).random()
+
+
+def test_threads_generate_the_same_cases():
+    stream = FixtureStream(4)
+    indices = list(range(0, len(stream), 3))
+    expected = [records(stream, i) for i in indices]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda i: records(FixtureStream(4), i), indices))
+    assert results == expected
@@ -0,0 +1,69 @@
+import inspect
+from function_test_fixtures.signature_gen import (
+    ParameterFlag,
+    build_skeleton_signatures,
+    is_optional
+)
+from function_test_fixtures.stubs import compile_stub, stub_cache_info
+from function_test_fixtures.constants_and_types import ParameterKind
+
+
+KIND_MAP = {
+    inspect.Parameter.POSITIONAL_ONLY: ParameterKind.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD: ParameterKind.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.VAR_POSITIONAL: ParameterKind.VAR_POSITIONAL,
+    inspect.Parameter.KEYWORD_ONLY: ParameterKind.KEYWORD_ONLY,
+    inspect.Parameter.VAR_KEYWORD: ParameterKind.VAR_KEYWORD,
+}
+
+
+def test_stub_signatures_match_skeletons():
+    for skeleton in build_skeleton_signatures(
+        positional_only=4,
+        keyword_only=4,
+        positional_or_keyword=4
+    ):
+        stub = compile_stub(skeleton)
+        parameters = list(inspect.signature(stub).parameters.values())
+        assert [KIND_MAP[p.kind] for p in parameters] == [p.kind for p in skeleton]
+        assert [p.default is not p.empty for p in parameters] == [
+            is_optional(p) for p in skeleton
+        ]
+
+
+def test_stub_binding():
+    skeleton = next(iter(build_skeleton_signatures(
+        positional_only=2,
+        keyword_only=1,
+        positional_or_keyword=2,
+        flag=ParameterFlag.POSITIONAL_ONLY_NO_OPTIONAL | ParameterFlag.VAR_KEYWORD
+    )))
+    stub = compile_stub(skeleton)
+    assert stub(1, 2) == (1, 2, {})
+    assert stub(1, 2, x=3) == (1, 2, {'x': 3})
+
+
+def test_stubs_share_code():
+    skeletons = list(build_skeleton_signatures(
+        positional_only=3,
+        keyword_only=3,
+        positional_or_keyword=3
+    ))
+    s1 = [compile_stub(s, name=f"f{n}") for n, s in enumerate(skeletons)]
+    before = stub_cache_info().hits
+    s2 = [compile_stub(s, default=0) for s in skeletons]
+    assert stub_cache_info().hits - before == len(skeletons)
+    assert all(a.__code__ is b.__code__ for a, b in zip(s1, s2))
+    assert all(a is not b for a, b in zip(s1, s2))
+    assert s1[1].__name__ == "f1"
+
+
+def test_stub_defaults():
+    skeleton = next(iter(build_skeleton_signatures(
+        positional_only=0,
+        keyword_only=2,
+        positional_or_keyword=2,
+        flag=ParameterFlag.POSITIONAL_OR_KEYWORD_ALL_OPTIONAL
+    )))
+    stub = compile_stub(skeleton, default="d")
+    assert stub() == ("d", "d")
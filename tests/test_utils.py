@@ -216,3 +216,79 @@ def test_test_high_range_stop_wide_tail():
 def test_test_high_range_stop_wide_head():
     r = utils.test_high_range(23)
     assert 0 < r[0] < 23
+
+
+def test_bit_indices():
+    assert utils.bit_indices(0b101100) == [2, 3, 5]
+
+
+def test_bit_indices_zero():
+    assert utils.bit_indices(0) == []
+
+
+def test_mask_from_indices():
+    assert utils.mask_from_indices([2, 3, 5], 6) == 0b101100
+
+
+@pytest.mark.parametrize("n,k", [(0, 0), (1, 1), (10, 0), (10, 3), (10, 7),
+                                 (1000, 5), (1000, 480), (1000, 999), (5000, 1200)])
+def test_random_bitmask_popcount(n, k):
+    mask = utils.random_bitmask(n, k)
+    assert mask.bit_count() == k
+    assert mask.bit_length() <= n
+
+
+def test_random_bitmask_variance():
+    assert len({utils.random_bitmask(40, 20) for _ in range(30)}) > 1
+
+
+def test_random_bitmask_invalid_k():
+    with pytest.raises(TypeError):
+        utils.random_bitmask(4, 5)
+
+
+def test_deposit_bits():
+    assert utils.deposit_bits(0b101, 0b11010) == 0b10010
+
+
+def test_random_submask():
+    mask = 0b1011011001
+    for k in range(mask.bit_count() + 1):
+        sub = utils.random_submask(mask, k)
+        assert sub.bit_count() == k
+        assert sub & ~mask == 0
+
+
+def test_test_stratified_range_bounds():
+    r = utils.test_stratified_range(13, 400, 10)
+    assert r[0] == 13 and r[-1] == 400
+
+
+def test_test_stratified_range_sorted_unique():
+    r = utils.test_stratified_range(0, 1000, 25)
+    assert list(r) == sorted(set(r))
+
+
+def test_test_stratified_range_one_per_stratum():
+    r = utils.test_stratified_range(0, 999, 10)
+    interior = [x for x in r[1:-1]]
+    assert {x // 100 for x in interior} >= {n for n in range(1, 9)}
+    assert len(r) <= 12
+
+
+def test_test_stratified_range_narrow():
+    assert utils.test_stratified_range(4, 7, 10) == (4, 5, 6, 7)
+
+
+def test_test_stratified_range_single():
+    assert utils.test_stratified_range(5, 5, 3) == (5,)
+
+
+def test_test_stratified_range_invalid_k():
+    with pytest.raises(TypeError):
+        utils.test_stratified_range(0, 10, 0)
+
+
+def test_test_stratified_range_reversed():
+    with pytest.raises(TypeError):
+        utils.test_stratified_range(10, 0, 3)